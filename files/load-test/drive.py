@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Driver of the load tests: sends GitLab merge request webhooks to packit-service
+at the target rate and reports the throughput, the depth of the Celery queues
+and the latency of the processing of the events.
+
+Every webhook is about a new commit of a new merge request (the iid is
+the sequence number of the webhook, the commit SHA is derived from it,
+see `simulator.py`), so every one of them leads to new statuses, builds
+and test runs.
+
+The latency of the first commit status is measured from the time the webhook
+was sent to the time the simulated GitLab received the status. The latency
+percentiles of the other stages of the processing come from the ledger of
+the service (`/api/latency`).
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from os import getenv
+from threading import Event, Thread
+from typing import Dict, List, Optional
+
+import click
+import redis
+import requests
+
+from packit_service.models import AllowlistModel, AllowlistStatus
+
+QUEUES = ("short-running", "long-running")
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """Percentile of the sorted values (nearest rank)."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def format_seconds(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}s"
+
+
+def merge_request_webhook(simulator_url: str, iid: int) -> dict:
+    project = {
+        "id": 1,
+        "name": "hello-world",
+        "web_url": f"{simulator_url}/packit/hello-world",
+        "path_with_namespace": "packit/hello-world",
+        "default_branch": "main",
+    }
+    return {
+        "object_kind": "merge_request",
+        "event_type": "merge_request",
+        "user": {"username": "packit"},
+        "project": project,
+        "object_attributes": {
+            "id": iid,
+            "iid": iid,
+            "action": "open",
+            "state": "opened",
+            "title": "Load test",
+            "description": "",
+            "source_branch": f"load-test-{iid}",
+            "target_branch": "main",
+            "source_project_id": 1,
+            "target_project_id": 1,
+            "source": project,
+            "target": project,
+            "last_commit": {"id": f"{iid:040x}"},
+            "url": f"{simulator_url}/packit/hello-world/-/merge_requests/{iid}",
+        },
+    }
+
+
+class QueueSampler(Thread):
+    """Samples the number of the messages waiting in the Celery queues."""
+
+    def __init__(self, interval: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.redis = redis.Redis(
+            host=getenv("REDIS_SERVICE_HOST", "redis"),
+            port=int(getenv("REDIS_SERVICE_PORT", "6379")),
+            db=int(getenv("REDIS_SERVICE_DB", "0")),
+            password=getenv("REDIS_PASSWORD") or None,
+        )
+        self.samples: Dict[str, List[int]] = {queue: [] for queue in QUEUES}
+        self.stopped = Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            for queue in QUEUES:
+                self.samples[queue].append(self.redis.llen(queue))
+
+
+@click.command()
+@click.option(
+    "--service-url",
+    default="http://service:8080",
+    show_default=True,
+    help="URL of packit-service API.",
+)
+@click.option(
+    "--simulator-url",
+    default="http://simulator:8080",
+    show_default=True,
+    help="URL the service reaches the simulator at.",
+)
+@click.option(
+    "--rate", default=1.0, show_default=True, help="Webhooks sent per second."
+)
+@click.option(
+    "--duration",
+    default=60.0,
+    show_default=True,
+    help="For how long the webhooks are sent in seconds.",
+)
+@click.option(
+    "--drain-timeout",
+    default=300.0,
+    show_default=True,
+    help="How long to wait for the statuses of the sent webhooks in seconds.",
+)
+@click.option(
+    "--first-iid",
+    default=int(time.time()),
+    show_default="current timestamp",
+    type=int,
+    help="Merge request iid of the first webhook, later ones are incremented.",
+)
+@click.option(
+    "--senders",
+    default=16,
+    show_default=True,
+    help="Number of threads sending the webhooks.",
+)
+def drive(
+    service_url,
+    simulator_url,
+    rate,
+    duration,
+    drain_timeout,
+    first_iid,
+    senders,
+):
+    """
+    Send merge request webhooks to packit-service and report how it coped.
+    """
+    AllowlistModel.add_namespace(
+        f"{simulator_url.split('://')[1]}/packit",
+        AllowlistStatus.approved_manually.value,
+    )
+
+    sent: Dict[str, float] = {}
+    failed = 0
+
+    def send(iid: int):
+        nonlocal failed
+        sent_at = time.time()
+        response = requests.post(
+            f"{service_url}/api/webhooks/gitlab",
+            json=merge_request_webhook(simulator_url, iid),
+            headers={"X-Gitlab-Event": "Merge Request Hook"},
+            timeout=60,
+        )
+        if response.ok:
+            sent[f"{iid:040x}"] = sent_at
+        else:
+            failed += 1
+
+    sampler = QueueSampler(interval=1.0)
+    sampler.start()
+    # the ledger stores the times in UTC without the timezone
+    started = datetime.now(timezone.utc).replace(tzinfo=None)
+    start = time.time()
+    total = int(rate * duration)
+    with ThreadPoolExecutor(max_workers=senders) as executor:
+        for i in range(total):
+            # keep the rate even if the sending is late
+            if (delay := start + i / rate - time.time()) > 0:
+                time.sleep(delay)
+            executor.submit(send, first_iid + i)
+    send_duration = time.time() - start
+
+    deadline = time.time() + drain_timeout
+    while True:
+        first_statuses = requests.get(f"{simulator_url}/_stats", timeout=60).json()[
+            "first_statuses"
+        ]
+        if all(sha in first_statuses for sha in sent) or time.time() > deadline:
+            break
+        time.sleep(5)
+    sampler.stopped.set()
+
+    processed = {sha: first_statuses[sha] for sha in sent if sha in first_statuses}
+    latencies = sorted(processed[sha] - sent[sha] for sha in processed)
+    click.echo(
+        f"Sent {len(sent)} webhooks ({failed} failed) in {send_duration:.1f}s: "
+        f"{len(sent) / send_duration:.2f} webhooks/s (target {rate:.2f}/s)."
+    )
+    if processed:
+        processing_duration = max(processed.values()) - start
+        click.echo(
+            f"First statuses set for {len(processed)} of them "
+            f"in {processing_duration:.1f}s: "
+            f"{len(processed) / processing_duration:.2f} events/s."
+        )
+
+    click.echo("\nQueue depth:")
+    for queue, samples in sampler.samples.items():
+        if samples:
+            click.echo(
+                f"  {queue:<15} max {max(samples):>6} "
+                f"mean {sum(samples) / len(samples):>8.1f} last {samples[-1]:>6}"
+            )
+
+    click.echo("\nLatency (p50/p90/p99):")
+    click.echo(
+        f"  {'first status':<15} "
+        + " / ".join(format_seconds(percentile(latencies, p)) for p in (0.5, 0.9, 0.99))
+    )
+    stages = requests.get(
+        f"{service_url}/api/latency", params={"from": started.isoformat()}, timeout=60
+    ).json()
+    for stage, values in stages.items():
+        click.echo(
+            f"  {stage:<15} "
+            + " / ".join(format_seconds(values.get(p)) for p in ("p50", "p90", "p99"))
+            + f" ({values['count']} events)"
+        )
+
+
+if __name__ == "__main__":
+    drive()
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Simulator of the services packit-service talks to, for the load tests.
+
+One HTTP server plays:
+* GitLab (`/api/v4/...`): serves one project (for any path) with a packit config
+  and the FMF metadata, accepts commit statuses and comments,
+* Copr (`/api_3/...`): creates projects and builds, the builds "run" for the
+  configured time and their start/end messages are sent to the workers
+  the same way packit-service-fedmsg does it,
+* Testing Farm (`/testing-farm/...`): accepts test requests and notifies
+  the service about their results after the configured time.
+
+Every request (but `/_stats`) is delayed by the configured latency (and jitter)
+and fails with the configured probability, so that slow and flaky services
+can be simulated.
+
+The times the first commit statuses were set are exposed at `/_stats`,
+see `drive.py`.
+"""
+
+import base64
+import heapq
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import count
+from typing import Callable, Dict, List
+
+import click
+import requests
+from flask import Flask, abort, jsonify, request
+from werkzeug.exceptions import HTTPException
+
+from packit_service.celerizer import celery_app
+from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME
+
+logger = logging.getLogger("simulator")
+
+PROJECT_ID = 1
+PACKIT_YAML = """\
+specfile_path: hello.spec
+jobs:
+- job: copr_build
+  trigger: pull_request
+  targets: {targets}
+- job: tests
+  trigger: pull_request
+  targets: {targets}
+"""
+FILES = {
+    ".packit.yaml": None,  # rendered from PACKIT_YAML
+    "hello.spec": "Name: hello\nVersion: 0.1\nRelease: 1%{?dist}\n",
+    ".fmf/version": "1\n",
+}
+# the latest Fedora stable release is looked up in Bodhi and has to be available
+MOCK_CHROOTS = [
+    f"fedora-{release}-{arch}"
+    for release in ["rawhide", *range(30, 61)]
+    for arch in ("x86_64", "aarch64")
+]
+
+COPR_BUILD_START = "org.fedoraproject.prod.copr.build.start"
+COPR_BUILD_END = "org.fedoraproject.prod.copr.build.end"
+
+
+class Scheduler:
+    """Calls the functions at the given times in a pool of threads."""
+
+    def __init__(self, threads: int = 8):
+        self._queue: List = []
+        self._ids = count()
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=threads)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def call_later(self, delay: float, func: Callable, *args):
+        with self._condition:
+            heapq.heappush(
+                self._queue, (time.time() + delay, next(self._ids), func, args)
+            )
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue or self._queue[0][0] > time.time():
+                    self._condition.wait(
+                        self._queue[0][0] - time.time() if self._queue else None
+                    )
+                _, _, func, args = heapq.heappop(self._queue)
+            self._executor.submit(self._call, func, args)
+
+    @staticmethod
+    def _call(func: Callable, args: tuple):
+        try:
+            func(*args)
+        except Exception as ex:
+            logger.warning(f"{func.__name__}{args} failed: {ex!r}")
+
+
+class Simulator:
+    def __init__(
+        self,
+        url: str,
+        service_url: str,
+        testing_farm_secret: str,
+        targets: List[str],
+        srpm_build_duration: float,
+        copr_build_duration: float,
+        tests_duration: float,
+    ):
+        self.url = url
+        self.service_url = service_url
+        self.testing_farm_secret = testing_farm_secret
+        self.targets = targets
+        self.srpm_build_duration = srpm_build_duration
+        self.copr_build_duration = copr_build_duration
+        self.tests_duration = tests_duration
+
+        self.scheduler = Scheduler()
+        self.lock = threading.Lock()
+        self.ids = count(1)
+        self.projects: Dict[str, dict] = {}
+        self.builds: Dict[int, dict] = {}
+        self.test_requests: Dict[str, dict] = {}
+        # time the first commit status was set for the commit
+        self.first_statuses: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+
+    def count(self, name: str):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    # GitLab
+
+    def gitlab_project(self) -> dict:
+        web_url = f"{self.url}/packit/hello-world"
+        return {
+            "id": PROJECT_ID,
+            "name": "hello-world",
+            "path": "hello-world",
+            "path_with_namespace": "packit/hello-world",
+            "namespace": {"full_path": "packit"},
+            "description": "",
+            "visibility": "public",
+            "default_branch": "main",
+            "web_url": web_url,
+            "http_url_to_repo": f"{web_url}.git",
+            "ssh_url_to_repo": f"{web_url}.git",
+        }
+
+    def gitlab_file(self, path: str, ref: str) -> dict:
+        if path not in FILES:
+            abort(404)
+        content = FILES[path] or PACKIT_YAML.format(targets=self.targets)
+        return {
+            "file_name": path.rsplit("/", 1)[-1],
+            "file_path": path,
+            "ref": ref,
+            "encoding": "base64",
+            "content": base64.b64encode(content.encode()).decode(),
+        }
+
+    def gitlab_merge_request(self, iid: int) -> dict:
+        return {
+            "id": iid,
+            "iid": iid,
+            "project_id": PROJECT_ID,
+            "source_project_id": PROJECT_ID,
+            "target_project_id": PROJECT_ID,
+            "title": "Load test",
+            "description": "",
+            "state": "opened",
+            "author": {"username": "packit"},
+            "source_branch": f"load-test-{iid}",
+            "target_branch": "main",
+            # see `drive.py`
+            "sha": f"{iid:040x}",
+            "web_url": f"{self.url}/packit/hello-world/-/merge_requests/{iid}",
+            "labels": [],
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def set_commit_status(self, sha: str) -> dict:
+        now = time.time()
+        with self.lock:
+            self.first_statuses.setdefault(sha, now)
+        self.count("gitlab.statuses")
+        return {
+            "id": next(self.ids),
+            "sha": sha,
+            "status": request.json.get("state"),
+            "name": request.json.get("context"),
+            "description": request.json.get("description"),
+            "target_url": request.json.get("target_url"),
+            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+        }
+
+    # Copr
+
+    def copr_project(self, owner: str, name: str, chroots: List[str]) -> dict:
+        return {
+            "id": next(self.ids),
+            "name": name,
+            "ownername": owner,
+            "full_name": f"{owner}/{name}",
+            "chroot_repos": {
+                chroot: f"{self.url}/results/{owner}/{name}/{chroot}/"
+                for chroot in chroots
+            },
+            "additional_repos": [],
+            "description": "",
+            "instructions": "",
+            "unlisted_on_hp": True,
+            "delete_after_days": 60,
+            "module_hotfixes": False,
+            "persistent": False,
+        }
+
+    def copr_build(self, owner: str, project: str, chroots: List[str]) -> dict:
+        build_id = next(self.ids)
+        build = {
+            "id": build_id,
+            "ownername": owner,
+            "projectname": project,
+            "chroots": chroots,
+            "state": "pending",
+            "submitted_on": int(time.time()),
+            "source_package": {
+                "name": "hello",
+                "version": "0.1-1",
+                "url": f"{self.url}/results/{build_id}/hello-0.1-1.src.rpm",
+            },
+            "ended_on": {},
+        }
+        with self.lock:
+            self.builds[build_id] = build
+
+        self.scheduler.call_later(0, self.copr_message, build_id, "srpm-builds", False)
+        self.scheduler.call_later(
+            self.srpm_build_duration, self.copr_message, build_id, "srpm-builds", True
+        )
+        for chroot in chroots:
+            self.scheduler.call_later(
+                self.srpm_build_duration, self.copr_message, build_id, chroot, False
+            )
+            self.scheduler.call_later(
+                self.srpm_build_duration + self.copr_build_duration,
+                self.copr_message,
+                build_id,
+                chroot,
+                True,
+            )
+        return build
+
+    def copr_message(self, build_id: int, chroot: str, ended: bool):
+        build = self.builds[build_id]
+        if ended:
+            build["ended_on"][chroot] = int(time.time())
+        status = 1 if ended else 3
+        event = {
+            "topic": COPR_BUILD_END if ended else COPR_BUILD_START,
+            "build": build_id,
+            "chroot": chroot,
+            "status": status,
+            "owner": build["ownername"],
+            "copr": build["projectname"],
+            "pkg": "hello",
+            "version": "0.1-1",
+            "user": build["ownername"],
+            "what": f"build {'end' if ended else 'start'}: build:{build_id} "
+            f"chroot:{chroot} status:{status}",
+            "timestamp": time.time(),
+        }
+        celery_app.send_task(
+            name=CELERY_DEFAULT_MAIN_TASK_NAME, kwargs={"event": event}
+        )
+        self.count("copr.messages")
+
+    def copr_build_chroot(self, build_id: int, chroot: str) -> dict:
+        build = self.builds.get(build_id) or abort(404)
+        ended_on = build["ended_on"].get(chroot)
+        return {
+            "name": chroot,
+            "state": "succeeded" if ended_on else "running",
+            "started_on": build["submitted_on"],
+            "ended_on": ended_on,
+            "result_url": f"{self.url}/results/{build_id}/{chroot}/",
+        }
+
+    # Testing Farm
+
+    def test_request(self, payload: dict) -> dict:
+        request_id = f"{next(self.ids):08x}-0000-0000-0000-000000000000"
+        created = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f")
+        test_request = {
+            "id": request_id,
+            "test": payload.get("test"),
+            "state": "queued",
+            "environments_requested": payload.get("environments"),
+            "notes": [],
+            "result": None,
+            "run": None,
+            "created": created,
+            "updated": created,
+        }
+        with self.lock:
+            self.test_requests[request_id] = test_request
+        self.scheduler.call_later(self.tests_duration, self.test_finished, request_id)
+        return test_request
+
+    def test_finished(self, request_id: str):
+        test_request = self.test_requests[request_id]
+        test_request.update(
+            state="complete",
+            result={"overall": "passed", "summary": None, "xunit": None},
+            run={"artifacts": f"{self.url}/artifacts/{request_id}"},
+            updated=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S.%f"),
+        )
+        requests.post(
+            f"{self.service_url}/api/testing-farm/results",
+            json={
+                "request_id": request_id,
+                "token": self.testing_farm_secret,
+                "source": "testing-farm",
+            },
+            timeout=30,
+        )
+        self.count("testing-farm.notifications")
+
+
+def create_app(
+    simulator: Simulator, latency: float, jitter: float, error_rate: float
+) -> Flask:
+    app = Flask("simulator")
+
+    @app.before_request
+    def simulate_faults():
+        if request.path == "/_stats":
+            return
+        simulator.count(f"requests.{request.method} {request.url_rule}")
+        time.sleep(latency + random.uniform(0, jitter))
+        if random.random() < error_rate:
+            simulator.count("errors")
+            abort(503)
+
+    @app.errorhandler(HTTPException)
+    def error(ex):
+        # Copr client requires the errors in JSON
+        return jsonify(error=ex.description, message=ex.description), ex.code
+
+    @app.route("/_stats")
+    def stats():
+        with simulator.lock:
+            return jsonify(
+                first_statuses=dict(simulator.first_statuses),
+                counters=dict(simulator.counters),
+            )
+
+    # GitLab
+
+    @app.route("/api/v4/user")
+    def gitlab_user():
+        return jsonify(id=1, username="packit", name="Packit")
+
+    @app.route("/api/v4/projects/<int:project_id>")
+    @app.route("/api/v4/projects/<path:project_path>")
+    def gitlab_project(**kwargs):
+        return jsonify(simulator.gitlab_project())
+
+    @app.route("/api/v4/projects/<int:project_id>/repository/files/<path:path>")
+    def gitlab_file(project_id, path):
+        return jsonify(simulator.gitlab_file(path, request.args.get("ref", "main")))
+
+    @app.route("/api/v4/projects/<int:project_id>/repository/tree")
+    def gitlab_tree(project_id):
+        return jsonify(
+            [
+                {"id": str(i), "name": path, "type": "blob", "path": path}
+                for i, path in enumerate(FILES)
+            ]
+        )
+
+    @app.route("/api/v4/projects/<int:project_id>/repository/commits/<sha>")
+    def gitlab_commit(project_id, sha):
+        return jsonify(id=sha, short_id=sha[:8], title="Load test")
+
+    @app.route("/api/v4/projects/<int:project_id>/merge_requests/<int:iid>")
+    def gitlab_merge_request(project_id, iid):
+        return jsonify(simulator.gitlab_merge_request(iid))
+
+    @app.route("/api/v4/projects/<int:project_id>/members/all")
+    def gitlab_members(project_id):
+        return jsonify([{"id": 1, "username": "packit", "access_level": 40}])
+
+    @app.route("/api/v4/projects/<int:project_id>/statuses/<sha>", methods=["POST"])
+    def gitlab_commit_status(project_id, sha):
+        return jsonify(simulator.set_commit_status(sha)), 201
+
+    @app.route(
+        "/api/v4/projects/<int:project_id>/repository/commits/<sha>/comments",
+        methods=["POST"],
+    )
+    @app.route(
+        "/api/v4/projects/<int:project_id>/merge_requests/<int:iid>/notes",
+        methods=["POST"],
+    )
+    def gitlab_comment(**kwargs):
+        # commit comments have `note`, merge request notes `body`
+        body = request.json.get("note") or request.json.get("body")
+        now = datetime.now(timezone.utc).isoformat()
+        return (
+            jsonify(
+                id=next(simulator.ids),
+                body=body,
+                note=body,
+                author={"username": "packit"},
+                created_at=now,
+                updated_at=now,
+            ),
+            201,
+        )
+
+    # Copr
+
+    @app.route("/api_3/mock-chroots/list")
+    def copr_mock_chroots():
+        return jsonify({chroot: "" for chroot in MOCK_CHROOTS})
+
+    @app.route("/api_3/project")
+    def copr_project():
+        key = f"{request.args['ownername']}/{request.args['projectname']}"
+        return jsonify(simulator.projects.get(key) or abort(404))
+
+    @app.route("/api_3/project/add/<owner>", methods=["POST"])
+    @app.route("/api_3/project/edit/<owner>/<name>", methods=["POST"])
+    def copr_project_add_or_edit(owner, name=None):
+        data = request.get_json(silent=True) or request.form
+        name = name or data["name"]
+        chroots = data.get("chroots") or list(
+            simulator.projects.get(f"{owner}/{name}", {}).get("chroot_repos", [])
+        )
+        project = simulator.copr_project(owner, name, chroots)
+        with simulator.lock:
+            simulator.projects[f"{owner}/{name}"] = project
+        return jsonify(project)
+
+    @app.route("/api_3/build/create/custom", methods=["POST"])
+    def copr_build_create():
+        data = request.get_json(silent=True) or request.form
+        return jsonify(
+            simulator.copr_build(
+                data["ownername"], data["projectname"], data.get("chroots") or []
+            )
+        )
+
+    @app.route("/api_3/build/<int:build_id>")
+    def copr_build(build_id):
+        return jsonify(simulator.builds.get(build_id) or abort(404))
+
+    @app.route("/api_3/build-chroot")
+    def copr_build_chroot():
+        return jsonify(
+            simulator.copr_build_chroot(
+                int(request.args["build_id"]), request.args["chrootname"]
+            )
+        )
+
+    @app.route("/api_3/build/built-packages/<int:build_id>")
+    def copr_built_packages(build_id):
+        build = simulator.builds.get(build_id) or abort(404)
+        package = {
+            "name": "hello",
+            "epoch": 0,
+            "version": "0.1",
+            "release": "1",
+            "arch": "x86_64",
+        }
+        return jsonify({chroot: {"packages": [package]} for chroot in build["chroots"]})
+
+    # Testing Farm
+
+    @app.route("/testing-farm/composes/<kind>")
+    def testing_farm_composes(kind):
+        return jsonify(
+            composes=[{"name": "Fedora-Rawhide"}]
+            + [{"name": f"Fedora-{release}"} for release in range(30, 61)]
+        )
+
+    @app.route("/testing-farm/requests", methods=["POST"])
+    def testing_farm_request():
+        return jsonify(simulator.test_request(request.json))
+
+    @app.route("/testing-farm/requests/<request_id>")
+    def testing_farm_request_details(request_id):
+        return jsonify(simulator.test_requests.get(request_id) or abort(404))
+
+    return app
+
+
+@click.command()
+@click.option("--host", default="0.0.0.0", show_default=True)
+@click.option("--port", default=8080, show_default=True, type=int)
+@click.option(
+    "--url",
+    default="http://simulator:8080",
+    show_default=True,
+    help="URL the service reaches the simulator at.",
+)
+@click.option(
+    "--service-url",
+    default="http://service:8080",
+    show_default=True,
+    help="URL of packit-service API (for the Testing Farm notifications).",
+)
+@click.option(
+    "--testing-farm-secret",
+    default="load-test",
+    show_default=True,
+    help="Must match testing_farm_secret of the service.",
+)
+@click.option(
+    "--targets",
+    default="fedora-rawhide-x86_64",
+    show_default=True,
+    help="Comma-separated targets of the builds and tests in the packit config.",
+)
+@click.option(
+    "--latency",
+    default=0.05,
+    show_default=True,
+    help="Delay of every response in seconds.",
+)
+@click.option(
+    "--jitter",
+    default=0.05,
+    show_default=True,
+    help="Maximal random delay added to the latency in seconds.",
+)
+@click.option(
+    "--error-rate",
+    default=0.0,
+    show_default=True,
+    help="Probability a request fails with 503.",
+)
+@click.option("--srpm-build-duration", default=30.0, show_default=True)
+@click.option("--copr-build-duration", default=60.0, show_default=True)
+@click.option("--tests-duration", default=120.0, show_default=True)
+def simulator(
+    host,
+    port,
+    url,
+    service_url,
+    testing_farm_secret,
+    targets,
+    latency,
+    jitter,
+    error_rate,
+    srpm_build_duration,
+    copr_build_duration,
+    tests_duration,
+):
+    """
+    Simulate GitLab, Copr and Testing Farm for the load tests of packit-service.
+    """
+    logging.basicConfig(level=logging.INFO)
+    # don't log every request
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    app = create_app(
+        Simulator(
+            url=url,
+            service_url=service_url,
+            testing_farm_secret=testing_farm_secret,
+            targets=targets.split(","),
+            srpm_build_duration=srpm_build_duration,
+            copr_build_duration=copr_build_duration,
+            tests_duration=tests_duration,
+        ),
+        latency=latency,
+        jitter=jitter,
+        error_rate=error_rate,
+    )
+    app.run(host=host, port=port, threaded=True)
+
+
+if __name__ == "__main__":
+    simulator()
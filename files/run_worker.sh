@@ -26,6 +26,10 @@ if [[ "${CELERY_COMMAND:=worker}" == "beat" ]]; then
     # https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html#starting-the-scheduler
     exec celery --app="${APP}" beat --loglevel="${LOGLEVEL:-DEBUG}" --pidfile=/tmp/celerybeat.pid --schedule=/tmp/celerybeat-schedule
 
+# Sidecar serving the metrics of the Celery queues (see packit_service/worker/queue_metrics.py)
+elif [[ "${CELERY_COMMAND}" == "queue-metrics" ]]; then
+    exec python3 -m packit_service.worker.queue_metrics --port="${QUEUE_METRICS_PORT:-8000}"
+
 elif [[ "${CELERY_COMMAND}" == "worker" ]]; then
     # define queues to serve
     : "${QUEUES:=short-running,long-running}"
@@ -0,0 +1,195 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Cache shared by all the processes (httpd processes, workers) of the service.
+
+Redis is used as a storage, when it's not available (e.g. in tests),
+the cache falls back to process-local memory.
+"""
+
+import json
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from hashlib import sha256
+from inspect import signature
+from os import getenv
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from cachetools import LRUCache
+from redis import Redis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "packit-service:cache"
+
+# Keys already refreshed in the current refresh_shared_cache() context.
+_refreshed_keys: ContextVar[Optional[Set[str]]] = ContextVar(
+    "refreshed_keys", default=None
+)
+
+
+class LocalCache:
+    """Process-local in-memory cache, used when Redis can't be used."""
+
+    # the values are not seen by the other processes
+    shared = False
+
+    def __init__(self, maxsize: int = 1024):
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+
+    def get(self, key: str) -> Optional[str]:
+        expires_at, value = self._cache.get(key, (None, None))
+        if expires_at is None or expires_at < monotonic():
+            return None
+        return value
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        self._cache[key] = (monotonic() + ttl, value)
+
+    def set_many(self, values: Dict[str, str], ttl: int) -> None:
+        for key, value in values.items():
+            self.set(key, value, ttl)
+
+    def delete(self, key: str) -> None:
+        self._cache.pop(key, None)
+
+
+class RedisCache:
+    """
+    Cache stored in Redis, shared by all the processes.
+
+    Errors when talking to Redis are logged and the values are treated
+    as not cached, so that an unavailable Redis only makes things slower.
+    """
+
+    shared = True
+
+    def __init__(self):
+        self._redis = Redis(
+            host=getenv("REDIS_SERVICE_HOST", "redis"),
+            port=int(getenv("REDIS_SERVICE_PORT", "6379")),
+            db=int(getenv("REDIS_SERVICE_DB", "0")),
+            password=getenv("REDIS_PASSWORD") or None,
+            socket_timeout=5,
+            socket_connect_timeout=5,
+            decode_responses=True,
+        )
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            return self._redis.get(key)
+        except RedisError as ex:
+            logger.warning(f"Failed to get {key} from Redis: {ex!r}")
+            return None
+
+    def set(self, key: str, value: str, ttl: int) -> None:
+        try:
+            self._redis.set(key, value, ex=ttl)
+        except RedisError as ex:
+            logger.warning(f"Failed to store {key} in Redis: {ex!r}")
+
+    def set_many(self, values: Dict[str, str], ttl: int) -> None:
+        """Store the values in a single round trip, in the order given."""
+        pipeline = self._redis.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.set(key, value, ex=ttl)
+        try:
+            pipeline.execute()
+        except RedisError as ex:
+            logger.warning(f"Failed to store {len(values)} keys in Redis: {ex!r}")
+
+    def delete(self, key: str) -> None:
+        try:
+            self._redis.delete(key)
+        except RedisError as ex:
+            logger.warning(f"Failed to delete {key} from Redis: {ex!r}")
+
+
+_shared_cache = None
+
+
+def get_shared_cache():
+    """
+    Returns the cache backend configured by the `SHARED_CACHE_BACKEND`
+    env. var. (`redis` by default, `local` for the in-memory one).
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        backend = getenv("SHARED_CACHE_BACKEND", "redis")
+        _shared_cache = LocalCache() if backend == "local" else RedisCache()
+        logger.debug(f"Using {type(_shared_cache).__name__} as the shared cache.")
+    return _shared_cache
+
+
+def set_shared_cache(cache) -> None:
+    """Replace the shared cache backend, e.g. by a `LocalCache` in tests."""
+    global _shared_cache
+    _shared_cache = cache
+
+
+def get_cache_key(func: Callable, args: Tuple, kwargs: dict) -> str:
+    """
+    Cache key for the given call of the function.
+
+    Arguments are bound to the parameters (and defaults applied), so that
+    the same call made with positional or keyword arguments shares the key.
+    The first argument of classmethods (`cls`) is left out.
+    """
+    bound = signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = [
+        (name, value) for name, value in bound.arguments.items() if name != "cls"
+    ]
+    digest = sha256(repr(arguments).encode()).hexdigest()
+    return f"{CACHE_KEY_PREFIX}:{func.__module__}.{func.__qualname__}:{digest}"
+
+
+def shared_ttl_cache(ttl: int) -> Callable:
+    """
+    Decorator caching results of a function in the shared cache for `ttl` seconds.
+
+    The results need to be JSON serializable.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> Any:
+            key = get_cache_key(func, args, kwargs)
+            cache = get_shared_cache()
+
+            refreshed_keys = _refreshed_keys.get()
+            if refreshed_keys is None or key in refreshed_keys:
+                cached = cache.get(key)
+                if cached is not None:
+                    return json.loads(cached)
+
+            result = func(*args, **kwargs)
+            cache.set(key, json.dumps(result), ttl)
+            if refreshed_keys is not None:
+                refreshed_keys.add(key)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def refresh_shared_cache() -> Iterator[None]:
+    """
+    Within this context, functions decorated with `shared_ttl_cache` ignore
+    the cached values and compute (and store) them again, each value once.
+
+    Used to refresh the cache periodically, before the values expire,
+    so that no user request needs to compute them.
+    """
+    token = _refreshed_keys.set(set())
+    try:
+        yield
+    finally:
+        _refreshed_keys.reset(token)
@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: MIT
 
 from os import getenv
+from time import time
 
 from celery import Celery
+from celery.signals import before_task_publish
 from lazy_object_proxy import Proxy
 
+from packit_service.constants import CELERY_PUBLISHED_AT_HEADER
 from packit_service.sentry_integration import configure_sentry
 
 
@@ -31,6 +34,12 @@ class Celerizer:
         return self._celery_app
 
 
+@before_task_publish.connect
+def set_published_at(headers: dict, **kwargs):
+    # see packit_service/worker/queue_metrics.py
+    headers[CELERY_PUBLISHED_AT_HEADER] = time()
+
+
 def get_celery_application():
     celerizer = Celerizer()
     app = celerizer.celery_app
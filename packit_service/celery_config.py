@@ -9,21 +9,40 @@ task_default_queue = packit_service.constants.CELERY_TASK_DEFAULT_QUEUE
 
 # https://docs.celeryq.dev/en/stable/userguide/periodic-tasks.html
 beat_schedule = {
+    # the pending builds and test runs are only checked when the deadlines
+    # of their next checks pass (see worker/helpers/polling.py)
     "update-pending-copr-builds": {
         "task": "packit_service.worker.tasks.babysit_pending_copr_builds",
-        "schedule": 3600.0,
+        "schedule": 120.0,
         "options": {"queue": "long-running"},
     },
     "update-pending-tft-runs": {
         "task": "packit_service.worker.tasks.babysit_pending_tft_runs",
-        "schedule": 600.0,
+        "schedule": 120.0,
         "options": {"queue": "long-running"},
     },
     "update-pending-vm-image-builds": {
         "task": "packit_service.worker.tasks.babysit_pending_vm_image_builds",
-        "schedule": 3600.0,
+        "schedule": 120.0,
         "options": {"queue": "long-running"},
     },
+    "refresh-usage-statistics-cache": {
+        "task": "packit_service.worker.tasks.refresh_usage_statistics_cache",
+        # more often than the statistics expire in the cache (1 hour)
+        "schedule": 1800.0,
+        "options": {"queue": "long-running"},
+    },
+    "reconcile-packit-issues": {
+        "task": "packit_service.worker.tasks.reconcile_packit_issues_with_forges",
+        "schedule": 6 * 3600.0,
+        "options": {"queue": "long-running"},
+    },
+    "export-queue-metrics": {
+        "task": "packit_service.worker.tasks.export_queue_metrics",
+        "schedule": 30.0,
+        # a late sample is useless, the next one is on the way
+        "options": {"queue": "short-running", "expires": 30.0},
+    },
     "database-maintenance": {
         "task": "packit_service.worker.tasks.database_maintenance",
         "schedule": crontab(minute=0, hour=1),  # nightly at 1AM
@@ -31,6 +31,7 @@ from packit_service.constants import (
     SANDCASTLE_WORK_DIR,
     TESTING_FARM_API_URL,
 )
+from packit_service.forge_http_cache import use_conditional_requests
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +110,17 @@ class ServiceConfig(Config):
         comment_command_prefix: str = "/packit",
         redhat_api_refresh_token: str = None,
         package_config_path_override: Optional[str] = None,
+        parallel_sync_release_branches: int = 1,
+        parallel_koji_builds: int = 1,
+        testing_farm_request_timeout: int = 60,
+        testing_farm_request_retries: int = 5,
+        testing_farm_request_backoff: float = 0.5,
+        forge_conditional_requests: bool = True,
+        babysit_shards: int = 1,
+        event_archive_dir: str = "",
+        event_archive_file_size: int = 64,
+        event_archive_max_files: int = 100,
+        memory_profiler_snapshot_interval: int = 0,
         **kwargs,
     ):
         super().__init__(**kwargs)
@@ -173,6 +185,40 @@ class ServiceConfig(Config):
         # default names.
         self.package_config_path_override = package_config_path_override
 
+        # How many dist-git branches can be synced (propose-downstream,
+        # pull-from-upstream) at once by a single task.
+        self.parallel_sync_release_branches = parallel_sync_release_branches
+
+        # How many Koji builds (targets, dist-git branches) can be submitted
+        # at once by a single task.
+        self.parallel_koji_builds = parallel_koji_builds
+
+        # Requests to the Testing Farm API: timeout (in seconds) and retries
+        # of the failed connections, the n-th retry after `backoff * 2^(n-1)` seconds.
+        self.testing_farm_request_timeout = testing_farm_request_timeout
+        self.testing_farm_request_retries = testing_farm_request_retries
+        self.testing_farm_request_backoff = testing_farm_request_backoff
+
+        # Revalidate the cached responses of the forges (ETags)
+        # instead of downloading them again.
+        self.forge_conditional_requests = forge_conditional_requests
+
+        # Into how many shards (tasks run in parallel by the workers)
+        # the periodic checks of the pending builds and test runs are split.
+        self.babysit_shards = babysit_shards
+
+        # Record the sanitized incoming events into the compressed archive files
+        # in the directory (see `packit_service.event_archive`), rotate them
+        # when they reach the size (in MiB) and keep at most the number of them.
+        self.event_archive_dir = event_archive_dir
+        self.event_archive_file_size = event_archive_file_size
+        self.event_archive_max_files = event_archive_max_files
+
+        # Trace the allocations of the workers and log the growth every
+        # N tasks (see `packit_service.worker.memory_profiler`), 0 to disable,
+        # tracing slows the workers down
+        self.memory_profiler_snapshot_interval = memory_profiler_snapshot_interval
+
     service_config = None
 
     def __repr__(self):
@@ -201,7 +247,19 @@ class ServiceConfig(Config):
             f"enabled_projects_for_srpm_in_copr= '{self.enabled_projects_for_srpm_in_copr}', "
             f"comment_command_prefix='{self.comment_command_prefix}', "
             f"redhat_api_refresh_token='{hide(self.redhat_api_refresh_token)}', "
-            f"package_config_path_override='{self.package_config_path_override}')"
+            f"package_config_path_override='{self.package_config_path_override}', "
+            f"parallel_sync_release_branches='{self.parallel_sync_release_branches}', "
+            f"parallel_koji_builds='{self.parallel_koji_builds}', "
+            f"testing_farm_request_timeout='{self.testing_farm_request_timeout}', "
+            f"testing_farm_request_retries='{self.testing_farm_request_retries}', "
+            f"testing_farm_request_backoff='{self.testing_farm_request_backoff}', "
+            f"forge_conditional_requests='{self.forge_conditional_requests}', "
+            f"babysit_shards='{self.babysit_shards}', "
+            f"event_archive_dir='{self.event_archive_dir}', "
+            f"event_archive_file_size='{self.event_archive_file_size}', "
+            f"event_archive_max_files='{self.event_archive_max_files}', "
+            f"memory_profiler_snapshot_interval="
+            f"'{self.memory_profiler_snapshot_interval}')"
         )
 
     @classmethod
@@ -255,6 +313,12 @@ class ServiceConfig(Config):
             cls.service_config = ServiceConfig.get_from_dict(raw_dict=loaded_config)
         return cls.service_config
 
+    def _get_project(self, url: str, get_project_kwargs: dict = None) -> GitProject:
+        project = super()._get_project(url, get_project_kwargs)
+        if self.forge_conditional_requests:
+            use_conditional_requests(project.service)
+        return project
+
     def get_project_to_sync(self, dg_repo_name, dg_branch) -> Optional[ProjectToSync]:
         # TODO: Is it ok that we don't check namespace? Can't this be misused from a fork?
         projects = [
@@ -284,6 +348,14 @@ class PackageConfigGetter:
         comment_to_existing: Optional[str] = None,
         add_packit_prefix: Optional[bool] = True,
     ) -> Optional[Issue]:
+        """
+        Create an issue in the project unless there is one with the title,
+        `comment_to_existing` is added to such issue.
+
+        The issues of the project are listed, the handlers use
+        `packit_service.worker.reporting.create_issue_if_needed` recording
+        the issues opened by Packit instead.
+        """
         # TODO: Improve filtering
         issues = project.get_issue_list()
         packit_title = f"[packit] {title}"
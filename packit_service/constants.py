@@ -99,14 +99,90 @@ DEFAULT_RETRY_BACKOFF = 7
 BASE_RETRY_INTERVAL_IN_MINUTES_FOR_OUTAGES = 1
 BASE_RETRY_INTERVAL_IN_SECONDS_FOR_INTERNAL_ERRORS = 10
 
+# Upstream archives which are not available yet when syncing a release are
+# checked in 30s, 60s, 120s, ... (at most 30 min apart), ~2.5 hours in total,
+# before the sync-release task is dispatched again.
+ARCHIVE_WATCHER_RETRY_BACKOFF = 30
+ARCHIVE_WATCHER_RETRY_BACKOFF_MAX = 1800
+ARCHIVE_WATCHER_MAX_RETRIES = 10
+ARCHIVE_REQUEST_TIMEOUT = 30
+
+# Visibility of the projects and permissions of the users are cached
+# for this number of seconds (unless invalidated by a webhook event).
+FORGE_CACHE_TTL = 300
+# The same for the forges whose webhook events don't invalidate the cache
+# (GitLab and Pagure don't send the events changing the permissions to us).
+FORGE_CACHE_NOT_INVALIDATED_TTL = 60
+
+# Responses of the forges kept (with their ETags) for the conditional requests,
+# the bigger ones are always downloaded again.
+FORGE_HTTP_CACHE_TTL = 24 * 3600
+FORGE_HTTP_CACHE_MAX_BODY_SIZE = 1024 * 1024
+# The tokens are part of the keys of the cached responses and the GitHub
+# installation tokens expire after an hour, the responses to the requests
+# authenticated by them are not kept longer.
+FORGE_HTTP_CACHE_GITHUB_TOKEN_TTL = 3600
+
+# Pending builds and test runs are checked when the deadline of their next check
+# passes. The deadlines are estimated from the durations of the recent builds
+# (at least POLLING_HISTORY_MIN_SIZE of the last POLLING_HISTORY_SIZE, cached for
+# POLLING_HISTORY_CACHE_TTL seconds) of the same project and chroot; after the
+# expected end, the checks are spaced by POLLING_BACKOFF_FACTOR of the time
+# the build has been running. The checks are always
+# POLLING_MIN_INTERVAL-POLLING_MAX_INTERVAL seconds apart.
+POLLING_MIN_INTERVAL = 60
+POLLING_MAX_INTERVAL = 3600
+POLLING_BACKOFF_FACTOR = 0.25
+POLLING_HISTORY_SIZE = 20
+POLLING_HISTORY_MIN_SIZE = 3
+POLLING_HISTORY_CACHE_TTL = 3600
+
+# Number of the handler tasks (for the builds/runs found ended by the babysit
+# checks) sent to the workers at once.
+BABYSIT_DISPATCH_BATCH_SIZE = 50
+
 # Time after which we no longer check the status of jobs and consider it as
 # timeout/internal error. Nothing should hopefully run for 7 days.
 DEFAULT_JOB_TIMEOUT = 7 * 24 * 3600
 
+# Celery tasks and API requests issuing at least DB_PROFILER_QUERIES_WARNING
+# SQL queries are logged with their DB_PROFILER_SLOWEST_QUERIES slowest
+# statements and the statements issued at least DB_PROFILER_REPEATED_QUERIES
+# times (likely N+1 queries).
+DB_PROFILER_QUERIES_WARNING = 100
+DB_PROFILER_SLOWEST_QUERIES = 5
+DB_PROFILER_REPEATED_QUERIES = 20
+
+# Memory snapshots of the workers (see memory_profiler_snapshot_interval
+# in the service config) log the MEMORY_PROFILER_TOP allocation sites which
+# grew the most and the most common types of the objects, the allocations
+# are traced with MEMORY_PROFILER_TRACEBACK_FRAMES frames.
+MEMORY_PROFILER_TOP = 10
+MEMORY_PROFILER_TRACEBACK_FRAMES = 1
+
+# IDs of the Copr builds and Koji tasks submitted by us are kept in the shared
+# cache for DEFAULT_JOB_TIMEOUT seconds, so that the fedmsg messages about
+# the other builds are dropped right away. When they are not there (e.g. Redis
+# was restarted), they are loaded from the DB, at most once in
+# SUBMITTED_BUILDS_RELOAD_INTERVAL seconds per process.
+SUBMITTED_BUILDS_RELOAD_INTERVAL = 60
+
 # SRPM builds older than this number of days are considered
 # outdated and their logs can be discarded.
 SRPMBUILDS_OUTDATED_AFTER_DAYS = 30
 
+# Times of the stages of the events (see the latency API) older than
+# this number of days are deleted.
+EVENT_STAGE_TIMES_OUTDATED_AFTER_DAYS = 30
+
+# The latency API shows the events of this number of days back from today
+# if no `from` argument is given.
+LATENCY_DEFAULT_PERIOD_DAYS = 7
+
+# Usage statistics are refreshed periodically for all time and for these
+# numbers of days back from today (`from` argument of the usage API).
+USAGE_STATISTICS_REFRESHED_PERIODS_DAYS = [7, 30, 365]
+
 ALLOWLIST_CONSTANTS = {
     "approved_automatically": "approved_automatically",
     "waiting": "waiting",
@@ -115,6 +191,11 @@ ALLOWLIST_CONSTANTS = {
 }
 
 CELERY_TASK_DEFAULT_QUEUE = "short-running"
+CELERY_QUEUES = (CELERY_TASK_DEFAULT_QUEUE, "long-running")
+
+# Header of the Celery task messages with the time they were published,
+# for the age of the queued messages and the latency of the tasks in the queues.
+CELERY_PUBLISHED_AT_HEADER = "packit_published_at"
 
 CELERY_DEFAULT_MAIN_TASK_NAME = "task.steve_jobs.process_message"
 
@@ -212,6 +293,12 @@ CUSTOM_COPR_PROJECT_NOT_ALLOWED_CONTENT = (
 )
 
 FASJSON_URL = "https://fasjson.fedoraproject.org"
+FASJSON_REQUEST_TIMEOUT = 30
+# FAS accounts and groups of the users are cached for this number of seconds.
+FAS_CACHE_TTL = 900
+# Kerberos ticket (for fasjson) of a worker process is renewed after this number
+# of seconds, well before it expires (24 hours for the Fedora realm).
+KERBEROS_TICKET_RENEW_INTERVAL = 6 * 3600
 
 PACKIT_VERIFY_FAS_COMMAND = "verify-fas"
 
@@ -0,0 +1,196 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Archive of the incoming events for replaying the real traffic offline
+(see `tests_openshift/benchmarks/test_replay.py`).
+
+If `event_archive_dir` is configured, the events are recorded by the webhook
+endpoints (GitHub, GitLab, Testing Farm) when they are sent to the workers
+and by `process_message` for the fedmsg events, which don't go through
+the endpoints. The secrets and e-mail addresses are redacted.
+
+Every process writes its own gzip-compressed file of JSON lines
+(`{"time": ..., "source": ..., "event": ...}`), the file is rotated when
+it reaches `event_archive_file_size` MiB and the oldest files are removed
+when there are more than `event_archive_max_files` of them.
+
+Failing to record an event never affects its processing, it's just logged.
+"""
+
+import atexit
+import gzip
+import heapq
+import json
+import logging
+import os
+import socket
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Union
+
+from packit_service.config import ServiceConfig
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE_PREFIX = "events-"
+ARCHIVE_FILE_SUFFIX = ".jsonl.gz"
+
+REDACTED = "<redacted>"
+# values of the keys ending with these are redacted
+SENSITIVE_KEYS = ("token", "secret", "password", "email")
+
+
+def sanitize(value: Any) -> Any:
+    """Copy of the event with the values of the sensitive keys redacted."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED
+            if isinstance(key, str)
+            and key.lower().endswith(SENSITIVE_KEYS)
+            and item is not None
+            else sanitize(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [sanitize(item) for item in value]
+    return value
+
+
+class EventArchiveWriter:
+    """Writes the events to the rotated archive files of the current process."""
+
+    def __init__(self, directory: Union[str, Path], file_size: int, max_files: int):
+        """
+        Args:
+            directory: Directory of the archive files.
+            file_size: Size (in bytes, compressed) the files are rotated at.
+            max_files: Maximal number of the files kept in the directory.
+        """
+        self.directory = Path(directory)
+        self.file_size = file_size
+        self.max_files = max_files
+        self._lock = threading.Lock()
+        self._raw_file: Optional[IO[bytes]] = None
+        self._file: Optional[gzip.GzipFile] = None
+
+    def write(self, source: str, event: dict) -> None:
+        line = json.dumps(
+            {
+                "time": datetime.now(timezone.utc).timestamp(),
+                "source": source,
+                "event": sanitize(event),
+            },
+            separators=(",", ":"),
+        )
+        with self._lock:
+            if not self._file:
+                self._open()
+            self._file.write(f"{line}\n".encode())
+            # make the event readable even if the process is killed
+            self._file.flush()
+            if self._raw_file.tell() >= self.file_size:
+                self._close()
+                self._remove_old_files()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / (
+            f"{ARCHIVE_FILE_PREFIX}{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-"
+            f"{socket.gethostname()}-{os.getpid()}{ARCHIVE_FILE_SUFFIX}"
+        )
+        self._raw_file = path.open("xb")
+        self._file = gzip.GzipFile(fileobj=self._raw_file, mode="wb")
+        logger.debug(f"Recording the events to {path}.")
+
+    def _close(self) -> None:
+        if self._file:
+            self._file.close()
+            self._raw_file.close()
+            self._file = self._raw_file = None
+
+    def _remove_old_files(self) -> None:
+        files = sorted(
+            self.directory.glob(f"{ARCHIVE_FILE_PREFIX}*{ARCHIVE_FILE_SUFFIX}"),
+            key=lambda path: (path.stat().st_mtime, path.name),
+        )
+        for path in files[: -self.max_files]:
+            logger.debug(f"Removing the old event archive {path}.")
+            path.unlink(missing_ok=True)
+
+
+_writers: Dict[Tuple[int, str], EventArchiveWriter] = {}
+
+
+def get_event_archive_writer(
+    service_config: Optional[ServiceConfig] = None,
+) -> Optional[EventArchiveWriter]:
+    """
+    Event archive writer of the current process, created on the first use,
+    `None` if the recording is not configured.
+
+    The files can't be shared with the forked processes (httpd processes,
+    Celery worker pool), each of them writes its own ones.
+    """
+    service_config = service_config or ServiceConfig.get_service_config()
+    if not service_config.event_archive_dir:
+        return None
+    key = (os.getpid(), service_config.event_archive_dir)
+    if key not in _writers:
+        _writers[key] = EventArchiveWriter(
+            directory=service_config.event_archive_dir,
+            file_size=service_config.event_archive_file_size * 1024 * 1024,
+            max_files=service_config.event_archive_max_files,
+        )
+        atexit.register(_writers[key].close)
+    return _writers[key]
+
+
+def record_event(source: str, event: dict) -> None:
+    """
+    Record the incoming event if configured.
+
+    Args:
+        source: Where the event came from, e.g. `github` or `fedmsg`.
+        event: The event as sent to `process_message`.
+    """
+    try:
+        if writer := get_event_archive_writer():
+            writer.write(source, event)
+    except (OSError, TypeError, ValueError) as ex:
+        logger.warning(f"Failed to record the {source} event: {ex!r}")
+
+
+def _read_file(path: Path) -> Iterator[dict]:
+    with gzip.open(path, "rt") as file:
+        try:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # the last line of a file of a killed process
+                    logger.debug(f"Skipping an incomplete record in {path}.")
+        except EOFError:
+            # the file is still being written or the process was killed
+            logger.debug(f"{path} is not complete.")
+
+
+def read_event_archive(path: Union[str, Path]) -> Iterator[dict]:
+    """
+    Recorded events from the archive file or from all the archive files
+    in the directory, ordered by the time they were recorded.
+    """
+    path = Path(path)
+    files = (
+        sorted(path.glob(f"{ARCHIVE_FILE_PREFIX}*{ARCHIVE_FILE_SUFFIX}"))
+        if path.is_dir()
+        else [path]
+    )
+    return heapq.merge(
+        *(_read_file(file) for file in files), key=lambda record: record["time"]
+    )
@@ -0,0 +1,129 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Visibility of the projects and permissions of the users cached
+in the shared cache, so that the forges are not asked again
+by each handler (and checker) of the same or following events.
+
+The cached values of a namespace are invalidated by changing its generation,
+which is a part of the keys; this is done on the GitHub webhook events
+changing the installations, members or visibility of the repositories.
+The other forges don't send such events, their values are cached shortly.
+"""
+
+import json
+import logging
+from typing import Callable, Optional
+from uuid import uuid4
+
+from ogr.abstract import GitProject
+
+from packit_service.cache import CACHE_KEY_PREFIX, get_shared_cache
+from packit_service.constants import FORGE_CACHE_NOT_INVALIDATED_TTL, FORGE_CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+FORGE_CACHE_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:forge"
+
+# hostname of the forge whose webhook events invalidate the cache
+GITHUB_HOSTNAME = "github.com"
+
+# GitHub webhook events changing the permissions or visibility
+GITHUB_EVENTS_INVALIDATING_FORGE_CACHE = {
+    "installation",
+    "installation_repositories",
+    "member",
+    "membership",
+    "organization",
+    "repository",
+    "team",
+    "team_add",
+}
+
+
+def _get_generation_key(hostname: str, namespace: str) -> str:
+    return f"{FORGE_CACHE_KEY_PREFIX}:generation:{hostname}/{namespace}"
+
+
+def _cached(project: GitProject, name: str, compute: Callable[[], bool]) -> bool:
+    # only ogr projects are identified by their service, stubs are always asked
+    if not isinstance(project, GitProject):
+        return compute()
+
+    try:
+        hostname = project.service.hostname
+    except NotImplementedError:
+        hostname = None
+    if not hostname:
+        # the values can't be told apart from the ones of the other forges
+        return compute()
+
+    cache = get_shared_cache()
+    namespace = project.namespace
+    generation = cache.get(_get_generation_key(hostname, namespace)) or "0"
+    key = (
+        f"{FORGE_CACHE_KEY_PREFIX}:{hostname}/{namespace}:{generation}"
+        f"/{project.repo}:{name}"
+    )
+
+    cached = cache.get(key)
+    if cached is not None:
+        return json.loads(cached)
+
+    result = compute()
+    cache.set(
+        key,
+        json.dumps(result),
+        FORGE_CACHE_TTL
+        if hostname == GITHUB_HOSTNAME
+        else FORGE_CACHE_NOT_INVALIDATED_TTL,
+    )
+    return result
+
+
+def is_private(project: GitProject) -> bool:
+    """Cached `project.is_private()`."""
+    return _cached(project, "private", project.is_private)
+
+
+def can_merge_pr(project: GitProject, user: str) -> bool:
+    """Cached `project.can_merge_pr(user)`."""
+    return _cached(project, f"can_merge_pr:{user}", lambda: project.can_merge_pr(user))
+
+
+def has_write_access(project: GitProject, user: str) -> bool:
+    """Cached `project.has_write_access(user)`."""
+    return _cached(
+        project, f"has_write_access:{user}", lambda: project.has_write_access(user=user)
+    )
+
+
+def invalidate_namespace(hostname: str, namespace: str) -> None:
+    """Forget the cached visibility and permissions for the whole namespace."""
+    logger.debug(f"Invalidating the forge cache for {hostname}/{namespace}.")
+    # the values cached before the invalidation expire
+    # at the latest together with the new generation
+    get_shared_cache().set(
+        _get_generation_key(hostname, namespace), uuid4().hex, FORGE_CACHE_TTL
+    )
+
+
+def get_namespace_from_github_event(event: dict) -> Optional[str]:
+    """Namespace (user, organization) whose permissions the event changes."""
+    for owner in (
+        (event.get("repository") or {}).get("owner"),
+        event.get("organization"),
+        (event.get("installation") or {}).get("account"),
+    ):
+        if owner and owner.get("login"):
+            return owner["login"]
+    return None
+
+
+def invalidate_on_github_event(event_type: Optional[str], event: dict) -> None:
+    """Invalidate the forge cache if the GitHub webhook event changes permissions."""
+    if event_type not in GITHUB_EVENTS_INVALIDATING_FORGE_CACHE:
+        return
+    if namespace := get_namespace_from_github_event(event):
+        invalidate_namespace(GITHUB_HOSTNAME, namespace)
@@ -0,0 +1,248 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Conditional requests for the reads from the forges.
+
+The responses to the GET requests are kept in the shared cache along with
+their ETags and the same requests are then sent with `If-None-Match`;
+if the forge replies with `304 Not Modified`, the cached response is used.
+Such replies don't transfer the body again and (on GitHub) don't count
+against the rate limit.
+"""
+
+import json
+import logging
+from base64 import b64decode, b64encode
+from functools import lru_cache
+from hashlib import sha256
+from typing import Optional
+from urllib.parse import urlparse
+
+from github.Requester import (
+    HTTPRequestsConnectionClass,
+    HTTPSRequestsConnectionClass,
+    Requester,
+)
+from ogr.abstract import GitService
+from ogr.services.github import GithubService
+from ogr.services.gitlab import GitlabService
+from ogr.services.pagure import PagureService
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from packit_service.cache import CACHE_KEY_PREFIX, get_shared_cache
+from packit_service.constants import (
+    FORGE_HTTP_CACHE_GITHUB_TOKEN_TTL,
+    FORGE_HTTP_CACHE_MAX_BODY_SIZE,
+    FORGE_HTTP_CACHE_TTL,
+)
+from packit_service.metrics import forge_conditional_requests, forge_rate_limit_saved
+
+logger = logging.getLogger(__name__)
+
+FORGE_HTTP_CACHE_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:forge-http"
+
+# headers the response depends on, the tokens are part of the key
+# so that the responses are never shared between different identities
+VARYING_HEADERS = ("Accept", "Authorization", "PRIVATE-TOKEN")
+# headers describing the original transfer, not the cached body
+NOT_CACHED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+# internals of PyGithub replaced to send its requests through the adapter
+PYGITHUB_INTERNALS = (
+    "injectConnectionClasses",
+    "_Requester__httpConnectionClass",
+    "_Requester__httpsConnectionClass",
+    "_Requester__persist",
+)
+
+
+def get_cache_key(request: PreparedRequest) -> str:
+    identity = "\n".join(
+        [request.url] + [request.headers.get(header, "") for header in VARYING_HEADERS]
+    )
+    return f"{FORGE_HTTP_CACHE_KEY_PREFIX}:{sha256(identity.encode()).hexdigest()}"
+
+
+def get_cache_ttl(request: PreparedRequest, response: Response) -> int:
+    """
+    Number of seconds to keep the response for, the responses to the requests
+    authenticated by the (short-lived) GitHub tokens can't be reused longer.
+    """
+    if "X-GitHub-Request-Id" in response.headers and "Authorization" in (
+        request.headers
+    ):
+        return min(FORGE_HTTP_CACHE_TTL, FORGE_HTTP_CACHE_GITHUB_TOKEN_TTL)
+    return FORGE_HTTP_CACHE_TTL
+
+
+class ConditionalRequestsAdapter(HTTPAdapter):
+    """
+    Transport adapter revalidating the cached responses to the GET requests
+    instead of downloading them again.
+    """
+
+    def send(self, request: PreparedRequest, stream: bool = False, **kwargs):
+        if (
+            request.method != "GET"
+            or stream
+            or "If-None-Match" in request.headers
+            or "If-Modified-Since" in request.headers
+        ):
+            return super().send(request, stream=stream, **kwargs)
+
+        host = urlparse(request.url).hostname
+        cache = get_shared_cache()
+        key = get_cache_key(request)
+        cached = self._load(cache.get(key))
+        if cached:
+            request.headers["If-None-Match"] = cached["etag"]
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if cached and response.status_code == 304:
+            forge_conditional_requests.labels(host=host, result="hit").inc()
+            if "X-GitHub-Request-Id" in response.headers:
+                forge_rate_limit_saved.labels(host=host).inc()
+            return self._build_cached_response(request, response, cached)
+
+        forge_conditional_requests.labels(host=host, result="miss").inc()
+        etag = response.headers.get("ETag")
+        if (
+            response.status_code == 200
+            and etag
+            and len(response.content) <= FORGE_HTTP_CACHE_MAX_BODY_SIZE
+        ):
+            cache.set(
+                key,
+                json.dumps(
+                    {
+                        "etag": etag,
+                        "headers": dict(response.headers),
+                        "content": b64encode(response.content).decode(),
+                    }
+                ),
+                get_cache_ttl(request, response),
+            )
+        elif cached:
+            cache.delete(key)
+        return response
+
+    @staticmethod
+    def _load(value: Optional[str]) -> Optional[dict]:
+        if not value:
+            return None
+        try:
+            return json.loads(value)
+        except ValueError:
+            logger.debug("Ignoring malformed cached forge response.")
+            return None
+
+    def _build_cached_response(
+        self, request: PreparedRequest, not_modified: Response, cached: dict
+    ) -> Response:
+        # read the (empty) body so that the connection is returned to the pool
+        _ = not_modified.content
+
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        # the current headers (e.g. the rate limit) take precedence
+        response.headers = CaseInsensitiveDict(
+            {
+                name: value
+                for name, value in {**cached["headers"], **not_modified.headers}.items()
+                if name.lower() not in NOT_CACHED_HEADERS
+            }
+        )
+        response._content = b64decode(cached["content"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.raw = not_modified.raw
+        response.elapsed = not_modified.elapsed
+        response.connection = self
+        return response
+
+
+class ConditionalRequestsConnectionMixin:
+    """Mounts the caching adapter to the session of a PyGithub connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.adapter = ConditionalRequestsAdapter(
+            max_retries=self.retry,
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+        )
+        self.session.mount(f"{self.protocol}://", self.adapter)
+
+
+class ConditionalHTTPSRequestsConnection(
+    ConditionalRequestsConnectionMixin, HTTPSRequestsConnectionClass
+):
+    """PyGithub HTTPS connection sending the requests through the caching adapter."""
+
+
+class ConditionalHTTPRequestsConnection(
+    ConditionalRequestsConnectionMixin, HTTPRequestsConnectionClass
+):
+    """PyGithub HTTP connection sending the requests through the caching adapter."""
+
+
+def _mount(session: Session) -> None:
+    if isinstance(session.get_adapter("https://"), ConditionalRequestsAdapter):
+        return
+    adapter = ConditionalRequestsAdapter(
+        max_retries=session.get_adapter("https://").max_retries
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+@lru_cache(maxsize=None)
+def pygithub_internals_available() -> bool:
+    """Whether the installed PyGithub has the internals replaced for GitHub."""
+    if missing := [name for name in PYGITHUB_INTERNALS if not hasattr(Requester, name)]:
+        logger.warning(
+            f"PyGithub has no {', '.join(missing)}, "
+            "not using conditional requests for GitHub."
+        )
+        return False
+    return True
+
+
+def use_conditional_requests(service: GitService) -> None:
+    """
+    Send the reads of the service through the caching adapter.
+
+    PyGithub creates its connections itself, so for GitHub the connection classes
+    are replaced for all the clients in the process (if the internals of PyGithub
+    allow that, otherwise the requests are sent as usual).
+
+    The GitLab client is created (and authenticated) by ogr on its first use,
+    so the adapter is mounted once the client exists, i.e. for the next projects
+    of the service, not to force the authentication when getting a project.
+    """
+    if isinstance(service, GithubService):
+        if not pygithub_internals_available():
+            return
+        if (
+            Requester._Requester__httpsConnectionClass
+            is ConditionalHTTPSRequestsConnection
+        ):
+            return
+        Requester.injectConnectionClasses(
+            ConditionalHTTPRequestsConnection, ConditionalHTTPSRequestsConnection
+        )
+        # the injection disables the keep-alive connections (meant for tests),
+        # the replaced classes are drop-in replacements, so keep them
+        Requester._Requester__persist = True
+        logger.debug("Using conditional requests for GitHub.")
+    elif isinstance(service, GitlabService):
+        if service._gitlab_instance:
+            _mount(service._gitlab_instance.session)
+    elif isinstance(service, PagureService):
+        _mount(service.session)
@@ -0,0 +1,38 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Process-wide metrics of the modules shared by the API and the workers
+(e.g. the access to the forges and the database), they don't depend
+on the worker monitoring, which pushes them along with the metrics of each task.
+"""
+
+from prometheus_client import Counter, Histogram
+
+forge_conditional_requests = Counter(
+    "forge_conditional_requests",
+    "Number of GET requests to the forges served from the cache (hit) or not (miss)",
+    ["host", "result"],
+    registry=None,
+)
+forge_rate_limit_saved = Counter(
+    "forge_rate_limit_saved",
+    "Number of requests to the forges not counted against the rate limit",
+    ["host"],
+    registry=None,
+)
+
+db_queries = Histogram(
+    "db_queries",
+    "Number of the SQL queries issued by a Celery task or an API request",
+    ["scope", "name"],
+    registry=None,
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, float("inf")),
+)
+db_queries_duration = Histogram(
+    "db_queries_duration_seconds",
+    "Time spent in the SQL queries issued by a Celery task or an API request",
+    ["scope", "name"],
+    registry=None,
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf")),
+)
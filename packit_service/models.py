@@ -10,8 +10,10 @@ import logging
 from collections import Counter
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from hashlib import sha256
 from os import getenv
 from typing import (
+    Any,
     Dict,
     Iterable,
     List,
@@ -25,7 +27,6 @@ from typing import (
 )
 from urllib.parse import urlparse
 
-from cachetools.func import ttl_cache
 from sqlalchemy import (
     Boolean,
     Column,
@@ -36,32 +37,41 @@ from sqlalchemy import (
     JSON,
     String,
     Text,
+    and_,
+    cast,
     create_engine,
     desc,
     func,
     null,
+    or_,
     case,
     Table,
+    select,
 )
 from sqlalchemy.dialects.postgresql import array as psql_array
 from sqlalchemy.exc import MultipleResultsFound
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
+    Query,
     Session as SQLASession,
+    aliased,
+    column_property,
     relationship,
     scoped_session,
     sessionmaker,
+    undefer_group,
 )
 from sqlalchemy.sql.functions import count
 from sqlalchemy.types import ARRAY
 
 from packit.config import JobConfigTriggerType
 from packit.exceptions import PackitException
+from packit_service import query_profiler
+from packit_service.cache import shared_ttl_cache
 from packit_service.constants import ALLOWLIST_CONSTANTS
 
 logger = logging.getLogger(__name__)
 
-_CACHE_MAXSIZE = 100
 _CACHE_TTL = timedelta(hours=1).seconds
 
 
@@ -83,6 +93,7 @@ sqlalchemy_echo = getenv("SQLALCHEMY_ECHO", "False").lower() in (
     "1",
 )
 engine = create_engine(get_pg_url(), echo=sqlalchemy_echo)
+query_profiler.install(engine)
 Session = sessionmaker(bind=engine)
 
 
@@ -110,6 +121,42 @@ def sa_session() -> SQLASession:
     return singleton_session or Session()
 
 
+# number of the Celery tasks running in the singleton session
+_tasks_in_singleton_session = 0
+
+
+def start_task_session() -> None:
+    """Start the session scope of a Celery task, see `end_task_session()`."""
+    global _tasks_in_singleton_session
+    if singleton_session:
+        _tasks_in_singleton_session += 1
+
+
+def end_task_session() -> None:
+    """
+    End the session scope of a finished Celery task: release the objects
+    loaded by the task, otherwise the identity map of a long-lived worker
+    keeps growing.
+
+    The scoped session of the task's thread is closed and removed. The objects
+    in the singleton session (gevent/eventlet workers) may still be used
+    by the other tasks, they are expunged once no task is running.
+    """
+    global _tasks_in_singleton_session
+    if not singleton_session:
+        Session.remove()
+        return
+
+    _tasks_in_singleton_session = max(0, _tasks_in_singleton_session - 1)
+    if not _tasks_in_singleton_session:
+        singleton_session.expunge_all()
+
+
+def identity_map_size() -> int:
+    """Number of the objects in the identity map of the current session."""
+    return len(sa_session().identity_map)
+
+
 @contextmanager
 def sa_session_transaction() -> SQLASession:
     """
@@ -265,6 +312,91 @@ def filter_most_recent_target_names_by_status(
     return {model.target for model in filtered_models} if filtered_models else None
 
 
+def get_most_recent_targets_by_commit(
+    model_type: Union[Type["CoprBuildTargetModel"], Type["TFTTestRunTargetModel"]],
+    commit_sha: str,
+    statuses_to_filter_with: Optional[List[str]] = None,
+) -> Union[List["CoprBuildTargetModel"], List["TFTTestRunTargetModel"]]:
+    """
+    Same as `get_most_recent_targets` (optionally filtered by status as
+    `filter_most_recent_target_models_by_status` does) for all the models
+    of the commit, but the most recent model per target is selected by
+    the database (`DISTINCT ON`), so only those rows are loaded.
+
+    Args:
+        model_type: `CoprBuildTargetModel` or `TFTTestRunTargetModel`
+        commit_sha: Commit the models were created for.
+        statuses_to_filter_with: If set, only the most recent models
+            having one of these statuses are returned.
+
+    Returns:
+        list of the most recent target models
+    """
+    submitted_time = (
+        model_type.build_submitted_time
+        if model_type is CoprBuildTargetModel
+        else model_type.submitted_time
+    )
+    most_recent = (
+        sa_session()
+        .query(model_type)
+        .filter(model_type.commit_sha == commit_sha)
+        .distinct(model_type.target)
+        .order_by(
+            model_type.target, desc(submitted_time).nulls_last(), desc(model_type.id)
+        )
+        .subquery()
+    )
+    most_recent_model = aliased(model_type, most_recent)
+    query = sa_session().query(most_recent_model)
+    if statuses_to_filter_with is not None:
+        query = query.filter(most_recent_model.status.in_(statuses_to_filter_with))
+
+    models = query.all()
+    logger.debug(f"Most recent targets for {commit_sha}: {models}")
+    return models
+
+
+def filter_pending_checks(
+    query: Query,
+    model_type: Union[
+        Type["CoprBuildTargetModel"],
+        Type["TFTTestRunTargetModel"],
+        Type["VMImageBuildTargetModel"],
+    ],
+    shard_key: Any,
+    due_before: Optional[datetime] = None,
+    shard: int = 0,
+    shards: int = 1,
+) -> Query:
+    """
+    Narrow the query of the pending builds/runs to the ones to be checked
+    by the periodic (babysit) check.
+
+    Args:
+        query: Query of the pending builds/runs.
+        model_type: Model of the builds/runs.
+        shard_key: Integer column (expression) the checks are sharded by.
+        due_before: If set, only the builds/runs with the deadline of the next
+            check before this time (naive, UTC) or without any deadline yet.
+        shard: Index of the shard of the check.
+        shards: Number of shards the check is split into.
+
+    Returns:
+        The filtered query.
+    """
+    if due_before:
+        query = query.filter(
+            or_(
+                model_type.next_check_time <= due_before,
+                model_type.next_check_time.is_(None),
+            )
+        )
+    if shards > 1:
+        query = query.filter(shard_key % shards == shard)
+    return query
+
+
 # https://github.com/python/mypy/issues/2477#issuecomment-313984522 ^_^
 if TYPE_CHECKING:
     Base = object
@@ -469,11 +601,21 @@ class GitProjectModel(Base):
     def get_by_id(cls, id_: int) -> Optional["GitProjectModel"]:
         return sa_session().query(GitProjectModel).filter_by(id=id_).first()
 
+    @classmethod
+    def __query_with_handled_counts(cls):
+        """
+        Query projects together with the numbers of handled PRs, branches,
+        releases and issues, which are computed by the database
+        (see the `handled_counts` column properties below the trigger models).
+        """
+        return (
+            sa_session().query(GitProjectModel).options(undefer_group("handled_counts"))
+        )
+
     @classmethod
     def get_range(cls, first: int, last: int) -> Iterable["GitProjectModel"]:
         return (
-            sa_session()
-            .query(GitProjectModel)
+            cls.__query_with_handled_counts()
             .order_by(GitProjectModel.namespace)
             .slice(first, last)
         )
@@ -484,8 +626,7 @@ class GitProjectModel(Base):
     ) -> Iterable["GitProjectModel"]:
         """Return projects of given forge"""
         return (
-            sa_session()
-            .query(GitProjectModel)
+            cls.__query_with_handled_counts()
             .filter_by(instance_url=forge)
             .order_by(GitProjectModel.namespace)
             .slice(first, last)
@@ -496,10 +637,8 @@ class GitProjectModel(Base):
         cls, forge: str, namespace: str
     ) -> Iterable["GitProjectModel"]:
         """Return projects of given forge and namespace"""
-        return (
-            sa_session()
-            .query(GitProjectModel)
-            .filter_by(instance_url=forge, namespace=namespace)
+        return cls.__query_with_handled_counts().filter_by(
+            instance_url=forge, namespace=namespace
         )
 
     @classmethod
@@ -508,8 +647,7 @@ class GitProjectModel(Base):
     ) -> Optional["GitProjectModel"]:
         """Return one project which matches said criteria"""
         return (
-            sa_session()
-            .query(cls)
+            cls.__query_with_handled_counts()
             .filter_by(instance_url=forge, namespace=namespace, repo_name=repo_name)
             .one_or_none()
         )
@@ -579,7 +717,7 @@ class GitProjectModel(Base):
     # ACTIVE PROJECTS
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_active_projects(
         cls, top: Optional[int] = None, datetime_from=None, datetime_to=None
     ) -> list[str]:
@@ -594,7 +732,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_active_projects_count(cls, datetime_from=None, datetime_to=None) -> int:
         """
         Active project is the one with at least one activity (=one pipeline)
@@ -607,7 +745,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_active_projects_usage_numbers(
         cls, top: Optional[int] = 10, datetime_from=None, datetime_to=None
     ) -> dict[str, int]:
@@ -631,7 +769,7 @@ class GitProjectModel(Base):
     # ALL PROJECTS
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_project_count(
         cls,
     ) -> list[str]:
@@ -641,7 +779,7 @@ class GitProjectModel(Base):
         return sa_session().query(GitProjectModel).count()
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_instance_numbers(cls) -> Dict[str, int]:
         """
         Get the number of projects per each GIT instances.
@@ -657,7 +795,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_instance_numbers_for_active_projects(
         cls, datetime_from=None, datetime_to=None
     ) -> Dict[str, int]:
@@ -698,7 +836,7 @@ class GitProjectModel(Base):
         }
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_trigger_usage_count(
         cls, trigger_type: JobTriggerModelType, datetime_from=None, datetime_to=None
     ):
@@ -717,7 +855,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_trigger_usage_numbers(
         cls, trigger_type, datetime_from=None, datetime_to=None, top=None
     ) -> dict[str, int]:
@@ -764,7 +902,7 @@ class GitProjectModel(Base):
         return dict(query.all())
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_job_usage_numbers_count(
         cls,
         job_result_model,
@@ -787,7 +925,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_job_usage_numbers_count_all_triggers(
         cls,
         job_result_model,
@@ -808,7 +946,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_job_usage_numbers(
         cls,
         job_result_model,
@@ -869,7 +1007,7 @@ class GitProjectModel(Base):
         )
 
     @classmethod
-    @ttl_cache(maxsize=_CACHE_MAXSIZE, ttl=_CACHE_TTL)
+    @shared_ttl_cache(ttl=_CACHE_TTL)
     def get_job_usage_numbers_all_triggers(
         cls,
         job_result_model,
@@ -959,6 +1097,75 @@ class PullRequestModel(BuildsAndTestsConnector, Base):
         return f"PullRequestModel(pr_id={self.pr_id}, project={self.project})"
 
 
+class PullRequestHeadCommitModel(Base):
+    """
+    Head commits of the pull requests, so that the pull request
+    can be found by the commit (e.g. for the commits merged in dist-git).
+    """
+
+    __tablename__ = "pull_request_head_commits"
+    id = Column(Integer, primary_key=True)
+    pull_request_id = Column(Integer, ForeignKey("pull_requests.id"), index=True)
+    pull_request = relationship("PullRequestModel")
+    commit_sha = Column(String, index=True)
+
+    @classmethod
+    def add(
+        cls,
+        pr_id: int,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+        commit_sha: str,
+    ) -> "PullRequestHeadCommitModel":
+        with sa_session_transaction() as session:
+            pull_request = PullRequestModel.get_or_create(
+                pr_id=pr_id,
+                namespace=namespace,
+                repo_name=repo_name,
+                project_url=project_url,
+            )
+            head_commit = (
+                session.query(PullRequestHeadCommitModel)
+                .filter_by(pull_request_id=pull_request.id, commit_sha=commit_sha)
+                .first()
+            )
+            if not head_commit:
+                head_commit = cls()
+                head_commit.pull_request_id = pull_request.id
+                head_commit.commit_sha = commit_sha
+                session.add(head_commit)
+            return head_commit
+
+    @classmethod
+    def get_pr_id(
+        cls, namespace: str, repo_name: str, project_url: str, commit_sha: str
+    ) -> Optional[int]:
+        """ID (on the forge) of the latest pull request with the head commit."""
+        with sa_session_transaction() as session:
+            project = GitProjectModel.get_or_create(
+                namespace=namespace, repo_name=repo_name, project_url=project_url
+            )
+            result = (
+                session.query(PullRequestModel.pr_id)
+                .join(
+                    PullRequestHeadCommitModel,
+                    PullRequestHeadCommitModel.pull_request_id == PullRequestModel.id,
+                )
+                .filter(PullRequestModel.project_id == project.id)
+                .filter(PullRequestHeadCommitModel.commit_sha == commit_sha)
+                .order_by(desc(PullRequestHeadCommitModel.id))
+                .first()
+            )
+            return result[0] if result else None
+
+    def __repr__(self):
+        return (
+            f"PullRequestHeadCommitModel(pull_request={self.pull_request}, "
+            f"commit_sha={self.commit_sha})"
+        )
+
+
 class IssueModel(BuildsAndTestsConnector, Base):
     __tablename__ = "project_issues"
     id = Column(Integer, primary_key=True)  # our database PK
@@ -1084,6 +1291,29 @@ class ProjectReleaseModel(Base):
         )
 
 
+def _handled_count(trigger_model):
+    """
+    Correlated subquery counting the trigger models of a project.
+    Deferred, so that it's loaded only when explicitly requested.
+    """
+    return column_property(
+        select(func.count(trigger_model.id))
+        .where(trigger_model.project_id == GitProjectModel.id)
+        .correlate_except(trigger_model)
+        .scalar_subquery(),
+        deferred=True,
+        group="handled_counts",
+    )
+
+
+# Counting these in the database avoids loading all the related models
+# just to get the length of the collections.
+GitProjectModel.prs_handled = _handled_count(PullRequestModel)
+GitProjectModel.branches_handled = _handled_count(GitBranchModel)
+GitProjectModel.releases_handled = _handled_count(ProjectReleaseModel)
+GitProjectModel.issues_handled = _handled_count(IssueModel)
+
+
 AbstractTriggerDbType = Union[
     PullRequestModel,
     ProjectReleaseModel,
@@ -1351,6 +1581,10 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
     build_submitted_time = Column(DateTime, default=datetime.utcnow)
     build_start_time = Column(DateTime)
     build_finished_time = Column(DateTime)
+    # deadline of the next check of the pending build/run by the babysit tasks
+    # and the number of the checks done so far
+    next_check_time = Column(DateTime)
+    check_count = Column(Integer, default=0)
 
     # project name as shown in copr
     project_name = Column(String)
@@ -1399,6 +1633,13 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
             self.status = status
             session.add(self)
 
+    def set_next_check_time(self, next_check_time: datetime) -> None:
+        """Record a check of the pending build and the deadline of the next one."""
+        with sa_session_transaction() as session:
+            self.next_check_time = next_check_time
+            self.check_count = (self.check_count or 0) + 1
+            session.add(self)
+
     def set_build_logs_url(self, build_logs: str):
         with sa_session_transaction() as session:
             self.build_logs_url = build_logs
@@ -1441,8 +1682,14 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         """Returns a list of unique build ids with merged status, chroots
         Details:
         https://github.com/packit/packit-service/pull/674#discussion_r439819852
+
+        Each row also contains the details of the first of the merged builds
+        (`packit_id`, `project_name`, `first_status`, `build_submitted_time`,
+        `web_url`, `commit_sha`) and of its trigger and project
+        (`pr_id`, `branch_name`, `repo_namespace`, `repo_name`, `project_url`),
+        so that the whole list is obtained by a single query.
         """
-        return (
+        merged_builds = (
             sa_session()
             .query(
                 # We need something to order our merged builds by,
@@ -1464,6 +1711,63 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
             .group_by(CoprBuildTargetModel.build_id)  # Group by identical element(s)
             .order_by(desc("new_id"))
             .slice(first, last)
+            .subquery()
+        )
+
+        def trigger_join(trigger_model):
+            return and_(
+                JobTriggerModel.type == trigger_model.job_trigger_model_type,
+                JobTriggerModel.trigger_id == trigger_model.id,
+            )
+
+        return (
+            sa_session()
+            .query(
+                merged_builds.c.new_id,
+                merged_builds.c.build_id,
+                merged_builds.c.target,
+                merged_builds.c.status,
+                merged_builds.c.packit_id_per_chroot,
+                CoprBuildTargetModel.id.label("packit_id"),
+                CoprBuildTargetModel.project_name,
+                CoprBuildTargetModel.status.label("first_status"),
+                CoprBuildTargetModel.build_submitted_time,
+                CoprBuildTargetModel.web_url,
+                CoprBuildTargetModel.commit_sha,
+                PullRequestModel.pr_id,
+                GitBranchModel.name.label("branch_name"),
+                GitProjectModel.namespace.label("repo_namespace"),
+                GitProjectModel.repo_name,
+                GitProjectModel.project_url,
+            )
+            .join(
+                CoprBuildTargetModel, CoprBuildTargetModel.id == merged_builds.c.new_id
+            )
+            # All the runs of a group share the trigger, the first one is used.
+            .outerjoin(
+                PipelineModel,
+                PipelineModel.copr_build_group_id
+                == CoprBuildTargetModel.copr_build_group_id,
+            )
+            .outerjoin(
+                JobTriggerModel, JobTriggerModel.id == PipelineModel.job_trigger_id
+            )
+            .outerjoin(PullRequestModel, trigger_join(PullRequestModel))
+            .outerjoin(GitBranchModel, trigger_join(GitBranchModel))
+            .outerjoin(ProjectReleaseModel, trigger_join(ProjectReleaseModel))
+            .outerjoin(IssueModel, trigger_join(IssueModel))
+            .outerjoin(
+                GitProjectModel,
+                GitProjectModel.id
+                == func.coalesce(
+                    PullRequestModel.project_id,
+                    GitBranchModel.project_id,
+                    ProjectReleaseModel.project_id,
+                    IssueModel.project_id,
+                ),
+            )
+            .distinct(merged_builds.c.new_id)
+            .order_by(desc(merged_builds.c.new_id), PipelineModel.id)
         )
 
     # Returns all builds with that build_id, irrespective of target
@@ -1477,9 +1781,87 @@ class CoprBuildTargetModel(GroupAndTargetModelConnector, Base):
         return sa_session().query(CoprBuildTargetModel).filter_by(build_id=build_id)
 
     @classmethod
-    def get_all_by_status(cls, status: BuildStatus) -> Iterable["CoprBuildTargetModel"]:
-        """Returns all builds which currently have the given status."""
-        return sa_session().query(CoprBuildTargetModel).filter_by(status=status)
+    def get_all_by_status(
+        cls,
+        status: BuildStatus,
+        due_before: Optional[datetime] = None,
+        shard: int = 0,
+        shards: int = 1,
+    ) -> Iterable["CoprBuildTargetModel"]:
+        """
+        Returns all builds which currently have the given status.
+
+        If `due_before` or `shards` is given (see `filter_pending_checks()`),
+        all the chroots of the Copr builds having at least one chroot matching
+        are returned, the Copr builds are sharded by their ID, so that
+        all the chroots are checked together.
+        """
+        query = sa_session().query(CoprBuildTargetModel).filter_by(status=status)
+        if not due_before and shards == 1:
+            return query
+        build_ids = filter_pending_checks(
+            sa_session()
+            .query(CoprBuildTargetModel.build_id)
+            .filter(CoprBuildTargetModel.status == status),
+            CoprBuildTargetModel,
+            # our DB uses str(build_id)
+            shard_key=cast(CoprBuildTargetModel.build_id, Integer),
+            due_before=due_before,
+            shard=shard,
+            shards=shards,
+        )
+        return query.filter(
+            CoprBuildTargetModel.build_id.in_(build_ids.scalar_subquery())
+        )
+
+    @classmethod
+    def get_recent_durations(
+        cls,
+        owner: str,
+        target: str,
+        project_name: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[float]:
+        """
+        Durations (from the submission to the end, in seconds) of the most recent
+        successful builds in the given chroot of the Copr owner (and project).
+        """
+        query = (
+            sa_session()
+            .query(
+                CoprBuildTargetModel.build_submitted_time,
+                CoprBuildTargetModel.build_finished_time,
+            )
+            .filter(
+                CoprBuildTargetModel.owner == owner,
+                CoprBuildTargetModel.target == target,
+                CoprBuildTargetModel.status == BuildStatus.success,
+                CoprBuildTargetModel.build_submitted_time.isnot(None),
+                CoprBuildTargetModel.build_finished_time.isnot(None),
+            )
+        )
+        if project_name:
+            query = query.filter(CoprBuildTargetModel.project_name == project_name)
+        return [
+            (finished - submitted).total_seconds()
+            for submitted, finished in query.order_by(
+                desc(CoprBuildTargetModel.id)
+            ).limit(limit)
+        ]
+
+    @classmethod
+    def get_build_ids_submitted_after(cls, submitted_after: datetime) -> Set[str]:
+        """IDs of the Copr builds submitted after the given time."""
+        return {
+            build_id
+            for (build_id,) in sa_session()
+            .query(CoprBuildTargetModel.build_id)
+            .filter(
+                CoprBuildTargetModel.build_id.isnot(None),
+                CoprBuildTargetModel.build_submitted_time > submitted_after,
+            )
+            .distinct()
+        }
 
     # returns the build matching the build_id and the target
     @classmethod
@@ -1724,6 +2106,20 @@ class KojiBuildTargetModel(GroupAndTargetModelConnector, Base):
             build_id = str(build_id)
         return sa_session().query(KojiBuildTargetModel).filter_by(build_id=build_id)
 
+    @classmethod
+    def get_build_ids_submitted_after(cls, submitted_after: datetime) -> Set[str]:
+        """IDs of the Koji builds (tasks) submitted after the given time."""
+        return {
+            build_id
+            for (build_id,) in sa_session()
+            .query(KojiBuildTargetModel.build_id)
+            .filter(
+                KojiBuildTargetModel.build_id.isnot(None),
+                KojiBuildTargetModel.build_submitted_time > submitted_after,
+            )
+            .distinct()
+        }
+
     @classmethod
     def get_by_build_id(
         cls, build_id: Union[str, int], target: Optional[str] = None
@@ -2116,13 +2512,17 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
     id = Column(Integer, primary_key=True)
     pipeline_id = Column(String, index=True)
     identifier = Column(String)
-    commit_sha = Column(String)
+    commit_sha = Column(String, index=True)
     status = Column(Enum(TestingFarmResult))
     target = Column(String)
     web_url = Column(String)
     # datetime.utcnow instead of datetime.utcnow() because its an argument to the function
     # so it will run when the model is initiated, not when the table is made
     submitted_time = Column(DateTime, default=datetime.utcnow)
+    # deadline of the next check of the pending build/run by the babysit tasks
+    # and the number of the checks done so far
+    next_check_time = Column(DateTime)
+    check_count = Column(Integer, default=0)
     data = Column(JSON)
     tft_test_run_group_id = Column(Integer, ForeignKey("tft_test_run_groups.id"))
 
@@ -2145,6 +2545,13 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
                 self.submitted_time = created
             session.add(self)
 
+    def set_next_check_time(self, next_check_time: datetime) -> None:
+        """Record a check of the pending test run and the deadline of the next one."""
+        with sa_session_transaction() as session:
+            self.next_check_time = next_check_time
+            self.check_count = (self.check_count or 0) + 1
+            session.add(self)
+
     def set_web_url(self, web_url: str):
         with sa_session_transaction() as session:
             self.web_url = web_url
@@ -2201,14 +2608,24 @@ class TFTTestRunTargetModel(GroupAndTargetModelConnector, Base):
 
     @classmethod
     def get_all_by_status(
-        cls, *status: TestingFarmResult
+        cls,
+        *status: TestingFarmResult,
+        due_before: Optional[datetime] = None,
+        shard: int = 0,
+        shards: int = 1,
     ) -> Iterable["TFTTestRunTargetModel"]:
         """Returns all runs which currently have their status set to one
-        of the requested statuses."""
-        return (
+        of the requested statuses (and are due for a check in the shard,
+        see `filter_pending_checks()`)."""
+        return filter_pending_checks(
             sa_session()
             .query(TFTTestRunTargetModel)
-            .filter(TFTTestRunTargetModel.status.in_(status))
+            .filter(TFTTestRunTargetModel.status.in_(status)),
+            TFTTestRunTargetModel,
+            shard_key=TFTTestRunTargetModel.id,
+            due_before=due_before,
+            shard=shard,
+            shards=shards,
         )
 
     @classmethod
@@ -2467,6 +2884,80 @@ class ProjectAuthenticationIssueModel(Base):
         )
 
 
+class PackitIssueModel(Base):
+    """
+    Issues opened by Packit (e.g. in the issue repositories),
+    so that they can be found without listing all the issues of the project.
+    """
+
+    __tablename__ = "packit_issues"
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("git_projects.id"), index=True)
+    project = relationship("GitProjectModel")
+    # sha256 of the title (without the `[packit]` prefix)
+    title_hash = Column(String, index=True)
+    issue_id = Column(Integer)
+    # set when the issue is found closed (see `reconcile_packit_issues`)
+    closed = Column(Boolean, default=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    @staticmethod
+    def get_title_hash(title: str) -> str:
+        return sha256(title.encode()).hexdigest()
+
+    @classmethod
+    def get_latest(
+        cls, namespace: str, repo_name: str, project_url: str, title: str
+    ) -> Optional["PackitIssueModel"]:
+        with sa_session_transaction() as session:
+            project = GitProjectModel.get_or_create(
+                namespace=namespace, repo_name=repo_name, project_url=project_url
+            )
+            return (
+                session.query(PackitIssueModel)
+                .filter_by(project_id=project.id, title_hash=cls.get_title_hash(title))
+                .order_by(desc(PackitIssueModel.id))
+                .first()
+            )
+
+    @classmethod
+    def create(
+        cls,
+        namespace: str,
+        repo_name: str,
+        project_url: str,
+        title: str,
+        issue_id: int,
+    ) -> "PackitIssueModel":
+        with sa_session_transaction() as session:
+            project = GitProjectModel.get_or_create(
+                namespace=namespace, repo_name=repo_name, project_url=project_url
+            )
+
+            issue = cls()
+            issue.project_id = project.id
+            issue.title_hash = cls.get_title_hash(title)
+            issue.issue_id = issue_id
+            session.add(issue)
+
+            return issue
+
+    @classmethod
+    def get_all_open(cls) -> Iterable["PackitIssueModel"]:
+        return sa_session().query(PackitIssueModel).filter_by(closed=False)
+
+    def set_closed(self):
+        with sa_session_transaction() as session:
+            self.closed = True
+            session.add(self)
+
+    def __repr__(self):
+        return (
+            f"PackitIssueModel(project={self.project}, issue_id={self.issue_id}, "
+            f"closed={self.closed})"
+        )
+
+
 class GithubInstallationModel(Base):
     __tablename__ = "github_installations"
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -2674,6 +3165,10 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
     build_submitted_time = Column(DateTime, default=datetime.utcnow)
     build_start_time = Column(DateTime)
     build_finished_time = Column(DateTime)
+    # deadline of the next check of the pending build/run by the babysit tasks
+    # and the number of the checks done so far
+    next_check_time = Column(DateTime)
+    check_count = Column(Integer, default=0)
 
     # metadata for the build which didn't make it to schema yet
     data = Column(JSON)
@@ -2695,6 +3190,13 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
             self.status = status
             session.add(self)
 
+    def set_next_check_time(self, next_check_time: datetime) -> None:
+        """Record a check of the pending image build and the deadline of the next one."""
+        with sa_session_transaction() as session:
+            self.next_check_time = next_check_time
+            self.check_count = (self.check_count or 0) + 1
+            session.add(self)
+
     def set_build_logs_url(self, build_logs: str):
         with sa_session_transaction() as session:
             self.build_logs_url = build_logs
@@ -2724,10 +3226,48 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
 
     @classmethod
     def get_all_by_status(
-        cls, status: VMImageBuildStatus
+        cls,
+        status: VMImageBuildStatus,
+        due_before: Optional[datetime] = None,
+        shard: int = 0,
+        shards: int = 1,
     ) -> Iterable["VMImageBuildTargetModel"]:
-        """Returns all builds which currently have the given status."""
-        return sa_session().query(VMImageBuildTargetModel).filter_by(status=status)
+        """Returns all builds which currently have the given status
+        (and are due for a check in the shard, see `filter_pending_checks()`)."""
+        return filter_pending_checks(
+            sa_session().query(VMImageBuildTargetModel).filter_by(status=status),
+            VMImageBuildTargetModel,
+            shard_key=VMImageBuildTargetModel.id,
+            due_before=due_before,
+            shard=shard,
+            shards=shards,
+        )
+
+    @classmethod
+    def get_recent_durations(
+        cls, project_url: str, target: str, limit: int = 20
+    ) -> List[float]:
+        """
+        Durations (from the submission to the end, in seconds) of the most recent
+        successful image builds of the project for the given target.
+        """
+        query = (
+            sa_session()
+            .query(
+                VMImageBuildTargetModel.build_submitted_time,
+                VMImageBuildTargetModel.build_finished_time,
+            )
+            .filter(
+                VMImageBuildTargetModel.project_url == project_url,
+                VMImageBuildTargetModel.target == target,
+                VMImageBuildTargetModel.status == VMImageBuildStatus.success,
+                VMImageBuildTargetModel.build_submitted_time.isnot(None),
+                VMImageBuildTargetModel.build_finished_time.isnot(None),
+            )
+            .order_by(desc(VMImageBuildTargetModel.id))
+            .limit(limit)
+        )
+        return [(finished - submitted).total_seconds() for submitted, finished in query]
 
     @classmethod
     def get_by_build_id(
@@ -2828,3 +3368,129 @@ class VMImageBuildTargetModel(ProjectAndTriggersConnector, Base):
             f"VMImageBuildTargetModel(id={self.id}, "
             f"build_submitted_time={self.build_submitted_time})"
         )
+
+
+class EventStage(str, enum.Enum):
+    """Stages of the processing of an event, in the order they are reached."""
+
+    received = "received"
+    enqueued = "enqueued"
+    dequeued = "dequeued"
+    first_status = "first_status"
+    submitted = "submitted"
+    finished = "finished"
+    reported = "reported"
+
+
+class EventStageTimeModel(Base):
+    """
+    Times the stages of the processing of the events were reached,
+    an event is identified by its trace ID.
+    """
+
+    __tablename__ = "event_stage_times"
+    id = Column(Integer, primary_key=True)
+    trace_id = Column(String, index=True)
+    stage = Column(Enum(EventStage))
+    time = Column(DateTime, index=True)
+
+    @classmethod
+    def add(cls, trace_id: str, times: Dict[EventStage, datetime]) -> None:
+        """Record the (naive, UTC) times the stages of the event were reached."""
+        with sa_session_transaction() as session:
+            session.add_all(
+                cls(trace_id=trace_id, stage=stage, time=time)
+                for stage, time in times.items()
+            )
+
+    @classmethod
+    def delete_older_than(cls, delta: timedelta) -> int:
+        """Delete the times older than delta, returns the number of deleted ones."""
+        delta_ago = datetime.utcnow() - delta
+        with sa_session_transaction() as session:
+            return (
+                session.query(cls)
+                .filter(cls.time < delta_ago)
+                .delete(synchronize_session=False)
+            )
+
+    @classmethod
+    def get_percentiles(
+        cls,
+        percentiles: Iterable[float] = (0.5, 0.9, 0.99),
+        datetime_from=None,
+        datetime_to=None,
+    ) -> Dict[EventStage, Dict[str, float]]:
+        """
+        Percentiles of the times (in seconds) it took to reach the stages
+        since the event was received.
+
+        Only the events received within the time range are included, with all
+        their stages (also the ones reached after the end of the range).
+        A stage reached more than once (e.g. finished for each of the
+        chroots) counts at the first time.
+
+        Returns:
+            Number of the events and the percentiles (e.g. `p90`)
+            for each of the reached stages.
+        """
+        received_time = func.min(cls.time)
+        event_starts = (
+            sa_session()
+            .query(cls.trace_id, received_time.label("time"))
+            .filter(cls.stage == EventStage.received)
+            .group_by(cls.trace_id)
+        )
+        if datetime_from:
+            event_starts = event_starts.having(received_time >= datetime_from)
+        if datetime_to:
+            event_starts = event_starts.having(received_time <= datetime_to)
+        event_starts = event_starts.subquery()
+
+        stage_times = sa_session().query(
+            cls.trace_id,
+            cls.stage,
+            func.min(cls.time).label("time"),
+            event_starts.c.time.label("received_time"),
+        )
+        if datetime_from:
+            # the stages are not reached before the event is received
+            stage_times = stage_times.filter(cls.time >= datetime_from)
+        stage_times = (
+            stage_times.join(event_starts, cls.trace_id == event_starts.c.trace_id)
+            .group_by(cls.trace_id, cls.stage, event_starts.c.time)
+            .subquery()
+        )
+
+        elapsed = func.extract(
+            "epoch", stage_times.c.time - stage_times.c.received_time
+        )
+        percentiles = list(percentiles)
+        query = (
+            sa_session()
+            .query(
+                stage_times.c.stage,
+                func.count(),
+                *(
+                    func.percentile_cont(percentile).within_group(elapsed)
+                    for percentile in percentiles
+                ),
+            )
+            .group_by(stage_times.c.stage)
+        )
+        return {
+            stage: {
+                "count": count,
+                **{
+                    f"p{percentile * 100:g}": value
+                    for percentile, value in zip(percentiles, values)
+                },
+            }
+            for stage, count, *values in query
+        }
+
+    def __repr__(self):
+        return (
+            f"EventStageTimeModel(trace_id={self.trace_id}, "
+            f"stage={self.stage}, time={self.time})"
+        )
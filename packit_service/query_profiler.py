@@ -0,0 +1,163 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Profiling of the SQL queries issued by the Celery tasks and the API requests.
+
+The queries are timed using the SQLAlchemy engine events and accounted
+to the task/request being processed. The number of the queries and the time
+spent in the DB are exported as Prometheus histograms; the tasks/requests
+issuing many queries are logged along with their slowest statements
+and the statements repeated many times (usually the N+1 query pattern,
+a lookup per each of the rows of a previous query).
+"""
+
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from heapq import heappush, heappushpop
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from packit_service.constants import (
+    DB_PROFILER_QUERIES_WARNING,
+    DB_PROFILER_REPEATED_QUERIES,
+    DB_PROFILER_SLOWEST_QUERIES,
+)
+from packit_service.metrics import db_queries, db_queries_duration
+
+logger = logging.getLogger(__name__)
+
+
+class QueryProfile:
+    """SQL queries issued within a single task/request."""
+
+    def __init__(self, scope: str, name: str):
+        """
+        Args:
+            scope: `task` or `request`.
+            name: Name of the task or the endpoint.
+        """
+        self.scope = scope
+        self.name = name
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+        # heap of (duration, statement)
+        self._slowest: List[Tuple[float, str]] = []
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+        if len(self._slowest) < DB_PROFILER_SLOWEST_QUERIES:
+            heappush(self._slowest, (duration, statement))
+        else:
+            heappushpop(self._slowest, (duration, statement))
+
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """The slowest statements with their durations, the slowest first."""
+        return sorted(self._slowest, reverse=True)
+
+    @property
+    def repeated(self) -> Dict[str, int]:
+        """Statements issued at least `DB_PROFILER_REPEATED_QUERIES` times."""
+        return {
+            statement: count
+            for statement, count in self.statements.items()
+            if count >= DB_PROFILER_REPEATED_QUERIES
+        }
+
+    def report(self) -> None:
+        """Export the metrics and log the profile if there were many queries."""
+        db_queries.labels(scope=self.scope, name=self.name).observe(self.count)
+        db_queries_duration.labels(scope=self.scope, name=self.name).observe(
+            self.duration
+        )
+
+        summary = (
+            f"{self.scope.capitalize()} {self.name} issued {self.count} SQL queries "
+            f"taking {self.duration:.3f}s."
+        )
+        repeated = self.repeated
+        if self.count < DB_PROFILER_QUERIES_WARNING and not repeated:
+            logger.debug(summary)
+            return
+
+        details = [summary, "Slowest statements:"]
+        details.extend(
+            f"  {duration:.3f}s: {statement}" for duration, statement in self.slowest
+        )
+        if repeated:
+            details.append("Repeated statements (possible N+1 queries):")
+            details.extend(
+                f"  {count}x: {statement}" for statement, count in repeated.items()
+            )
+        logger.warning("\n".join(details))
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "query_profile", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    duration = perf_counter() - start_times.pop()
+    if profile := _current_profile.get():
+        profile.record(statement, duration)
+
+
+def _handle_error(exception_context):
+    # the failed query is not finished by after_cursor_execute
+    if exception_context.connection is not None:
+        start_times = exception_context.connection.info.get("query_start_time")
+        if start_times:
+            start_times.pop()
+
+
+def install(engine: Engine) -> None:
+    """Time the queries issued using the engine."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def start_profiling(scope: str, name: str) -> Token:
+    """
+    Start accounting the queries to the given task/request.
+
+    Returns:
+        Token for `stop_profiling()`.
+    """
+    return _current_profile.set(QueryProfile(scope, name))
+
+
+def stop_profiling(token: Token) -> Optional[QueryProfile]:
+    """Stop accounting the queries and report the profile."""
+    profile = _current_profile.get()
+    _current_profile.reset(token)
+    if profile:
+        profile.report()
+    return profile
+
+
+@contextmanager
+def profile_queries(scope: str, name: str) -> Iterator[QueryProfile]:
+    """Account the queries issued within the context to the given task/request."""
+    token = start_profiling(scope, name)
+    try:
+        yield _current_profile.get()
+    finally:
+        stop_profiling(token)
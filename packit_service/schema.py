@@ -3,7 +3,7 @@
 
 import typing
 
-from marshmallow import Schema, ValidationError, fields, post_load
+from marshmallow import Schema, ValidationError, fields, post_load, validate
 
 from packit.config.common_package_config import Deployment
 from packit.schema import UserConfigSchema
@@ -81,6 +81,17 @@ class ServiceConfigSchema(UserConfigSchema):
     enabled_projects_for_srpm_in_copr = fields.List(fields.String())
     comment_command_prefix = fields.String()
     package_config_path_override = fields.String()
+    parallel_sync_release_branches = fields.Integer(validate=validate.Range(min=1))
+    parallel_koji_builds = fields.Integer(validate=validate.Range(min=1))
+    testing_farm_request_timeout = fields.Integer(validate=validate.Range(min=1))
+    testing_farm_request_retries = fields.Integer(validate=validate.Range(min=0))
+    testing_farm_request_backoff = fields.Float(validate=validate.Range(min=0))
+    forge_conditional_requests = fields.Bool()
+    babysit_shards = fields.Integer(validate=validate.Range(min=1))
+    event_archive_dir = fields.String()
+    event_archive_file_size = fields.Integer(validate=validate.Range(min=1))
+    event_archive_max_files = fields.Integer(validate=validate.Range(min=1))
+    memory_profiler_snapshot_interval = fields.Integer(validate=validate.Range(min=0))
 
     @post_load
     def make_instance(self, data, **kwargs):
@@ -8,6 +8,7 @@ from packit_service.service.api.copr_builds import ns as copr_builds_ns
 from packit_service.service.api.healthz import ns as healthz_ns
 from packit_service.service.api.installations import ns as installations_ns
 from packit_service.service.api.koji_builds import koji_builds_ns
+from packit_service.service.api.latency import latency_ns
 from packit_service.service.api.projects import ns as projects_ns
 from packit_service.service.api.srpm_builds import ns as srpm_builds_ns
 from packit_service.service.api.testing_farm import ns as testing_farm_ns
@@ -40,3 +41,4 @@ api.add_namespace(runs_ns)
 api.add_namespace(propose_downstream_ns)
 api.add_namespace(usage_ns)
 api.add_namespace(pull_from_upstream_ns)
+api.add_namespace(latency_ns)
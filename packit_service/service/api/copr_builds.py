@@ -34,26 +34,22 @@ class CoprBuildsList(Resource):
 
         first, last = indices()
         for build in CoprBuildTargetModel.get_merged_chroots(first, last):
-            build_info = CoprBuildTargetModel.get_by_build_id(build.build_id, None)
-            if build_info.status == BuildStatus.waiting_for_srpm:
+            if build.first_status == BuildStatus.waiting_for_srpm:
                 continue
-            project_info = build_info.get_project()
             build_dict = {
-                "packit_id": build_info.id,
-                "project": build_info.project_name,
+                "packit_id": build.packit_id,
+                "project": build.project_name,
                 "build_id": build.build_id,
                 "status_per_chroot": {},
                 "packit_id_per_chroot": {},
-                "build_submitted_time": optional_timestamp(
-                    build_info.build_submitted_time
-                ),
-                "web_url": build_info.web_url,
-                "ref": build_info.commit_sha,
-                "pr_id": build_info.get_pr_id(),
-                "branch_name": build_info.get_branch_name(),
-                "repo_namespace": project_info.namespace if project_info else "",
-                "repo_name": project_info.repo_name if project_info else "",
-                "project_url": project_info.project_url if project_info else "",
+                "build_submitted_time": optional_timestamp(build.build_submitted_time),
+                "web_url": build.web_url,
+                "ref": build.commit_sha,
+                "pr_id": build.pr_id,
+                "branch_name": build.branch_name,
+                "repo_namespace": build.repo_namespace or "",
+                "repo_name": build.repo_name or "",
+                "project_url": build.project_url or "",
             }
 
             for i, chroot in enumerate(build.target):
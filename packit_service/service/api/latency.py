@@ -0,0 +1,45 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from datetime import date, timedelta
+from http import HTTPStatus
+from logging import getLogger
+
+from flask import request
+from flask_restx import Namespace, Resource
+
+from packit_service.constants import LATENCY_DEFAULT_PERIOD_DAYS
+from packit_service.models import EventStageTimeModel
+from packit_service.service.api.utils import response_maker
+
+logger = getLogger("packit_service")
+
+latency_ns = Namespace("latency", description="Latency of the processing of events")
+
+
+@latency_ns.route("")
+class Latency(Resource):
+    @latency_ns.response(HTTPStatus.OK, "Providing latency percentiles")
+    def get(self):
+        """
+        Show the percentiles of the time (in seconds) it took the events
+        to reach the stages of their processing since they were received
+        (e.g. the first status set, the build submitted or its results reported).
+
+        You can use `from` and `to` arguments to specify a time range
+        (e.g. `/api/latency?from=2022-01-30`), the events of the last
+        7 days are shown by default.
+        """
+
+        datetime_from = request.args.get("from") or (
+            (date.today() - timedelta(days=LATENCY_DEFAULT_PERIOD_DAYS)).isoformat()
+        )
+        datetime_to = request.args.get("to")
+
+        percentiles = EventStageTimeModel.get_percentiles(
+            datetime_from=datetime_from, datetime_to=datetime_to
+        )
+
+        return response_maker(
+            {stage.value: values for stage, values in percentiles.items()}
+        )
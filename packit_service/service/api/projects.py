@@ -3,6 +3,7 @@
 
 from http import HTTPStatus
 from logging import getLogger
+from typing import Any, Dict
 
 from flask_restx import Namespace, Resource
 
@@ -18,6 +19,23 @@ ns = Namespace(
 )
 
 
+def get_project_info(project: GitProjectModel) -> Dict[str, Any]:
+    """
+    Numbers of handled triggers are counted by the database, the project needs
+    to be obtained via one of the `GitProjectModel` methods that load them
+    (otherwise each of them is loaded by a separate query).
+    """
+    return {
+        "namespace": project.namespace,
+        "repo_name": project.repo_name,
+        "project_url": project.project_url,
+        "prs_handled": project.prs_handled,
+        "branches_handled": project.branches_handled,
+        "releases_handled": project.releases_handled,
+        "issues_handled": project.issues_handled,
+    }
+
+
 @ns.route("")
 class ProjectsList(Resource):
     @ns.expect(pagination_arguments)
@@ -30,16 +48,7 @@ class ProjectsList(Resource):
         first, last = indices()
 
         for project in GitProjectModel.get_range(first, last):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+            result.append(get_project_info(project))
 
         resp = response_maker(
             result,
@@ -63,16 +72,7 @@ class ProjectInfo(Resource):
                 {"error": "No info about project stored in DB"},
                 status=HTTPStatus.NOT_FOUND,
             )
-        project_info = {
-            "namespace": project.namespace,
-            "repo_name": project.repo_name,
-            "project_url": project.project_url,
-            "prs_handled": len(project.pull_requests),
-            "branches_handled": len(project.branches),
-            "releases_handled": len(project.releases),
-            "issues_handled": len(project.issues),
-        }
-        return response_maker(project_info)
+        return response_maker(get_project_info(project))
 
 
 @ns.route("/<forge>")
@@ -88,16 +88,7 @@ class ProjectsForge(Resource):
         first, last = indices()
 
         for project in GitProjectModel.get_by_forge(first, last, forge):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+            result.append(get_project_info(project))
 
         resp = response_maker(
             result,
@@ -116,16 +107,7 @@ class ProjectsNamespace(Resource):
         """List of projects of given forge and namespace"""
         result = []
         for project in GitProjectModel.get_by_forge_namespace(forge, namespace):
-            project_info = {
-                "namespace": project.namespace,
-                "repo_name": project.repo_name,
-                "project_url": project.project_url,
-                "prs_handled": len(project.pull_requests),
-                "branches_handled": len(project.branches),
-                "releases_handled": len(project.releases),
-                "issues_handled": len(project.issues),
-            }
-            result.append(project_info)
+            result.append(get_project_info(project))
         return response_maker(result)
 
 
@@ -11,6 +11,7 @@ from flask_restx import Namespace, Resource, fields
 from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
 from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME
+from packit_service.event_archive import record_event
 from packit_service.models import (
     TFTTestRunTargetModel,
     optional_timestamp,
@@ -62,6 +63,7 @@ class TestingFarmResults(Resource):
         # There's only one key in the msg,
         # so make sure we don't confuse this with something else
         msg["source"] = "testing-farm"
+        record_event("testing-farm", msg)
         celery_app.send_task(
             name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
             kwargs={"event": msg},
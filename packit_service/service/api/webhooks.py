@@ -4,6 +4,7 @@
 import hmac
 import json
 import os
+from datetime import datetime, timezone
 from hashlib import sha256
 from http import HTTPStatus
 from logging import getLogger
@@ -18,8 +19,11 @@ from prometheus_client import Counter
 from packit_service.celerizer import celery_app
 from packit_service.config import ServiceConfig
 from packit_service.constants import CELERY_DEFAULT_MAIN_TASK_NAME, GITLAB_ISSUE
+from packit_service.event_archive import record_event
+from packit_service.forge_cache import invalidate_on_github_event
 from packit_service.models import ProjectAuthenticationIssueModel
 from packit_service.service.api.errors import ValidationFailed
+from packit_service.tracing import new_trace
 
 logger = getLogger("packit_service")
 config = ServiceConfig.get_service_config()
@@ -67,6 +71,7 @@ class GithubWebhook(Resource):
         """
         A webhook used by Packit-as-a-Service GitHub App.
         """
+        trace = new_trace()
         msg = request.json
 
         if not msg:
@@ -88,15 +93,19 @@ class GithubWebhook(Resource):
             ).inc()
             return str(exc), HTTPStatus.UNAUTHORIZED
 
+        invalidate_on_github_event(request.headers.get("X-GitHub-Event"), msg)
+
         if not self.interested():
             github_webhook_calls.labels(
                 result="not_interested", process_id=os.getpid()
             ).inc()
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
+        record_event("github", msg)
+        trace["enqueued"] = datetime.now(timezone.utc).timestamp()
         celery_app.send_task(
             name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={"event": msg},
+            kwargs={"event": msg, "trace": trace},
         )
         github_webhook_calls.labels(result="accepted", process_id=os.getpid()).inc()
 
@@ -175,6 +184,7 @@ class GitlabWebhook(Resource):
         """
         A webhook used by Packit-as-a-Service Gitlab hook.
         """
+        trace = new_trace()
         msg = request.json
 
         if not msg:
@@ -194,9 +204,11 @@ class GitlabWebhook(Resource):
         if not self.interested():
             return "Thanks but we don't care about this event", HTTPStatus.ACCEPTED
 
+        record_event("gitlab", msg)
+        trace["enqueued"] = datetime.now(timezone.utc).timestamp()
         celery_app.send_task(
             name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME,
-            kwargs={"event": msg},
+            kwargs={"event": msg, "trace": trace},
         )
 
         return "Webhook accepted. We thank you, Gitlab.", HTTPStatus.ACCEPTED
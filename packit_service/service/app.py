@@ -5,7 +5,7 @@ import logging
 from os import getenv
 from socket import gaierror
 
-from flask import Flask
+from flask import Flask, g, request
 
 # Mypy errors out with Module 'flask' has no attribute '__version__'.
 # Python can find flask's version but mypy cannot.
@@ -13,16 +13,18 @@ from flask import Flask
 from flask import __version__ as flask_version  # type: ignore
 from flask_restx import __version__ as restx_version
 from lazy_object_proxy import Proxy
-from prometheus_client import make_wsgi_app as prometheus_app
+from prometheus_client import REGISTRY, make_wsgi_app as prometheus_app
 from syslog_rfc5424_formatter import RFC5424Formatter
 from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
 from packit.utils import set_logging
 from packit_service import __version__ as ps_version
 from packit_service.config import ServiceConfig
+from packit_service.query_profiler import start_profiling, stop_profiling
 from packit_service.sentry_integration import configure_sentry
 from packit_service.service.api import blueprint
 from packit_service.utils import log_package_versions
+from packit_service.metrics import db_queries, db_queries_duration
 
 set_logging(logger_name="packit_service", level=logging.DEBUG)
 
@@ -71,6 +73,15 @@ def get_flask_application():
     ]
     log_package_versions(package_versions)
 
+    @app.before_request
+    def start_query_profiling():
+        g.query_profiling = start_profiling("request", request.endpoint or "unknown")
+
+    @app.teardown_request
+    def stop_query_profiling(exception):
+        if token := g.pop("query_profiling", None):
+            stop_profiling(token)
+
     # no need to thank me, just buy me a beer
     logger.debug(f"URL map = {app.url_map}")
     return app
@@ -78,6 +89,8 @@ def get_flask_application():
 
 packit_as_a_service = Proxy(get_flask_application)
 
+REGISTRY.register(db_queries)
+REGISTRY.register(db_queries_duration)
 # Make Prometheus Client serve the /metrics endpoint
 application = DispatcherMiddleware(packit_as_a_service, {"/metrics": prometheus_app()})
 
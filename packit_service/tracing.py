@@ -0,0 +1,117 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Lifecycle ledger of the events: times the stages of the processing of an event
+(see `EventStage`) were reached are stored in the DB.
+
+An event gets its trace ID when it's received by the webhook. The trace
+(the ID and the times of the receipt and enqueuing) is passed along with
+the event to the `process_message` task, the ID then travels in the dicts
+of the event to the handler tasks. Later events about the submitted builds
+and test runs (e.g. from Copr or Testing Farm) don't carry it, they find it
+in the shared cache by the ID of the build/test run.
+
+Only the events with a trace are recorded. Failing to record a stage
+never affects the processing of the event, it's just logged.
+"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+from uuid import uuid4
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from packit_service.cache import CACHE_KEY_PREFIX, get_shared_cache
+from packit_service.constants import DEFAULT_JOB_TIMEOUT
+from packit_service.models import EventStage, EventStageTimeModel
+
+logger = logging.getLogger(__name__)
+
+TRACE_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:trace"
+
+_current_trace_id: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+
+
+def new_trace() -> dict:
+    """Trace of a just received event, to be passed to `process_message`."""
+    return {"id": uuid4().hex, "received": datetime.now(timezone.utc).timestamp()}
+
+
+def get_trace_id() -> Optional[str]:
+    """Trace ID of the event being processed."""
+    return _current_trace_id.get()
+
+
+@contextmanager
+def traced(trace_id: Optional[str]) -> Iterator[None]:
+    """Process the event with the given trace ID within the context."""
+    token = _current_trace_id.set(trace_id)
+    try:
+        yield
+    finally:
+        _current_trace_id.reset(token)
+
+
+def record_stages(trace_id: Optional[str], times: Dict[EventStage, datetime]) -> None:
+    """Record the (timezone-aware) times the stages of the event were reached."""
+    if not trace_id:
+        return
+    try:
+        EventStageTimeModel.add(
+            trace_id,
+            {
+                stage: time.astimezone(timezone.utc).replace(tzinfo=None)
+                for stage, time in times.items()
+            },
+        )
+    except SQLAlchemyError as ex:
+        logger.warning(f"Failed to record the stages of event {trace_id}: {ex!r}")
+
+
+def record_stage(
+    stage: EventStage,
+    time: Optional[datetime] = None,
+    trace_id: Optional[str] = None,
+) -> None:
+    """Record the stage of the event being processed (or the given one) reached."""
+    record_stages(
+        trace_id or get_trace_id(), {stage: time or datetime.now(timezone.utc)}
+    )
+
+
+def _get_key(reference: str) -> str:
+    return f"{TRACE_KEY_PREFIX}:{reference}"
+
+
+def record_submission(reference: str) -> None:
+    """
+    Record the submission of a build/test run for the event being processed.
+
+    Args:
+        reference: Identifies the build/test run in the later events,
+            e.g. `copr-build:<build ID>`.
+    """
+    if not (trace_id := get_trace_id()):
+        return
+    get_shared_cache().set(_get_key(reference), trace_id, DEFAULT_JOB_TIMEOUT)
+    record_stage(EventStage.submitted, trace_id=trace_id)
+
+
+def record_referenced_stage(
+    reference: str, stage: EventStage, time: Optional[datetime] = None
+) -> None:
+    """
+    Record the stage reached for the event the build/test run was submitted for.
+
+    Args:
+        reference: Reference of the build/test run used when recording
+            its submission.
+        stage: Stage reached.
+        time: Time the stage was reached, now if not given.
+    """
+    if trace_id := get_shared_cache().get(_get_key(reference)):
+        record_stage(stage, time=time, trace_id=trace_id)
@@ -2,10 +2,17 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from io import StringIO
 from logging import StreamHandler
-from typing import List, Tuple
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import git
 
 from packit.config import JobConfig, PackageConfig
 from packit.schema import JobConfigSchema, PackageConfigSchema
@@ -93,6 +100,7 @@ def log_package_versions(package_versions: List[Tuple[str, str]]):
 # https://stackoverflow.com/a/41215655/14294700
 def gather_packit_logs_to_buffer(
     logging_level: LoggingLevel,
+    current_thread_only: bool = False,
 ) -> Tuple[StringIO, StreamHandler]:
     """
     Redirect packit logs into buffer with a given logging level to collect them later.
@@ -101,6 +109,8 @@ def gather_packit_logs_to_buffer(
 
     Args:
         logging_level: Logs with this logging level will be collected.
+        current_thread_only: Collect only the logs of the calling thread,
+            used when more jobs are run in parallel threads.
 
     Returns:
         A tuple of values which you have to pass them to `collect_packit_logs()` function later.
@@ -115,6 +125,9 @@ def gather_packit_logs_to_buffer(
     packit_logger.setLevel(logging_level)
     packit_logger.addHandler(handler)
     handler.setFormatter(PackitFormatter())
+    if current_thread_only:
+        thread_id = threading.get_ident()
+        handler.addFilter(lambda record: record.thread == thread_id)
     return buffer, handler
 
 
@@ -203,3 +216,29 @@ def get_packit_commands_from_comment(
             return packit_command
 
     return []
+
+
+@contextmanager
+def git_worktree(repo: git.Repo, name: str, prefix: str = "packit-") -> Iterator[Path]:
+    """
+    Temporary (detached) worktree of the repository.
+
+    Worktrees share the object store of the repository, so more refs
+    can be worked with at the same time without cloning the repository again.
+
+    Args:
+        repo: Repository to create the worktree of.
+        name: Name of the worktree directory (created in a new temporary directory).
+        prefix: Prefix of the temporary directory.
+
+    Returns:
+        Path to the worktree, removed when leaving the context.
+    """
+    parent = Path(tempfile.mkdtemp(prefix=prefix))
+    path = parent / name
+    repo.git.worktree("add", "--detach", str(path))
+    try:
+        yield path
+    finally:
+        repo.git.worktree("remove", "--force", str(path))
+        shutil.rmtree(parent, ignore_errors=True)
@@ -5,16 +5,12 @@ import logging
 from typing import Any, Iterable, Optional, Union, Callable, List, Tuple, Dict, Type
 from urllib.parse import urlparse
 
-from fasjson_client import Client
-from fasjson_client.errors import APIError
-
 from ogr.abstract import GitProject
-from packit.api import PackitAPI
 from packit.config.job_config import JobConfig, JobType
-from packit.exceptions import PackitException, PackitCommandFailedError
+from packit.exceptions import PackitException
+from packit_service import forge_cache
 from packit_service.config import ServiceConfig
 from packit_service.constants import (
-    FASJSON_URL,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_DESCRIPTION,
     NAMESPACE_NOT_ALLOWED_MARKDOWN_ISSUE_INSTRUCTIONS,
     NOTIFICATION_REPO,
@@ -22,6 +18,7 @@ from packit_service.constants import (
     DENIED_MSG,
 )
 from packit_service.models import AllowlistModel, AllowlistStatus
+from packit_service.worker.helpers.fas import FASJSON_ERRORS, get_fas_user
 from packit_service.worker.events import (
     EventData,
     AbstractCoprBuildEvent,
@@ -85,25 +82,6 @@ class Allowlist:
             return None
         return url.split("://")[1] + ".git"
 
-    def init_kerberos_ticket(self):
-        """
-        Try to init kerberos ticket.
-
-        Returns:
-            Whether the initialisation was successful.
-        """
-        try:
-            logger.debug("Initialising Kerberos ticket so that we can use fasjson API.")
-            PackitAPI(
-                config=self.service_config, package_config=None
-            ).init_kerberos_ticket()
-        except PackitCommandFailedError as ex:
-            msg = f"Kerberos authentication error: {ex.stderr_output}"
-            logger.error(msg)
-            return False
-
-        return True
-
     def is_github_username_from_fas_account_matching(self, fas_account, sender_login):
         """
         Compares the Github username from the FAS account
@@ -115,24 +93,23 @@ class Allowlist:
                             against info from FAS.
 
         Returns:
-            True if there was a match found. False if we were not able to run kinit or
-            the check for match was not successful.
+            True if there was a match found. False if we were not able to get
+            the FAS account or the check for match was not successful.
         """
-        if not self.init_kerberos_ticket():
-            return False
-
         logger.info(
             f"Going to check match for Github username from FAS account {fas_account} and"
             f" Github account {sender_login}."
         )
-        client = Client(FASJSON_URL)
         try:
-            user_info = client.get_user(username=fas_account).result
-        # e.g. User not found
-        except APIError as e:
+            user_info = get_fas_user(username=fas_account)
+        except FASJSON_ERRORS as e:
             logger.debug(f"We were not able to get the user: {e}")
             return False
 
+        if user_info is None:
+            logger.debug(f"FAS account {fas_account} not found.")
+            return False
+
         is_private = user_info.get("is_private")
         if is_private:
             logger.debug("The account is private.")
@@ -343,7 +320,7 @@ class Allowlist:
         else:
             namespace_approved = self.is_namespace_or_parent_approved(project_url)
             user_approved = (
-                project.can_merge_pr(actor_name)
+                forge_cache.can_merge_pr(project, actor_name)
                 or project.get_pr(event.pr_id).author == actor_name
             )
             # TODO: clear failing check when present
@@ -438,7 +415,7 @@ class Allowlist:
             msg = f"{project_url} or parent namespaces denied!"
         else:
             namespace_approved = self.is_namespace_or_parent_approved(project_url)
-            user_approved = project.can_merge_pr(actor_name)
+            user_approved = forge_cache.can_merge_pr(project, actor_name)
             # TODO: clear failing check when present
             if namespace_approved and user_approved:
                 return True
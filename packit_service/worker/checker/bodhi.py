@@ -5,6 +5,7 @@ import logging
 
 from packit.config.aliases import get_branches
 
+from packit_service import forge_cache
 from packit_service.constants import KojiBuildState, MSG_GET_IN_TOUCH
 
 from packit_service.worker.checker.abstract import (
@@ -89,7 +90,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker, ConfigFromEventMixi
     """
 
     def _pre_check(self) -> bool:
-        has_write_access = self.project.has_write_access(user=self.actor)
+        has_write_access = forge_cache.has_write_access(self.project, self.actor)
         if self.data.event_type in (
             IssueCommentEvent.__name__,
             IssueCommentGitlabEvent.__name__,
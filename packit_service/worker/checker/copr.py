@@ -3,6 +3,7 @@
 
 import logging
 
+from packit_service import forge_cache
 from packit_service.constants import (
     INTERNAL_TF_BUILDS_AND_TESTS_NOT_ALLOWED,
 )
@@ -96,7 +97,7 @@ class CanActorRunTestsJob(ActorChecker, GetCoprBuildJobHelperMixin):
                 test_job
                 and test_job.use_internal_tf
                 and not test_job.skip_build
-                and not self.project.can_merge_pr(self.actor)
+                and not forge_cache.can_merge_pr(self.project, self.actor)
                 and self.actor not in self.service_config.admins
             ):
                 self.copr_build_helper.report_status_to_build(
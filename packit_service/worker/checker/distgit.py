@@ -5,6 +5,7 @@ import logging
 
 from packit.config.aliases import get_branches
 
+from packit_service import forge_cache
 from packit_service.constants import MSG_GET_IN_TOUCH
 
 from packit_service.worker.checker.abstract import Checker, ActorChecker
@@ -102,7 +103,7 @@ class HasIssueCommenterRetriggeringPermissions(ActorChecker):
                 f"repo {self.project.repo} and issue {self.data.issue_id} "
                 f"by {self.actor}."
             )
-            if not self.project.has_write_access(user=self.actor):
+            if not forge_cache.has_write_access(self.project, self.actor):
                 msg = (
                     f"Re-triggering downstream koji-build through comment in "
                     f"repo **{self.project_url}** and issue **{self.data.issue_id}** "
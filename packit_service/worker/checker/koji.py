@@ -3,6 +3,7 @@
 
 import logging
 
+from packit_service import forge_cache
 from packit_service.constants import (
     KOJI_PRODUCTION_BUILDS_ISSUE,
     PERMISSIONS_ERROR_WRITE_OR_ADMIN,
@@ -37,7 +38,7 @@ class PermissionOnKoji(Checker, GetKojiBuildJobHelperMixin):
             PullRequestGithubEvent.__name__,
             MergeRequestGitlabEvent.__name__,
         ):
-            user_can_merge_pr = self.project.can_merge_pr(self.data.actor)
+            user_can_merge_pr = forge_cache.can_merge_pr(self.project, self.data.actor)
             if not (user_can_merge_pr or self.data.actor in self.service_config.admins):
                 self.koji_build_helper.report_status_to_all(
                     description=PERMISSIONS_ERROR_WRITE_OR_ADMIN,
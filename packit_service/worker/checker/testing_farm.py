@@ -3,6 +3,7 @@
 
 import logging
 
+from packit_service import forge_cache
 from packit_service.constants import (
     INTERNAL_TF_BUILDS_AND_TESTS_NOT_ALLOWED,
     INTERNAL_TF_TESTS_NOT_ALLOWED,
@@ -81,7 +82,7 @@ class CanActorRunJob(ActorChecker, GetTestingFarmJobHelperMixin):
         )
         if (
             (self.job_config.use_internal_tf or any_internal_test_job_build_required)
-            and not self.project.can_merge_pr(self.actor)
+            and not forge_cache.can_merge_pr(self.project, self.actor)
             and self.actor not in self.service_config.admins
         ):
             message = (
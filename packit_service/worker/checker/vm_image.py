@@ -3,6 +3,7 @@
 
 import logging
 
+from packit_service import forge_cache
 from packit_service.models import CoprBuildTargetModel, BuildStatus
 from packit_service.worker.checker.abstract import Checker, ActorChecker
 from packit_service.worker.mixin import (
@@ -111,7 +112,7 @@ class HasAuthorWriteAccess(
     ActorChecker, ConfigFromEventMixin, GetVMImageBuildReporterFromJobHelperMixin
 ):
     def _pre_check(self) -> bool:
-        if not self.project.has_write_access(user=self.actor):
+        if not forge_cache.has_write_access(self.project, self.actor):
             msg = (
                 f"User {self.actor} is not allowed to build a VM Image "
                 f"for PR#{self.data.pr_id} and "
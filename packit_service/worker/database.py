@@ -1,7 +1,7 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import timedelta
+from datetime import date, timedelta
 from gzip import open as gzip_open
 from logging import getLogger, DEBUG, INFO
 from os import getenv
@@ -11,9 +11,29 @@ from shutil import copyfileobj
 from boto3 import client as boto3_client
 from botocore.exceptions import ClientError
 
+from ogr.abstract import IssueStatus
+
 from packit.utils.commands import run_command
-from packit_service.constants import SRPMBUILDS_OUTDATED_AFTER_DAYS
-from packit_service.models import get_pg_url, SRPMBuildModel
+from packit_service.cache import refresh_shared_cache
+from packit_service.config import ServiceConfig
+from packit_service.constants import (
+    EVENT_STAGE_TIMES_OUTDATED_AFTER_DAYS,
+    SRPMBUILDS_OUTDATED_AFTER_DAYS,
+    USAGE_STATISTICS_REFRESHED_PERIODS_DAYS,
+)
+from packit_service.models import (
+    CoprBuildGroupModel,
+    EventStageTimeModel,
+    GitProjectModel,
+    JobTriggerModelType,
+    KojiBuildGroupModel,
+    PackitIssueModel,
+    SRPMBuildModel,
+    SyncReleaseModel,
+    TFTTestRunGroupModel,
+    VMImageBuildTargetModel,
+    get_pg_url,
+)
 
 logger = getLogger(__name__)
 
@@ -36,6 +56,100 @@ def discard_old_srpm_build_logs():
         build.set_url(None)
 
 
+def discard_old_event_stage_times():
+    """
+    Called periodically (see celery_config.py) to delete the times
+    of the stages of old events (shown by the /api/latency endpoint).
+    """
+    outdated_after_days = getenv(
+        "EVENT_STAGE_TIMES_OUTDATED_AFTER_DAYS", EVENT_STAGE_TIMES_OUTDATED_AFTER_DAYS
+    )
+    ago = timedelta(days=int(outdated_after_days))
+    deleted = EventStageTimeModel.delete_older_than(ago)
+    logger.info(f"Deleted {deleted} times of the stages of events older than '{ago}'.")
+
+
+def refresh_usage_statistics():
+    """
+    Called periodically (see celery_config.py) to compute the usage statistics
+    (shown by the /api/usage endpoints) again and store them in the shared cache
+    before the cached values expire.
+
+    Statistics are computed for all time and for the last
+    USAGE_STATISTICS_REFRESHED_PERIODS_DAYS days.
+    """
+    periods = [None] + [
+        (date.today() - timedelta(days=days)).isoformat()
+        for days in USAGE_STATISTICS_REFRESHED_PERIODS_DAYS
+    ]
+    with refresh_shared_cache():
+        GitProjectModel.get_project_count()
+        GitProjectModel.get_instance_numbers()
+        for datetime_from in periods:
+            logger.info(f"Refreshing usage statistics from {datetime_from}.")
+            GitProjectModel.get_active_projects_count(datetime_from=datetime_from)
+            GitProjectModel.get_active_projects_usage_numbers(
+                datetime_from=datetime_from, top=None
+            )
+            GitProjectModel.get_instance_numbers_for_active_projects(
+                datetime_from=datetime_from
+            )
+            for trigger_type in JobTriggerModelType:
+                GitProjectModel.get_trigger_usage_count(
+                    trigger_type=trigger_type, datetime_from=datetime_from
+                )
+                GitProjectModel.get_trigger_usage_numbers(
+                    trigger_type=trigger_type, datetime_from=datetime_from, top=None
+                )
+            for job_model in [
+                SRPMBuildModel,
+                CoprBuildGroupModel,
+                KojiBuildGroupModel,
+                VMImageBuildTargetModel,
+                TFTTestRunGroupModel,
+                SyncReleaseModel,
+            ]:
+                GitProjectModel.get_job_usage_numbers_count_all_triggers(
+                    job_result_model=job_model, datetime_from=datetime_from
+                )
+                GitProjectModel.get_job_usage_numbers_all_triggers(
+                    job_result_model=job_model, datetime_from=datetime_from, top=None
+                )
+                for trigger_type in JobTriggerModelType:
+                    GitProjectModel.get_job_usage_numbers_count(
+                        job_result_model=job_model,
+                        trigger_type=trigger_type,
+                        datetime_from=datetime_from,
+                    )
+                    GitProjectModel.get_job_usage_numbers(
+                        job_result_model=job_model,
+                        trigger_type=trigger_type,
+                        datetime_from=datetime_from,
+                        top=None,
+                    )
+
+
+def reconcile_packit_issues():
+    """
+    Called periodically (see celery_config.py) to mark the recorded issues
+    opened by Packit which were closed (or removed) since.
+    """
+    service_config = ServiceConfig.get_service_config()
+    for packit_issue in PackitIssueModel.get_all_open():
+        project_url = packit_issue.project.project_url
+        try:
+            project = service_config.get_project(url=project_url)
+            closed = project.get_issue(packit_issue.issue_id).status != IssueStatus.open
+        except Exception as ex:
+            logger.warning(
+                f"Failed to get issue {packit_issue.issue_id} of {project_url}: {ex}"
+            )
+            continue
+        if closed:
+            logger.debug(f"Issue {packit_issue.issue_id} of {project_url} is closed.")
+            packit_issue.set_closed()
+
+
 def gzip_file(file: Path) -> Path:
     """Gzip compress given file into {file}.gz
 
@@ -21,7 +21,7 @@ from packit_service.models import (
     ProjectReleaseModel,
     PullRequestModel,
     TFTTestRunTargetModel,
-    filter_most_recent_target_names_by_status,
+    get_most_recent_targets_by_commit,
 )
 
 logger = getLogger(__name__)
@@ -75,6 +75,7 @@ class EventData:
         build_targets_override: Optional[List[str]],
         tests_targets_override: Optional[List[str]],
         branches_override: Optional[List[str]],
+        trace_id: Optional[str] = None,
     ):
         self.event_type = event_type
         self.actor = actor
@@ -95,6 +96,7 @@ class EventData:
             set(tests_targets_override) if tests_targets_override else None
         )
         self.branches_override = set(branches_override) if branches_override else None
+        self.trace_id = trace_id
 
         # lazy attributes
         self._project = None
@@ -122,6 +124,7 @@ class EventData:
         build_targets_override = event.get("build_targets_override")
         tests_targets_override = event.get("tests_targets_override")
         branches_override = event.get("branches_override")
+        trace_id = event.get("trace_id")
 
         return EventData(
             event_type=event_type,
@@ -139,6 +142,7 @@ class EventData:
             build_targets_override=build_targets_override,
             tests_targets_override=tests_targets_override,
             branches_override=branches_override,
+            trace_id=trace_id,
         )
 
     @property
@@ -238,6 +242,8 @@ class EventData:
 
 class Event:
     task_accepted_time: Optional[datetime] = None
+    # ID of the trace of the event, set only for the traced events
+    trace_id: Optional[str] = None
     actor: Optional[str]
 
     def __init__(self, created_at: Union[int, float, str] = None):
@@ -472,12 +478,12 @@ class AbstractForgeIndependentEvent(Event):
         logger.debug(
             f"Getting failed Testing Farm targets for commit sha: {self.commit_sha}"
         )
-        return filter_most_recent_target_names_by_status(
-            models=TFTTestRunTargetModel.get_all_by_commit_target(
-                commit_sha=self.commit_sha
-            ),
+        models = get_most_recent_targets_by_commit(
+            model_type=TFTTestRunTargetModel,
+            commit_sha=self.commit_sha,
             statuses_to_filter_with=statuses_to_filter_with,
         )
+        return {model.target for model in models} if models else None
 
     def get_all_build_targets_by_status(
         self, statuses_to_filter_with: List[str]
@@ -488,7 +494,9 @@ class AbstractForgeIndependentEvent(Event):
         logger.debug(
             f"Getting failed COPR build targets for commit sha: {self.commit_sha}"
         )
-        return filter_most_recent_target_names_by_status(
-            models=CoprBuildTargetModel.get_all_by_commit(commit_sha=self.commit_sha),
+        models = get_most_recent_targets_by_commit(
+            model_type=CoprBuildTargetModel,
+            commit_sha=self.commit_sha,
             statuses_to_filter_with=statuses_to_filter_with,
         )
+        return {model.target for model in models} if models else None
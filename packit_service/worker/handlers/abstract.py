@@ -24,6 +24,7 @@ from packit_service.models import (
     AbstractTriggerDbType,
 )
 from packit_service.sentry_integration import push_scope_to_sentry
+from packit_service.tracing import traced
 from packit_service.utils import dump_job_config, dump_package_config
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.events import Event, EventData
@@ -306,7 +307,8 @@ class JobHandler(Handler):
         job_results: Dict[str, TaskResults] = {}
         current_time = datetime.now().strftime(DATETIME_FORMAT)
         result_key = f"{job_type}-{current_time}"
-        job_results[result_key] = self.run_n_clean()
+        with traced(self.data.trace_id):
+            job_results[result_key] = self.run_n_clean()
         logger.debug("Job finished!")
 
         for result in job_results.values():
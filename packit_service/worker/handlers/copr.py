@@ -22,8 +22,10 @@ from packit_service.constants import (
 from packit_service.models import (
     CoprBuildTargetModel,
     BuildStatus,
+    EventStage,
 )
 from packit_service.service.urls import get_copr_build_info_url, get_srpm_build_info_url
+from packit_service.tracing import record_referenced_stage
 from packit_service.utils import (
     dump_job_config,
     dump_package_config,
@@ -252,6 +254,14 @@ class CoprBuildEndHandler(AbstractCoprBuildReportHandler):
 
         self.pushgateway.copr_build_end_reported_after_time.observe(reported_after_time)
 
+        reference = f"copr-build:{self.build.build_id}"
+        record_referenced_stage(
+            reference,
+            EventStage.finished,
+            time=datetime.fromtimestamp(build_ended_on, timezone.utc),
+        )
+        record_referenced_stage(reference, EventStage.reported, time=reported_time)
+
     def set_built_packages(self):
         if self.build.built_packages:
             # packages have been already set
@@ -7,19 +7,25 @@ This file defines classes for job handlers specific for distgit
 import logging
 import shutil
 import abc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from typing import Optional, Tuple, Type, List, Callable
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Iterator, Optional, Tuple, Type, List, Callable
 
-from celery import Task
+from celery import Task, signature
 from ogr.abstract import PullRequest, AuthMethod
 from ogr.services.github import GithubService
 
+from packit.api import PackitAPI
 from packit.config import JobConfig, JobType
 from packit.config.package_config import PackageConfig
 from packit.exceptions import PackitException, PackitDownloadFailedException
+from packit.local_project import LocalProject
 from packit_service import sentry_integration
-from packit_service.config import PackageConfigGetter
 from packit_service.constants import (
+    ARCHIVE_WATCHER_RETRY_BACKOFF,
     CONTACTS_URL,
     MSG_RETRIGGER,
     MSG_GET_IN_TOUCH,
@@ -36,7 +42,11 @@ from packit_service.service.urls import (
     get_propose_downstream_info_url,
     get_pull_from_upstream_info_url,
 )
-from packit_service.utils import gather_packit_logs_to_buffer, collect_packit_logs
+from packit_service.utils import (
+    collect_packit_logs,
+    gather_packit_logs_to_buffer,
+    git_worktree,
+)
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.checker.distgit import (
     IsProjectOk,
@@ -65,6 +75,9 @@ from packit_service.worker.handlers.abstract import (
     RetriableJobHandler,
 )
 from packit_service.worker.handlers.mixin import GetProjectToSyncMixin
+from packit_service.worker.helpers.sync_release.archive import (
+    get_failed_download_url,
+)
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
@@ -82,7 +95,11 @@ from packit_service.worker.mixin import (
     PackitAPIWithUpstreamMixin,
     PackitAPIWithDownstreamMixin,
 )
-from packit_service.worker.reporting import BaseCommitStatus, report_in_issue_repository
+from packit_service.worker.reporting import (
+    BaseCommitStatus,
+    create_issue_if_needed,
+    report_in_issue_repository,
+)
 from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
@@ -203,46 +220,82 @@ class AbstractSyncReleaseHandler(
             )
         return self.helper
 
+    def _sync_release(
+        self, packit_api: PackitAPI, branch: str
+    ) -> Optional[PullRequest]:
+        branch_suffix = f"update-{self.sync_release_job_type.value}"
+        is_pull_from_upstream_job = (
+            self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
+        )
+        return packit_api.sync_release(
+            dist_git_branch=branch,
+            tag=self.data.tag_name,
+            create_pr=True,
+            local_pr_branch_suffix=branch_suffix,
+            use_downstream_specfile=is_pull_from_upstream_job,
+            sync_default_files=not is_pull_from_upstream_job,
+        )
+
+    def _retry_when_archive_is_available(
+        self, ex: PackitDownloadFailedException, model: SyncReleaseModel
+    ) -> None:
+        """
+        The archive has not been uploaded (e.g. to PyPI) yet, the task is run
+        again once the archive is available (checked by a lightweight task),
+        or retried later if the URL of the archive is not known.
+
+        Raises:
+            AbortSyncRelease: When the task is going to be retried.
+            PackitDownloadFailedException: When this was the last try.
+        """
+        logger.info(f"We were not able to download the archive: {ex}")
+        # when the task hits max_retries, it raises MaxRetriesExceededError
+        # and the error handling code would be never executed
+        retries = self.celery_task.retries
+        if not self.celery_task.is_last_try():
+            kargs = self.celery_task.task.request.kwargs.copy()
+            kargs["sync_release_run_id"] = model.id
+
+            if url := get_failed_download_url(ex):
+                # cheap requests for the archive instead of cloning
+                # and preparing everything again in each retry
+                logger.info(
+                    f"Will wait for {url} to become available "
+                    f"with sync_release_run_id {model.id}."
+                )
+                signature(
+                    "task.wait_for_upstream_archive",
+                    kwargs={
+                        "url": url,
+                        "task_name": self.celery_task.task.name,
+                        "task_kwargs": kargs,
+                        "task_retries": retries + 1,
+                    },
+                ).apply_async(countdown=ARCHIVE_WATCHER_RETRY_BACKOFF)
+                raise AbortSyncRelease()
+
+            # will retry in: 1m and then again in another 2m
+            delay = 60 * 2**retries
+            logger.info(
+                f"Will retry for the {retries + 1}. time in {delay}s \
+                    with sync_release_run_id {model.id}."
+            )
+            # throw=False so that exception is not raised and task
+            # is not retried also automatically
+            # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
+            self.celery_task.task.retry(
+                exc=ex, countdown=delay, throw=False, args=(), kwargs=kargs
+            )
+            raise AbortSyncRelease()
+        raise ex
+
     def sync_branch(
         self, branch: str, model: SyncReleaseModel
     ) -> Optional[PullRequest]:
         try:
-            branch_suffix = f"update-{self.sync_release_job_type.value}"
-            is_pull_from_upstream_job = (
-                self.sync_release_job_type == SyncReleaseJobType.pull_from_upstream
-            )
-            downstream_pr = self.packit_api.sync_release(
-                dist_git_branch=branch,
-                tag=self.data.tag_name,
-                create_pr=True,
-                local_pr_branch_suffix=branch_suffix,
-                use_downstream_specfile=is_pull_from_upstream_job,
-                sync_default_files=not is_pull_from_upstream_job,
-            )
+            downstream_pr = self._sync_release(self.packit_api, branch)
         except PackitDownloadFailedException as ex:
-            # the archive has not been uploaded to PyPI yet
-            # retry for the archive to become available
-            logger.info(f"We were not able to download the archive: {ex}")
-            # when the task hits max_retries, it raises MaxRetriesExceededError
-            # and the error handling code would be never executed
-            retries = self.celery_task.retries
-            if not self.celery_task.is_last_try():
-                # will retry in: 1m and then again in another 2m
-                delay = 60 * 2**retries
-                logger.info(
-                    f"Will retry for the {retries + 1}. time in {delay}s \
-                        with sync_release_run_id {model.id}."
-                )
-                # throw=False so that exception is not raised and task
-                # is not retried also automatically
-                kargs = self.celery_task.task.request.kwargs.copy()
-                kargs["sync_release_run_id"] = model.id
-                # https://docs.celeryq.dev/en/stable/userguide/tasks.html#retrying
-                self.celery_task.task.retry(
-                    exc=ex, countdown=delay, throw=False, args=(), kwargs=kargs
-                )
-                raise AbortSyncRelease()
-            raise ex
+            self._retry_when_archive_is_available(ex, model)
         finally:
             self.packit_api.up.local_project.git_repo.head.reset(
                 "HEAD", index=True, working_tree=True
@@ -270,21 +323,13 @@ class AbstractSyncReleaseHandler(
 
         return sync_release_model
 
-    def run_for_target(
-        self, sync_release_run_model: SyncReleaseModel, model: SyncReleaseTargetModel
-    ) -> Optional[str]:
+    def _start_target(self, model: SyncReleaseTargetModel) -> bool:
         """
-        Run sync-release for the single target specified by the given model.
-
-        Args:
-            sync_release_run_model: Model for the whole sync release run.
-            model: Model for the single target that is to be executed.
+        Mark the target as running and report it.
 
         Returns:
-            String representation of the exception, if occurs.
-
-        Raises:
-            AbortSyncRelease: In case the archives cannot be downloaded.
+            Whether the target is to be run, targets already processed
+            (even if they failed) are skipped.
         """
         branch = model.branch
 
@@ -298,62 +343,250 @@ class AbstractSyncReleaseHandler(
                 f"Skipping {self.sync_release_job_type} for branch {branch} "
                 f"that was already processed."
             )
-            return None
+            return False
 
         logger.debug(f"Running {self.sync_release_job_type} for {branch}")
         model.set_status(status=SyncReleaseTargetStatus.running)
-        # for now the url is used only for propose-downstream
-        # so it does not matter URL may not be valid for pull-from-upstream
-        url = get_propose_downstream_info_url(model.id)
-        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
-
         model.set_start_time(start_time=datetime.utcnow())
         self.sync_release_helper.report_status_for_branch(
             branch=branch,
             description=f"Starting {self.job_name_for_reporting}...",
             state=BaseCommitStatus.running,
-            url=url,
+            # for now the url is used only for propose-downstream
+            # so it does not matter URL may not be valid for pull-from-upstream
+            url=get_propose_downstream_info_url(model.id),
+        )
+        return True
+
+    def _report_target_failure(
+        self, model: SyncReleaseTargetModel, ex: Exception
+    ) -> str:
+        logger.debug(f"{self.sync_release_job_type} failed: {ex}")
+        # make sure exception message is propagated to the logs
+        logging.getLogger("packit").error(str(ex))
+        # eat the exception and continue with the execution
+        self.sync_release_helper.report_status_for_branch(
+            branch=model.branch,
+            description=f"{self.job_name_for_reporting.capitalize()} failed: {ex}",
+            state=BaseCommitStatus.failure,
+            url=get_propose_downstream_info_url(model.id),
+        )
+        model.set_status(status=SyncReleaseTargetStatus.error)
+        sentry_integration.send_to_sentry(ex)
+
+        return str(ex)
+
+    def _report_target_success(
+        self, model: SyncReleaseTargetModel, downstream_pr: PullRequest
+    ) -> None:
+        logger.debug("Downstream PR created successfully.")
+        model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
+        self.sync_release_helper.report_status_for_branch(
+            branch=model.branch,
+            description=f"{self.job_name_for_reporting.capitalize()} "
+            f"finished successfully.",
+            state=BaseCommitStatus.success,
+            url=get_propose_downstream_info_url(model.id),
         )
+        model.set_status(status=SyncReleaseTargetStatus.submitted)
 
+    def run_for_target(
+        self, sync_release_run_model: SyncReleaseModel, model: SyncReleaseTargetModel
+    ) -> Optional[str]:
+        """
+        Run sync-release for the single target specified by the given model.
+
+        Args:
+            sync_release_run_model: Model for the whole sync release run.
+            model: Model for the single target that is to be executed.
+
+        Returns:
+            String representation of the exception, if occurs.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        if not self._start_target(model):
+            return None
+
+        buffer, handler = gather_packit_logs_to_buffer(logging_level=logging.DEBUG)
         try:
             downstream_pr = self.sync_branch(
-                branch=branch, model=sync_release_run_model
+                branch=model.branch, model=sync_release_run_model
             )
-            logger.debug("Downstream PR created successfully.")
-            model.set_downstream_pr_url(downstream_pr_url=downstream_pr.url)
         except AbortSyncRelease:
             raise
         except Exception as ex:
-            logger.debug(f"{self.sync_release_job_type} failed: {ex}")
-            # make sure exception message is propagated to the logs
-            logging.getLogger("packit").error(str(ex))
-            # eat the exception and continue with the execution
-            self.sync_release_helper.report_status_for_branch(
-                branch=branch,
-                description=f"{self.job_name_for_reporting.capitalize()} failed: {ex}",
-                state=BaseCommitStatus.failure,
-                url=url,
-            )
-            model.set_status(status=SyncReleaseTargetStatus.error)
-            sentry_integration.send_to_sentry(ex)
-
-            return str(ex)
+            return self._report_target_failure(model, ex)
         finally:
             model.set_finished_time(finished_time=datetime.utcnow())
             model.set_logs(collect_packit_logs(buffer=buffer, handler=handler))
 
-        self.sync_release_helper.report_status_for_branch(
-            branch=branch,
-            description=f"{self.job_name_for_reporting.capitalize()} "
-            f"finished successfully.",
-            state=BaseCommitStatus.success,
-            url=url,
-        )
-        model.set_status(status=SyncReleaseTargetStatus.submitted)
+        self._report_target_success(model, downstream_pr)
 
         # no error occurred
         return None
 
+    def _add_dist_git_fork_remote(self, fork_remote_name: str = "fork") -> None:
+        """
+        Add the remote of the dist-git fork the pull requests are created from.
+
+        The remotes are shared by all the worktrees and packit would add
+        the remote in each of them, possibly at the same time.
+        """
+        local_project = self.packit_api.dg.local_project
+        if fork_remote_name in [
+            remote.name for remote in local_project.git_repo.remotes
+        ]:
+            return
+
+        fork = local_project.git_project.get_fork()
+        if not fork:
+            local_project.git_project.fork_create()
+            fork = local_project.git_project.get_fork()
+        if not fork:
+            raise PackitException(
+                "Unable to create a fork of repository "
+                f"{local_project.git_project.full_repo_name}"
+            )
+        local_project.git_repo.create_remote(
+            name=fork_remote_name, url=fork.get_git_urls()["ssh"]
+        )
+
+    @contextmanager
+    def packit_api_in_worktrees(self, branch: str) -> Iterator[PackitAPI]:
+        """
+        PackitAPI working in its own worktrees of the upstream and dist-git
+        clones, so that more branches can be synced at the same time without
+        cloning the repositories again (worktrees share the object store).
+        """
+        dist_git_repo = self.packit_api.dg.local_project.git_repo
+        with git_worktree(
+            self.packit_api.up.local_project.git_repo,
+            name="upstream",
+            prefix=f"packit-sync-release-{branch}-",
+        ) as upstream_dir, git_worktree(
+            dist_git_repo,
+            # the directory name is used as the package name if it's not configured
+            name=Path(dist_git_repo.working_dir).name,
+            prefix=f"packit-sync-release-{branch}-",
+        ) as dist_git_dir:
+            packit_api = PackitAPI(
+                self.service_config,
+                self.job_config,
+                upstream_local_project=LocalProject(
+                    working_dir=upstream_dir, git_project=self.project
+                ),
+                dist_git_clone_path=str(dist_git_dir),
+            )
+            # initialize the dist-git (and the Kerberos ticket) right away,
+            # not while running the sync-release
+            _ = packit_api.dg.local_project
+            yield packit_api
+
+    def _sync_release_in_thread(
+        self, branch: str, worktrees_lock: Lock
+    ) -> Tuple[Optional[PullRequest], Optional[Exception], str]:
+        """
+        Run sync-release for the branch in a separate thread and its own
+        worktrees (no database access is done here, the target is updated
+        by the calling thread).
+
+        Args:
+            branch: Dist-git branch to sync the release to.
+            worktrees_lock: Lock the worktrees are set up and removed under
+                (one at a time, the repositories are shared).
+
+        Returns:
+            Tuple of the downstream pull request, the exception (if raised)
+            and packit logs for the branch.
+        """
+        buffer, handler = gather_packit_logs_to_buffer(
+            logging_level=logging.DEBUG, current_thread_only=True
+        )
+        worktrees = ExitStack()
+        try:
+            try:
+                with worktrees_lock:
+                    packit_api = worktrees.enter_context(
+                        self.packit_api_in_worktrees(branch)
+                    )
+                downstream_pr, error = self._sync_release(packit_api, branch), None
+            finally:
+                # git would race on the administrative files of the worktrees
+                # with the other threads setting up theirs
+                with worktrees_lock:
+                    worktrees.close()
+        except Exception as ex:
+            # make sure exception message is propagated to the logs
+            logging.getLogger("packit").error(str(ex))
+            downstream_pr, error = None, ex
+        finally:
+            logs = collect_packit_logs(buffer=buffer, handler=handler)
+
+        return downstream_pr, error, logs
+
+    def run_for_targets_in_parallel(
+        self,
+        sync_release_run_model: SyncReleaseModel,
+        models: List[SyncReleaseTargetModel],
+    ) -> Dict[str, str]:
+        """
+        Run sync-release for the targets concurrently, at most
+        `parallel_sync_release_branches` (service config) at once.
+
+        Returns:
+            Dictionary of branches and string representations
+            of the exceptions which occurred.
+
+        Raises:
+            AbortSyncRelease: In case the archives cannot be downloaded.
+        """
+        errors: Dict[str, str] = {}
+        models = [model for model in models if self._start_target(model)]
+        if not models:
+            return errors
+
+        # a branch can't be checked out in more worktrees at once
+        self.packit_api.dg.local_project.git_repo.git.checkout("--detach")
+        self._add_dist_git_fork_remote()
+
+        download_failed: Optional[PackitDownloadFailedException] = None
+        worktrees_lock = Lock()
+        with ThreadPoolExecutor(
+            max_workers=self.service_config.parallel_sync_release_branches
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self._sync_release_in_thread, model.branch, worktrees_lock
+                ): model
+                for model in models
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                model = futures[future]
+                downstream_pr, error, logs = future.result()
+                model.set_finished_time(finished_time=datetime.utcnow())
+                model.set_logs(logs)
+
+                if isinstance(error, PackitDownloadFailedException):
+                    # don't start the other branches, but record the results
+                    # of the running ones before the task is retried
+                    for not_started in futures:
+                        not_started.cancel()
+                    download_failed = error
+                elif error:
+                    errors[model.branch] = self._report_target_failure(model, error)
+                else:
+                    self._report_target_success(model, downstream_pr)
+
+        if download_failed:
+            self._retry_when_archive_is_available(
+                download_failed, sync_release_run_model
+            )
+        return errors
+
     def run(self) -> TaskResults:
         """
         Sync the upstream release to dist-git as a pull request.
@@ -366,25 +599,52 @@ class AbstractSyncReleaseHandler(
         logger.debug(f"Branches to run {self.job_config.type}: {branches_to_run}")
 
         try:
-            for model in sync_release_run_model.sync_release_targets:
-                if error := self.run_for_target(sync_release_run_model, model):
-                    errors[model.branch] = error
+            if (
+                self.service_config.parallel_sync_release_branches > 1
+                and len(sync_release_run_model.sync_release_targets) > 1
+            ):
+                errors = self.run_for_targets_in_parallel(
+                    sync_release_run_model, sync_release_run_model.sync_release_targets
+                )
+            else:
+                for model in sync_release_run_model.sync_release_targets:
+                    if error := self.run_for_target(sync_release_run_model, model):
+                        errors[model.branch] = error
         except AbortSyncRelease:
             logger.debug(
                 f"{self.sync_release_job_type} is being retried because "
                 "we were not able yet to download the archive. "
             )
 
-            for model in sync_release_run_model.sync_release_targets:
+            # the pull requests already created (by the parallel runs)
+            # are not created again
+            retried = [
+                model
+                for model in sync_release_run_model.sync_release_targets
+                if model.status != SyncReleaseTargetStatus.submitted
+            ]
+            for model in retried:
                 model.set_status(status=SyncReleaseTargetStatus.retry)
 
-            self.sync_release_helper.report_status_to_all(
-                description=f"{self.job_name_for_reporting.capitalize()} is "
+            description = (
+                f"{self.job_name_for_reporting.capitalize()} is "
                 f"being retried because "
-                "we were not able yet to download the archive. ",
-                state=BaseCommitStatus.pending,
-                url="",
+                "we were not able yet to download the archive. "
             )
+            if len(retried) == len(sync_release_run_model.sync_release_targets):
+                self.sync_release_helper.report_status_to_all(
+                    description=description,
+                    state=BaseCommitStatus.pending,
+                    url="",
+                )
+            else:
+                for model in retried:
+                    self.sync_release_helper.report_status_for_branch(
+                        branch=model.branch,
+                        description=description,
+                        state=BaseCommitStatus.pending,
+                        url="",
+                    )
 
             return TaskResults(
                 success=True,  # do not create a Sentry issue
@@ -475,7 +735,7 @@ class ProposeDownstreamHandler(AbstractSyncReleaseHandler):
         )
         body_msg = f"{message}{msg_retrigger}\n"
 
-        PackageConfigGetter.create_issue_if_needed(
+        create_issue_if_needed(
             project=self.project,
             title=f"{self.job_name_for_reporting.capitalize()} failed for "
             f"release {self.data.tag_name}",
@@ -545,6 +805,7 @@ class AbstractDownstreamKojiBuildHandler(
         job_config: JobConfig,
         event: dict,
         celery_task: Task,
+        koji_build_branches: Optional[List[str]] = None,
     ):
         super().__init__(
             package_config=package_config,
@@ -553,6 +814,8 @@ class AbstractDownstreamKojiBuildHandler(
             celery_task=celery_task,
         )
         self.dg_branch = event.get("git_ref")
+        # branches which failed in the previous try of the task
+        self._koji_build_branches = koji_build_branches
         self._pull_request: Optional[PullRequest] = None
         self._packit_api = None
 
@@ -564,24 +827,110 @@ class AbstractDownstreamKojiBuildHandler(
     def get_branches(self) -> List[str]:
         """Get a list of branch (names) to be built in koji"""
 
-    def run(self) -> TaskResults:
+    @contextmanager
+    def packit_api_in_worktree(self, branch: str) -> Iterator[PackitAPI]:
+        """
+        PackitAPI working in its own worktree of the dist-git clone,
+        so that more branches can be built at the same time.
+        """
+        with git_worktree(
+            self.local_project.git_repo,
+            # the directory name is used as the package name if it's not configured
+            name=Path(self.local_project.working_dir).name,
+            prefix=f"packit-koji-build-{branch}-",
+        ) as dist_git_dir:
+            packit_api = PackitAPI(
+                self.service_config,
+                self.job_config,
+                downstream_local_project=LocalProject(
+                    working_dir=dist_git_dir, git_project=self.project
+                ),
+            )
+            # not in the threads submitting the builds
+            packit_api.init_kerberos_ticket()
+            yield packit_api
+
+    def submit_build(
+        self, packit_api: PackitAPI, branch: str
+    ) -> Optional[PackitException]:
+        """
+        Submit the Koji build for the branch.
+
+        Returns:
+            The exception if the build could not be submitted.
+        """
         try:
-            branch = None
-            for branch in self.get_branches():
-                self.packit_api.build(
-                    dist_git_branch=branch,
-                    scratch=self.job_config.scratch,
-                    nowait=True,
-                    from_upstream=False,
-                )
+            packit_api.build(
+                dist_git_branch=branch,
+                scratch=self.job_config.scratch,
+                nowait=True,
+                from_upstream=False,
+            )
         except PackitException as ex:
+            logger.warning(f"Koji build for {branch} could not be submitted: {ex}")
+            return ex
+        return None
+
+    def build_in_parallel(self, branches: List[str]) -> Dict[str, PackitException]:
+        """
+        Submit the Koji builds for the branches concurrently, at most
+        `parallel_koji_builds` (service config) at once, each of them
+        from its own worktree of the dist-git clone.
+
+        Returns:
+            Dictionary of branches and exceptions for the builds
+            which could not be submitted.
+        """
+        # a branch can't be checked out in more worktrees at once
+        self.local_project.git_repo.git.checkout("--detach")
+
+        with ExitStack() as worktrees, ThreadPoolExecutor(
+            max_workers=self.service_config.parallel_koji_builds
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.submit_build,
+                    worktrees.enter_context(self.packit_api_in_worktree(branch)),
+                    branch,
+                ): branch
+                for branch in branches
+            }
+            results = {
+                futures[future]: future.result() for future in as_completed(futures)
+            }
+
+        return {branch: error for branch, error in results.items() if error}
+
+    def run(self) -> TaskResults:
+        branches = self._koji_build_branches or self.get_branches()
+        if self.service_config.parallel_koji_builds > 1 and len(branches) > 1:
+            errors = self.build_in_parallel(branches)
+        else:
+            errors = {}
+            for branch in branches:
+                if error := self.submit_build(self.packit_api, branch):
+                    errors[branch] = error
+
+        if errors:
+            # the failed branches don't stop the others from being built
+            ex = next(iter(errors.values()))
             if self.celery_task and not self.celery_task.is_last_try():
                 logger.debug(
                     "Celery task will be retried. User will not be notified about the failure."
                 )
-                raise ex
+                # the builds submitted already are not submitted again
+                kargs = self.celery_task.task.request.kwargs.copy()
+                kargs["koji_build_branches"] = sorted(errors)
+                self.celery_task.retry(ex=ex, kargs=kargs)
+                return TaskResults(
+                    success=True,
+                    details={
+                        "msg": f"Koji builds for {', '.join(sorted(errors))} "
+                        "could not be submitted. Task will be retried."
+                    },
+                )
 
-            self.report_in_issue_repository(branch, ex)
+            self.report_in_issue_repository(errors)
             raise ex
 
         return TaskResults(success=True, details={})
@@ -590,11 +939,12 @@ class AbstractDownstreamKojiBuildHandler(
     def get_trigger_type_description(self) -> str:
         """Describe the user's action which triggered the Koji build"""
 
-    def report_in_issue_repository(self, branch: str, ex: PackitException) -> None:
+    def report_in_issue_repository(self, errors: Dict[str, PackitException]) -> None:
         body = MSG_DOWNSTREAM_JOB_ERROR_HEADER.format(
             object="Koji build", dist_git_url=self.packit_api.dg.local_project.git_url
         )
-        body += f"| `{branch}` | ```{ex}``` |\n"
+        for branch, ex in sorted(errors.items()):
+            body += f"| `{branch}` | ```{ex}``` |\n"
 
         msg_retrigger = MSG_RETRIGGER.format(
             job="build",
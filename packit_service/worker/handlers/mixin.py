@@ -372,18 +372,18 @@ class GetCoprBuildJobHelperForIdMixin(
 
     @property
     def copr_build_helper(self) -> CoprBuildJobHelper:
-        # when reporting state of SRPM build built in Copr
-        build_targets_override = (
-            {
-                build.target
-                for build in CoprBuildTargetModel.get_all_by_build_id(
-                    str(self.copr_event.build_id)
-                )
-            }
-            if self.copr_event.chroot == COPR_SRPM_CHROOT
-            else None
-        )
         if not self._copr_build_helper:
+            # when reporting state of SRPM build built in Copr
+            build_targets_override = (
+                {
+                    build.target
+                    for build in CoprBuildTargetModel.get_all_by_build_id(
+                        str(self.copr_event.build_id)
+                    )
+                }
+                if self.copr_event.chroot == COPR_SRPM_CHROOT
+                else None
+            )
             self._copr_build_helper = CoprBuildJobHelper(
                 service_config=self.service_config,
                 package_config=self.package_config,
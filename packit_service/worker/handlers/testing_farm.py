@@ -15,6 +15,7 @@ from packit.config import JobConfig, JobType
 from packit.config.package_config import PackageConfig
 from packit_service.models import (
     AbstractTriggerDbType,
+    EventStage,
     TFTTestRunTargetModel,
     CoprBuildTargetModel,
     BuildStatus,
@@ -26,6 +27,7 @@ from packit_service.service.urls import (
     get_testing_farm_info_url,
     get_copr_build_info_url,
 )
+from packit_service.tracing import record_referenced_stage
 from packit_service.utils import dump_job_config, dump_package_config, elapsed_seconds
 from packit_service.worker.checker.abstract import Checker
 from packit_service.worker.checker.testing_farm import (
@@ -423,6 +425,7 @@ class TestingFarmResultsHandler(
                 begin=test_run_model.submitted_time, end=datetime.now(timezone.utc)
             )
             self.pushgateway.test_run_finished_time.observe(test_run_time)
+            record_referenced_stage(f"tft:{self.pipeline_id}", EventStage.finished)
 
         test_run_model.set_web_url(self.log_url)
 
@@ -435,6 +438,8 @@ class TestingFarmResultsHandler(
             else self.log_url,
             links_to_external_services={"Testing Farm": self.log_url},
         )
+        if self.result != TestingFarmResult.running:
+            record_referenced_stage(f"tft:{self.pipeline_id}", EventStage.reported)
 
         test_run_model.set_status(self.result, created=self.created)
 
@@ -4,19 +4,20 @@
 import collections
 import logging
 from enum import Enum
-from requests import HTTPError
+from requests import HTTPError, RequestException
 from datetime import datetime, timezone
-from typing import Iterable, Type, Any
+from typing import Any, Iterable, List, Optional, Type
 
+import celery
 import copr.v3
-import requests
+from celery.canvas import Signature
 from copr.v3 import Client as CoprClient
 
 from packit_service.constants import (
+    BABYSIT_DISPATCH_BATCH_SIZE,
     COPR_API_FAIL_STATE,
     COPR_API_SUCC_STATE,
     COPR_SUCC_STATE,
-    TESTING_FARM_API_URL,
     DEFAULT_JOB_TIMEOUT,
 )
 from packit_service.models import (
@@ -30,6 +31,7 @@ from packit_service.models import (
 from packit_service.utils import elapsed_seconds
 from packit_service.worker.events import (
     AbstractCoprBuildEvent,
+    Event,
     CoprBuildStartEvent,
     CoprBuildEndEvent,
     TestingFarmResultsEvent,
@@ -43,115 +45,215 @@ from packit_service.worker.handlers import (
     TestingFarmResultsHandler,
     VMImageBuildResultHandler,
 )
+from packit_service.worker.handlers.abstract import JobHandler
 from packit_service.worker.handlers.copr import AbstractCoprBuildReportHandler
+from packit_service.worker.helpers.polling import (
+    copr_build_polling_scheduler,
+    tft_test_run_polling_scheduler,
+    to_db_time,
+    vm_image_build_polling_scheduler,
+)
+from packit_service.worker.helpers.testing_farm_client import get_testing_farm_client
 from packit_service.worker.jobs import SteveJobs
 from packit_service.worker.parser import Parser
 
 logger = logging.getLogger(__name__)
 
 
-def check_pending_testing_farm_runs() -> None:
-    """Checks the status of pending TFT runs and updates it if needed."""
-    logger.info("Getting pending TFT runs from DB")
+class HandlerTaskDispatcher:
+    """
+    Sends the tasks running the handlers for the builds/runs found completed
+    (or started) by the babysit checks to the workers, in batches.
+
+    The results are then processed in parallel by the workers
+    and the checks don't need to wait for them.
+    """
+
+    def __init__(self, batch_size: int = BABYSIT_DISPATCH_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.signatures: List[Signature] = []
+
+    def add(self, signatures: Iterable[Signature]) -> None:
+        self.signatures.extend(signatures)
+        if len(self.signatures) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.signatures:
+            return
+        logger.debug(f"Dispatching {len(self.signatures)} handler tasks.")
+        # https://docs.celeryq.dev/en/stable/userguide/canvas.html#groups
+        celery.group(self.signatures).apply_async()
+        self.signatures = []
+
+
+def get_handler_signatures(
+    event: Event, handler_kls: Type[JobHandler]
+) -> List[Signature]:
+    """
+    Signatures of the tasks running the handler for the jobs
+    matching the event (and passing the pre-check of the handler).
+    """
+    job_configs = SteveJobs(event).get_config_for_handler_kls(
+        handler_kls=handler_kls,
+    )
+
+    event_dict = event.get_dict()
+    signatures = []
+    for job_config in job_configs:
+        package_config = (
+            event.packages_config.get_package_config_for(job_config)
+            if event.packages_config
+            else None
+        )
+        # e.g. check for identifiers equality of the test jobs
+        if handler_kls.pre_check(package_config, job_config, event_dict):
+            signatures.append(handler_kls.get_signature(event=event, job=job_config))
+    return signatures
+
+
+def check_pending_testing_farm_runs(shard: int = 0, shards: int = 1) -> None:
+    """
+    Checks the status of pending TFT runs and updates it if needed.
+
+    Args:
+        shard: Index of the shard of the runs to check.
+        shards: Number of shards the runs are split into (by their ID).
+    """
+    logger.info(f"Getting pending TFT runs from DB (shard {shard + 1}/{shards})")
     current_time = datetime.now(timezone.utc)
     not_completed = (
         TestingFarmResult.new,
         TestingFarmResult.queued,
         TestingFarmResult.running,
     )
-    pending_test_runs = TFTTestRunTargetModel.get_all_by_status(*not_completed)
-    for run in pending_test_runs:
-        logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
-        # .submitted_time can be None, we'll set it later
-        if run.submitted_time:
-            elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
-            if elapsed > DEFAULT_JOB_TIMEOUT:
+    pending_test_runs = TFTTestRunTargetModel.get_all_by_status(
+        *not_completed,
+        due_before=to_db_time(current_time),
+        shard=shard,
+        shards=shards,
+    )
+    dispatcher = HandlerTaskDispatcher()
+    try:
+        for run in pending_test_runs:
+            # the deadline of the runs without any is estimated
+            if not tft_test_run_polling_scheduler.is_due(run, current_time):
+                continue
+            logger.debug(f"Checking status of TF pipeline {run.pipeline_id}")
+            # .submitted_time can be None, we'll set it later
+            if run.submitted_time:
+                elapsed = elapsed_seconds(begin=run.submitted_time, end=current_time)
+                if elapsed > DEFAULT_JOB_TIMEOUT:
+                    logger.info(
+                        f"TF pipeline {run.pipeline_id} has been running for "
+                        f"{elapsed}s, probably an internal error occurred. "
+                        "Not checking it anymore."
+                    )
+                    run.set_status(TestingFarmResult.error)
+                    continue
+            try:
+                response = get_testing_farm_client().request(
+                    endpoint=f"requests/{run.pipeline_id}"
+                )
+            except RequestException as ex:
+                # e.g. a timeout, the pipeline is checked again by the next sweep,
+                # the runs which never finish are handled by the timeout above
+                logger.info(
+                    f"Failed to obtain state of TF pipeline {run.pipeline_id}: {ex!r}"
+                )
+                continue
+            if not response.ok:
                 logger.info(
-                    f"TF pipeline {run.pipeline_id} has been running for "
-                    f"{elapsed}s, probably an internal error occurred. "
-                    "Not checking it anymore."
+                    f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
+                    f"Status code {response.status_code}. Reason: {response.reason}."
                 )
                 run.set_status(TestingFarmResult.error)
                 continue
-        run_url = f"{TESTING_FARM_API_URL}requests/{run.pipeline_id}"
-        response = requests.get(run_url)
-        if not response.ok:
-            logger.info(
-                f"Failed to obtain state of TF pipeline {run.pipeline_id}. "
-                f"Status code {response.status_code}. Reason: {response.reason}."
+
+            details = response.json()
+            (
+                project_url,
+                ref,
+                result,
+                summary,
+                copr_build_id,
+                copr_chroot,
+                compose,
+                log_url,
+                created,
+                identifier,
+            ) = Parser.parse_data_from_testing_farm(run, details)
+
+            logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
+            if result in not_completed:
+                logger.debug("Skip updating a pipeline which is not yet completed.")
+                tft_test_run_polling_scheduler.schedule(run, current_time)
+                continue
+            tft_test_run_polling_scheduler.completed(run, current_time)
+
+            event = TestingFarmResultsEvent(
+                pipeline_id=details["id"],
+                result=result,
+                compose=compose,
+                summary=summary,
+                log_url=log_url,
+                copr_build_id=copr_build_id,
+                copr_chroot=copr_chroot,
+                commit_sha=ref,
+                project_url=project_url,
+                created=created,
+                identifier=identifier,
             )
-            run.set_status(TestingFarmResult.error)
-            continue
-
-        details = response.json()
-        (
-            project_url,
-            ref,
-            result,
-            summary,
-            copr_build_id,
-            copr_chroot,
-            compose,
-            log_url,
-            created,
-            identifier,
-        ) = Parser.parse_data_from_testing_farm(run, details)
-
-        logger.debug(f"Result for the TF pipeline {run.pipeline_id} is {result}.")
-        if result in not_completed:
-            logger.debug("Skip updating a pipeline which is not yet completed.")
-            continue
-
-        event = TestingFarmResultsEvent(
-            pipeline_id=details["id"],
-            result=result,
-            compose=compose,
-            summary=summary,
-            log_url=log_url,
-            copr_build_id=copr_build_id,
-            copr_chroot=copr_chroot,
-            commit_sha=ref,
-            project_url=project_url,
-            created=created,
-            identifier=identifier,
-        )
 
-        packages_config = event.get_packages_config()
-        if not packages_config:
-            logger.info(f"No config found for {run.pipeline_id}. Skipping.")
-            continue
+            packages_config = event.get_packages_config()
+            if not packages_config:
+                logger.info(
+                    f"No config found for {run.pipeline_id}. "
+                    "Not reporting the result, setting the final status."
+                )
+                run.set_status(result)
+                continue
 
-        job_configs = SteveJobs(event).get_config_for_handler_kls(
-            handler_kls=TestingFarmResultsHandler,
-        )
+            dispatcher.add(get_handler_signatures(event, TestingFarmResultsHandler))
+    finally:
+        # the deadlines of the completed runs are moved already, don't lose
+        # their handler tasks if the check of a later one fails
+        dispatcher.flush()
 
-        event_dict = event.get_dict()
-        for job_config in job_configs:
-            package_config = (
-                event.packages_config.get_package_config_for(job_config)
-                if event.packages_config
-                else None
-            )
-            handler = TestingFarmResultsHandler(
-                package_config=package_config,
-                job_config=job_config,
-                event=event_dict,
-            )
-            # check for identifiers equality
-            if handler.pre_check(package_config, job_config, event_dict):
-                handler.run_job()
 
+def check_pending_copr_builds(shard: int = 0, shards: int = 1) -> None:
+    """
+    Checks the status of pending copr builds and updates it if needed.
 
-def check_pending_copr_builds() -> None:
-    """Checks the status of pending copr builds and updates it if needed."""
-    pending_copr_builds = CoprBuildTargetModel.get_all_by_status(BuildStatus.pending)
+    Args:
+        shard: Index of the shard of the builds to check.
+        shards: Number of shards the builds are split into (by the Copr build ID,
+            so that all the chroots of a build are checked together).
+    """
+    current_time = datetime.now(timezone.utc)
+    pending_copr_builds = CoprBuildTargetModel.get_all_by_status(
+        BuildStatus.pending,
+        due_before=to_db_time(current_time),
+        shard=shard,
+        shards=shards,
+    )
     builds_grouped_by_id = collections.defaultdict(list)
     for build in pending_copr_builds:
         # our DB uses str(build_id) but our code expects int(build_id)
         builds_grouped_by_id[int(build.build_id)].append(build)
 
-    for build_id, builds in builds_grouped_by_id.items():
-        update_copr_builds(build_id, builds)
+    dispatcher = HandlerTaskDispatcher()
+    try:
+        for build_id, builds in builds_grouped_by_id.items():
+            if any(
+                copr_build_polling_scheduler.is_due(build, current_time)
+                for build in builds
+            ):
+                poll_copr_builds(build_id, builds, current_time, dispatcher)
+    finally:
+        # the deadlines of the ended builds are moved already, don't lose
+        # their handler tasks if the check of a later one fails
+        dispatcher.flush()
 
 
 def check_copr_build(build_id: int) -> bool:
@@ -171,10 +273,43 @@ def check_copr_build(build_id: int) -> bool:
     if not builds:
         logger.warning(f"Copr build {build_id} not in DB.")
         return True
-    return update_copr_builds(build_id, builds)
+    return poll_copr_builds(build_id, builds, datetime.now(timezone.utc))
+
+
+def get_copr_build_check_countdown(build_id: int) -> float:
+    """Number of seconds until the next check of the copr build."""
+    return copr_build_polling_scheduler.get_countdown(
+        CoprBuildTargetModel.get_all_by_build_id(build_id), datetime.now(timezone.utc)
+    )
 
 
-def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"]) -> bool:
+def poll_copr_builds(
+    build_id: int,
+    builds: Iterable["CoprBuildTargetModel"],
+    current_time: datetime,
+    dispatcher: Optional[HandlerTaskDispatcher] = None,
+) -> bool:
+    """
+    Updates the state of copr builds and schedules their next check
+    if the build hasn't ended yet.
+
+    Returns:
+        Whether the build has ended.
+    """
+    ended = update_copr_builds(build_id, builds, dispatcher)
+    for build in builds:
+        if ended:
+            copr_build_polling_scheduler.completed(build, current_time)
+        else:
+            copr_build_polling_scheduler.schedule(build, current_time)
+    return ended
+
+
+def update_copr_builds(
+    build_id: int,
+    builds: Iterable["CoprBuildTargetModel"],
+    dispatcher: Optional[HandlerTaskDispatcher] = None,
+) -> bool:
     """
     Updates the state of copr builds.
 
@@ -187,6 +322,8 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
     Args:
         build_id: ID of the copr build to update.
         builds: List of builds corresponding to the given ``build_id``.
+        dispatcher: Dispatcher of the handler tasks for the ended/started builds,
+            the tasks are sent right away if not given.
 
     Returns:
         Whether the run was successful and the build has ended,
@@ -211,30 +348,40 @@ def update_copr_builds(build_id: int, builds: Iterable["CoprBuildTargetModel"])
     logger.info(f"The status of {build_id} is {build_copr.state!r}.")
 
     current_time = datetime.now(timezone.utc)
-    for build in builds:
-        elapsed = elapsed_seconds(begin=build.build_submitted_time, end=current_time)
-        if elapsed > DEFAULT_JOB_TIMEOUT:
-            logger.info(
-                f"The build {build_id} has been running for "
-                f"{elapsed}s, probably an internal error"
-                f"occurred. Not checking it anymore."
-            )
-            build.set_status(BuildStatus.error)
-            continue
-        if build.status not in (BuildStatus.pending, BuildStatus.waiting_for_srpm):
-            logger.info(
-                f"DB state of {build_id} says {build.status!r}, "
-                "things were taken care of already, skipping."
+    tasks = dispatcher or HandlerTaskDispatcher()
+    try:
+        for build in builds:
+            elapsed = elapsed_seconds(
+                begin=build.build_submitted_time, end=current_time
             )
-            continue
-        chroot_build = copr_client.build_chroot_proxy.get(build_id, build.target)
-        update_copr_build_state(build, build_copr, chroot_build)
-    # Builds which we ran CoprBuildStartHandler for still need to be monitored.
+            if elapsed > DEFAULT_JOB_TIMEOUT:
+                logger.info(
+                    f"The build {build_id} has been running for "
+                    f"{elapsed}s, probably an internal error"
+                    f"occurred. Not checking it anymore."
+                )
+                build.set_status(BuildStatus.error)
+                continue
+            if build.status not in (BuildStatus.pending, BuildStatus.waiting_for_srpm):
+                logger.info(
+                    f"DB state of {build_id} says {build.status!r}, "
+                    "things were taken care of already, skipping."
+                )
+                continue
+            chroot_build = copr_client.build_chroot_proxy.get(build_id, build.target)
+            update_copr_build_state(build, build_copr, chroot_build, tasks)
+    finally:
+        if not dispatcher:
+            tasks.flush()
+    # Builds which we dispatched CoprBuildStartHandler for still need to be monitored.
     return bool(build_copr.ended_on)
 
 
 def update_copr_build_state(
-    build: CoprBuildTargetModel, build_copr: Any, chroot_build_copr: Any
+    build: CoprBuildTargetModel,
+    build_copr: Any,
+    chroot_build_copr: Any,
+    dispatcher: HandlerTaskDispatcher,
 ) -> None:
     """
     Updates the state of the given copr build chroot.
@@ -242,12 +389,13 @@ def update_copr_build_state(
     If the build ended, its state will be updated using CoprBuildEndHandler.
     If the build is waiting for SRPM and only started (not ended), it will
         be initialized using CoprBuildStartHandler.
+    The handlers run in separate tasks sent by the dispatcher.
 
     Args:
         build: Model of the copr build to update.
         build_copr: Data of the whole copr build from the copr API.
         chroot_build_copr: Data of the single build chroot from the copr API.
-
+        dispatcher: Dispatcher of the handler tasks.
     """
     event_kls: Type[AbstractCoprBuildEvent]
     handler_kls: Type[AbstractCoprBuildReportHandler]
@@ -285,26 +433,16 @@ def update_copr_build_state(
     packages_config = event.get_packages_config()
     if not packages_config:
         logger.info(f"No config found for {build.build_id}. Skipping.")
+        if event_kls is CoprBuildEndEvent:
+            # not to be checked again
+            build.set_status(
+                BuildStatus.success
+                if chroot_build_copr.state == COPR_SUCC_STATE
+                else BuildStatus.failure
+            )
         return
 
-    job_configs = SteveJobs(event).get_config_for_handler_kls(
-        handler_kls=handler_kls,
-    )
-
-    for job_config in job_configs:
-        event_dict = event.get_dict()
-        package_config = (
-            event.packages_config.get_package_config_for(job_config)
-            if event.packages_config
-            else None
-        )
-        handler = handler_kls(
-            package_config=package_config,
-            job_config=job_config,
-            event=event_dict,
-        )
-        if handler.pre_check(package_config, job_config, event_dict):
-            handler.run_job()
+    dispatcher.add(get_handler_signatures(event, handler_kls))
 
 
 class UpdateImageBuildHelper(ConfigFromUrlMixin, GetVMImageBuilderMixin):
@@ -346,13 +484,19 @@ def get_message_for_successful_build(image_status_body):
     return message
 
 
-def update_vm_image_build(build_id: int, build: "VMImageBuildTargetModel"):
+def update_vm_image_build(
+    build_id: int,
+    build: "VMImageBuildTargetModel",
+    dispatcher: Optional[HandlerTaskDispatcher] = None,
+):
     """
     Updates the state of a vm image build if ended.
 
     Args:
         build_id (int): ID of the built image to update.
         build VMImageBuildTargetModel: build data for ``build_id``.
+        dispatcher: Dispatcher of the handler task for the ended build,
+            the task is sent right away if not given.
 
     Returns:
         bool: Whether the run was successful, False signals the need to retry.
@@ -410,28 +554,11 @@ def update_vm_image_build(build_id: int, build: "VMImageBuildTargetModel"):
         )
         return True
 
-    job_configs = SteveJobs(event).get_config_for_handler_kls(
-        handler_kls=VMImageBuildResultHandler,
-    )
-
-    event_dict = event.get_dict()
-    results = []
-    for job_config in job_configs:
-        package_config = (
-            event.packages_config.get_package_config_for(job_config)
-            if event.packages_config
-            else None
-        )
-        handler = VMImageBuildResultHandler(
-            package_config=package_config,
-            job_config=job_config,
-            event=event_dict,
-        )
-
-        if handler.pre_check(package_config, job_config, event_dict):
-            results.extend(handler.run_job())
-
-    if results:
+    if signatures := get_handler_signatures(event, VMImageBuildResultHandler):
+        tasks = dispatcher or HandlerTaskDispatcher()
+        tasks.add(signatures)
+        if not dispatcher:
+            tasks.flush()
         return True
 
     build.set_status(status)
@@ -442,7 +569,7 @@ def update_vm_image_build(build_id: int, build: "VMImageBuildTargetModel"):
     return True
 
 
-def check_pending_vm_image_builds() -> None:
+def check_pending_vm_image_builds(shard: int = 0, shards: int = 1) -> None:
     """Checks the status of pending vm image builds and updates it if needed.
 
     Inside our db all builds are just pending but if you check the
@@ -451,10 +578,47 @@ def check_pending_vm_image_builds() -> None:
     - building
     - uploading
     - registering
+
+    Args:
+        shard: Index of the shard of the builds to check.
+        shards: Number of shards the builds are split into (by their ID).
     """
+    current_time = datetime.now(timezone.utc)
     pending_vm_image_builds = VMImageBuildTargetModel.get_all_by_status(
-        VMImageBuildStatus.pending
+        VMImageBuildStatus.pending,
+        due_before=to_db_time(current_time),
+        shard=shard,
+        shards=shards,
     )
 
-    for build in pending_vm_image_builds:
-        update_vm_image_build(build.build_id, build)
+    dispatcher = HandlerTaskDispatcher()
+    try:
+        for build in pending_vm_image_builds:
+            if not vm_image_build_polling_scheduler.is_due(build, current_time):
+                continue
+            poll_vm_image_build(build.build_id, build, current_time, dispatcher)
+    finally:
+        # the deadlines of the ended builds are moved already, don't lose
+        # their handler tasks if the check of a later one fails
+        dispatcher.flush()
+
+
+def poll_vm_image_build(
+    build_id: int,
+    build: "VMImageBuildTargetModel",
+    current_time: datetime,
+    dispatcher: Optional[HandlerTaskDispatcher] = None,
+) -> bool:
+    """
+    Updates the state of a vm image build and schedules its next check
+    if it hasn't ended yet.
+
+    Returns:
+        Whether the build has ended.
+    """
+    ended = update_vm_image_build(build_id, build, dispatcher)
+    if ended:
+        vm_image_build_polling_scheduler.completed(build, current_time)
+    else:
+        vm_image_build_polling_scheduler.schedule(build, current_time)
+    return ended
@@ -4,9 +4,9 @@
 import logging
 import re
 from datetime import datetime, timezone
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from copr.v3 import CoprAuthException, CoprRequestException
+from copr.v3 import Client as CoprClient, CoprAuthException, CoprRequestException
 from copr.v3.exceptions import CoprTimeoutException
 from ogr.abstract import GitProject
 from ogr.exceptions import GitForgeInternalError, OgrNetworkError
@@ -58,6 +58,8 @@ from packit_service.utils import elapsed_seconds
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.events import EventData
 from packit_service.worker.helpers.build.build_helper import BaseBuildJobHelper
+from packit_service.tracing import record_submission
+from packit_service.worker.helpers.fedmsg_filter import submitted_copr_builds
 from packit_service.worker.monitoring import Pushgateway
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.result import TaskResults
@@ -65,6 +67,42 @@ from packit_service.worker.result import TaskResults
 logger = logging.getLogger(__name__)
 
 
+class CoprBuildData:
+    """
+    Loads data about Copr builds, each of them is fetched from Copr at most once.
+
+    Handling of a single event (e.g. the end of a Copr build) needs the build,
+    its chroot and the built packages in several places, so they are memoized
+    instead of being requested from Copr repeatedly.
+    """
+
+    def __init__(self, copr_client: CoprClient):
+        self.copr_client = copr_client
+        self._builds: Dict[int, Any] = {}
+        self._build_chroots: Dict[Tuple[int, str], Any] = {}
+        self._built_packages: Dict[Tuple[int, str], List] = {}
+
+    def get_build(self, build_id: int):
+        build_id = int(build_id)
+        if build_id not in self._builds:
+            self._builds[build_id] = self.copr_client.build_proxy.get(build_id)
+        return self._builds[build_id]
+
+    def get_build_chroot(self, build_id: int, chroot: str):
+        key = (int(build_id), chroot)
+        if key not in self._build_chroots:
+            self._build_chroots[key] = self.copr_client.build_chroot_proxy.get(*key)
+        return self._build_chroots[key]
+
+    def get_built_packages(self, build_id: int, chroot: str) -> List:
+        key = (int(build_id), chroot)
+        if key not in self._built_packages:
+            self._built_packages[
+                key
+            ] = self.copr_client.build_chroot_proxy.get_built_packages(*key).packages
+        return self._built_packages[key]
+
+
 class CoprBuildJobHelper(BaseBuildJobHelper):
     job_type_build = JobType.copr_build
     job_type_test = JobType.tests
@@ -98,6 +136,7 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         )
         self.celery_task = celery_task
         self._copr_build_group_id = copr_build_group_id
+        self._copr_build_data: Optional[CoprBuildData] = None
 
     @property
     def msg_retrigger(self) -> str:
@@ -373,16 +412,20 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         )
         return False
 
+    @property
+    def copr_build_data(self) -> CoprBuildData:
+        if not self._copr_build_data:
+            self._copr_build_data = CoprBuildData(self.api.copr_helper.copr_client)
+        return self._copr_build_data
+
     def get_built_packages(self, build_id: int, chroot: str) -> List:
-        return self.api.copr_helper.copr_client.build_chroot_proxy.get_built_packages(
-            build_id, chroot
-        ).packages
+        return self.copr_build_data.get_built_packages(build_id, chroot)
 
     def get_build(self, build_id: int):
-        return self.api.copr_helper.copr_client.build_proxy.get(build_id)
+        return self.copr_build_data.get_build(build_id)
 
     def get_build_chroot(self, build_id: int, chroot: str):
-        return self.api.copr_helper.copr_client.build_chroot_proxy.get(build_id, chroot)
+        return self.copr_build_data.get_build_chroot(build_id, chroot)
 
     def monitor_not_submitted_copr_builds(self, number_of_builds: int, reason: str):
         """
@@ -477,6 +520,8 @@ class CoprBuildJobHelper(BaseBuildJobHelper):
         except Exception as ex:
             return self.handle_build_submit_error(group, ex)
         else:
+            submitted_copr_builds.add(build_id)
+            record_submission(f"copr-build:{build_id}")
             self._srpm_model.set_copr_build_id(str(build_id))
             self._srpm_model.set_copr_web_url(web_url)
 
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from re import search
 from typing import Dict, Optional, Set, Tuple
 
@@ -20,6 +21,7 @@ from packit_service.service.urls import (
     get_srpm_build_info_url,
 )
 from packit_service.worker.helpers.build.build_helper import BaseBuildJobHelper
+from packit_service.worker.helpers.fedmsg_filter import submitted_koji_builds
 from packit_service.worker.result import TaskResults
 from packit_service.worker.reporting import BaseCommitStatus
 
@@ -115,6 +117,7 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
 
         errors: Dict[str, str] = {}
         build_group = KojiBuildGroupModel.create(run_model=self.run_model)
+        koji_builds: Dict[str, KojiBuildTargetModel] = {}
         for target in self.build_targets:
             if target not in self.supported_koji_targets:
                 msg = f"Target not supported: {target}"
@@ -127,7 +130,7 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
                 errors[target] = msg
                 continue
 
-            koji_build = KojiBuildTargetModel.create(
+            koji_builds[target] = KojiBuildTargetModel.create(
                 build_id=None,
                 commit_sha=self.metadata.commit_sha,
                 web_url=None,
@@ -136,31 +139,46 @@ class KojiBuildJobHelper(BaseBuildJobHelper):
                 scratch=self.is_scratch,
                 koji_build_group=build_group,
             )
-            try:
-                build_id, web_url = self.run_build(target=target)
-            except Exception as ex:
-                sentry_integration.send_to_sentry(ex)
-                # TODO: Where can we show more info about failure?
-                # TODO: Retry
-                self.report_status_to_all_for_chroot(
-                    state=BaseCommitStatus.error,
-                    description=f"Submit of the build failed: {ex}",
-                    url=get_srpm_build_info_url(self.srpm_model.id),
-                    chroot=target,
-                )
-                koji_build.set_status("error")
-                errors[target] = str(ex)
-                continue
-            else:
-                koji_build.set_build_id(str(build_id))
-                koji_build.set_web_url(web_url)
-                url = get_koji_build_info_url(id_=koji_build.id)
-                self.report_status_to_all_for_chroot(
-                    state=BaseCommitStatus.running,
-                    description="Building RPM ...",
-                    url=url,
-                    chroot=target,
-                )
+
+        # the builds are submitted concurrently, so that a single slow
+        # submission doesn't hold back the others; the database
+        # and the reporting are used from this thread only
+        with ThreadPoolExecutor(
+            max_workers=self.service_config.parallel_koji_builds
+        ) as executor:
+            futures = {
+                executor.submit(self.run_build, target=target): target
+                for target in koji_builds
+            }
+            for future in as_completed(futures):
+                target = futures[future]
+                koji_build = koji_builds[target]
+                try:
+                    build_id, web_url = future.result()
+                except Exception as ex:
+                    sentry_integration.send_to_sentry(ex)
+                    # TODO: Where can we show more info about failure?
+                    # TODO: Retry
+                    self.report_status_to_all_for_chroot(
+                        state=BaseCommitStatus.error,
+                        description=f"Submit of the build failed: {ex}",
+                        url=get_srpm_build_info_url(self.srpm_model.id),
+                        chroot=target,
+                    )
+                    koji_build.set_status("error")
+                    errors[target] = str(ex)
+                    continue
+                else:
+                    submitted_koji_builds.add(build_id)
+                    koji_build.set_build_id(str(build_id))
+                    koji_build.set_web_url(web_url)
+                    url = get_koji_build_info_url(id_=koji_build.id)
+                    self.report_status_to_all_for_chroot(
+                        state=BaseCommitStatus.running,
+                        description="Building RPM ...",
+                        url=url,
+                        chroot=target,
+                    )
 
         if errors:
             return TaskResults(
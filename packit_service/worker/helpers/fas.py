@@ -0,0 +1,182 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Fedora Account System (fasjson) lookups shared by all the tasks run by a worker process.
+
+The Kerberos ticket is obtained once and then renewed in the background,
+the fasjson client (which downloads the API specification when created)
+is created once and the users and their groups are cached in the shared cache.
+"""
+
+import logging
+import os
+from threading import Event, Lock, Thread
+from time import monotonic
+from typing import Dict, List, Optional, Tuple
+
+from fasjson_client import Client
+from fasjson_client.errors import APIError, ClientError
+from requests.exceptions import RequestException
+
+from packit.api import PackitAPI
+from packit.exceptions import PackitCommandFailedError
+from packit_service.cache import shared_ttl_cache
+from packit_service.config import ServiceConfig
+from packit_service.constants import (
+    FAS_CACHE_TTL,
+    FASJSON_REQUEST_TIMEOUT,
+    FASJSON_URL,
+    KERBEROS_TICKET_RENEW_INTERVAL,
+)
+
+logger = logging.getLogger(__name__)
+
+# errors of the fasjson lookups, callers should treat the user as unknown
+FASJSON_ERRORS = (APIError, ClientError, RequestException)
+
+
+class KerberosTicketManager:
+    """
+    Keeps the Kerberos ticket (needed by fasjson) valid for the lifetime
+    of the worker process, it's renewed by a background thread.
+    """
+
+    def __init__(
+        self,
+        service_config: ServiceConfig,
+        renew_interval: int = KERBEROS_TICKET_RENEW_INTERVAL,
+    ):
+        """
+        Args:
+            service_config: Service config with the FAS user and the keytab.
+            renew_interval: Number of seconds after which the ticket is renewed.
+        """
+        self.service_config = service_config
+        self.renew_interval = renew_interval
+        self._lock = Lock()
+        self._stopped = Event()
+        self._obtained_at: Optional[float] = None
+        self._renewal: Optional[Thread] = None
+
+    def _kinit(self) -> bool:
+        try:
+            logger.debug("Initialising Kerberos ticket so that we can use fasjson API.")
+            PackitAPI(
+                config=self.service_config, package_config=None
+            ).init_kerberos_ticket()
+        except PackitCommandFailedError as ex:
+            logger.error(f"Kerberos authentication error: {ex.stderr_output}")
+            return False
+
+        self._obtained_at = monotonic()
+        return True
+
+    def _renew_periodically(self) -> None:
+        while not self._stopped.wait(self.renew_interval):
+            with self._lock:
+                self._kinit()
+
+    def ensure_ticket(self) -> bool:
+        """
+        Obtain the ticket unless there is a valid one
+        and start renewing it in the background.
+
+        Returns:
+            Whether there is a valid ticket.
+        """
+        with self._lock:
+            if (
+                self._obtained_at is None
+                or monotonic() - self._obtained_at >= self.renew_interval
+            ) and not self._kinit():
+                return False
+
+            if not self._renewal or not self._renewal.is_alive():
+                self._renewal = Thread(
+                    target=self._renew_periodically,
+                    name="kerberos-ticket-renewal",
+                    daemon=True,
+                )
+                self._renewal.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop renewing the ticket."""
+        self._stopped.set()
+
+
+_ticket_managers: Dict[int, KerberosTicketManager] = {}
+_fasjson_clients: Dict[Tuple[int, str], Client] = {}
+
+
+def get_kerberos_ticket_manager(
+    service_config: Optional[ServiceConfig] = None,
+) -> KerberosTicketManager:
+    """
+    Kerberos ticket manager of the current process, created on the first use
+    (the renewing thread doesn't survive forking of the Celery worker pool).
+    """
+    pid = os.getpid()
+    if pid not in _ticket_managers:
+        _ticket_managers[pid] = KerberosTicketManager(
+            service_config or ServiceConfig.get_service_config()
+        )
+    return _ticket_managers[pid]
+
+
+def get_fasjson_client(url: Optional[str] = None) -> Client:
+    """
+    fasjson client of the current process (for the given or the Fedora instance),
+    with a valid Kerberos ticket.
+
+    Raises:
+        ClientError: If the client could not be created (e.g. the API
+            specification could not be downloaded).
+    """
+    url = url or FASJSON_URL
+    get_kerberos_ticket_manager().ensure_ticket()
+    key = (os.getpid(), url)
+    if key not in _fasjson_clients:
+        _fasjson_clients[key] = Client(url)
+        logger.debug(f"Created fasjson client for {url}.")
+    return _fasjson_clients[key]
+
+
+def _call(operation: str, **kwargs):
+    return getattr(get_fasjson_client(), operation)(
+        _request_options={"timeout": FASJSON_REQUEST_TIMEOUT}, **kwargs
+    ).result
+
+
+@shared_ttl_cache(FAS_CACHE_TTL)
+def get_fas_user(username: str) -> Optional[dict]:
+    """
+    FAS account of the user, `None` if there is no such user.
+
+    Raises:
+        One of `FASJSON_ERRORS` if the lookup failed.
+    """
+    try:
+        return _call("get_user", username=username)
+    except APIError as ex:
+        if ex.code == 404:
+            return None
+        raise
+
+
+@shared_ttl_cache(FAS_CACHE_TTL)
+def get_fas_user_groups(username: str) -> Optional[List[str]]:
+    """
+    Names of the FAS groups of the user, `None` if there is no such user.
+
+    Raises:
+        One of `FASJSON_ERRORS` if the lookup failed.
+    """
+    try:
+        groups = _call("list_user_groups", username=username)
+    except APIError as ex:
+        if ex.code == 404:
+            return None
+        raise
+    return [group["groupname"] for group in groups]
@@ -0,0 +1,107 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Pre-filter of the fedmsg messages about the builds not submitted by the service.
+
+Copr and Koji announce all their builds on the message bus, only a small part
+of them were submitted by us. The IDs of the builds we submit are kept
+in the shared cache, so that the parser drops the messages about the other ones
+before looking them up in the DB.
+
+The filter is used only when the cache is shared by all the processes (Redis).
+It never drops a message it's not sure about: if the IDs are not in the cache
+(e.g. Redis was restarted) they are loaded from the DB first and when that
+doesn't help (Redis is not available), all the messages are let through.
+A single ID evicted from the cache makes us miss the messages about the build,
+such builds are still updated by the babysit checks.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from time import monotonic
+from typing import Optional, Type, Union
+
+from packit_service.cache import CACHE_KEY_PREFIX, get_shared_cache
+from packit_service.constants import (
+    DEFAULT_JOB_TIMEOUT,
+    SUBMITTED_BUILDS_RELOAD_INTERVAL,
+)
+from packit_service.models import CoprBuildTargetModel, KojiBuildTargetModel
+
+logger = logging.getLogger(__name__)
+
+SUBMITTED_BUILDS_KEY_PREFIX = f"{CACHE_KEY_PREFIX}:submitted"
+
+
+class SubmittedBuilds:
+    """IDs of one kind of the builds submitted by the service."""
+
+    def __init__(
+        self,
+        kind: str,
+        model: Type[Union[CoprBuildTargetModel, KojiBuildTargetModel]],
+    ):
+        """
+        Args:
+            kind: Kind of the builds, part of the keys in the cache.
+            model: Model of the builds, the IDs are loaded from.
+        """
+        self.kind = kind
+        self.model = model
+        self._loaded_at: Optional[float] = None
+
+    def _key(self, build_id: Union[int, str]) -> str:
+        return f"{SUBMITTED_BUILDS_KEY_PREFIX}:{self.kind}:{build_id}"
+
+    @property
+    def _loaded_key(self) -> str:
+        # present in the cache if the IDs of the recent builds were loaded there
+        return f"{SUBMITTED_BUILDS_KEY_PREFIX}:{self.kind}-loaded"
+
+    def add(self, build_id: Union[int, str]) -> None:
+        """Record the build submitted by us."""
+        get_shared_cache().set(self._key(build_id), "1", DEFAULT_JOB_TIMEOUT)
+
+    def _load(self) -> bool:
+        """
+        Load the IDs of the builds which can still be running to the cache.
+
+        Returns:
+            Whether the IDs are in the cache.
+        """
+        if (
+            self._loaded_at is not None
+            and monotonic() - self._loaded_at < SUBMITTED_BUILDS_RELOAD_INTERVAL
+        ):
+            return False
+        self._loaded_at = monotonic()
+
+        cache = get_shared_cache()
+        build_ids = self.model.get_build_ids_submitted_after(
+            datetime.utcnow() - timedelta(seconds=DEFAULT_JOB_TIMEOUT)
+        )
+        # the parser waits for this, one round trip for all the IDs,
+        # the loaded key goes last so that it's not there without them
+        values = {self._key(build_id): "1" for build_id in build_ids}
+        values[self._loaded_key] = "1"
+        cache.set_many(values, DEFAULT_JOB_TIMEOUT)
+        logger.info(f"Loaded IDs of the submitted {self.kind} builds to the cache.")
+        # check that the cache works
+        return cache.get(self._loaded_key) is not None
+
+    def might_contain(self, build_id: Optional[Union[int, str]]) -> bool:
+        """
+        Whether the build may have been submitted by us, `False` only if it
+        certainly wasn't.
+        """
+        cache = get_shared_cache()
+        if build_id is None or not cache.shared:
+            return True
+        if cache.get(self._loaded_key) is None and not self._load():
+            return True
+        return cache.get(self._key(build_id)) is not None
+
+
+submitted_copr_builds = SubmittedBuilds("copr", CoprBuildTargetModel)
+submitted_koji_builds = SubmittedBuilds("koji", KojiBuildTargetModel)
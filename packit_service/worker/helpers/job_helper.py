@@ -14,6 +14,7 @@ from packit.config import JobConfig
 from packit.config.package_config import PackageConfig
 from packit.local_project import LocalProject
 from packit.utils.repo import RepositoryCache
+from packit_service import forge_cache
 from packit_service.config import Deployment, ServiceConfig
 from packit_service.models import PipelineModel, JobTriggerModel
 from packit_service.worker.events import EventData
@@ -91,7 +92,9 @@ class BaseJobHelper:
     def is_reporting_allowed(self) -> bool:
         username = self.project.service.user.get_username()
         if self._is_reporting_allowed is None:
-            self._is_reporting_allowed = self.base_project.can_merge_pr(username)
+            self._is_reporting_allowed = forge_cache.can_merge_pr(
+                self.base_project, username
+            )
         return self._is_reporting_allowed
 
     @property
@@ -0,0 +1,228 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Deadlines of the checks of the pending builds and test runs (babysitting).
+
+Instead of checking all the pending builds at fixed intervals, each of them
+has a deadline of its next check. The first one is estimated from the durations
+of the recent builds of the same project and chroot, the checks get more frequent
+as the expected end approaches and afterwards they are spaced proportionally
+to the time the build has been running.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from statistics import median
+from typing import Iterable, Optional, Union
+
+from packit_service.cache import shared_ttl_cache
+from packit_service.constants import (
+    POLLING_BACKOFF_FACTOR,
+    POLLING_HISTORY_CACHE_TTL,
+    POLLING_HISTORY_MIN_SIZE,
+    POLLING_HISTORY_SIZE,
+    POLLING_MAX_INTERVAL,
+    POLLING_MIN_INTERVAL,
+)
+from packit_service.models import (
+    CoprBuildTargetModel,
+    TFTTestRunTargetModel,
+    VMImageBuildTargetModel,
+)
+from packit_service.utils import elapsed_seconds
+from packit_service.worker.monitoring import (
+    babysit_checks_per_item,
+    babysit_detection_lag,
+)
+
+logger = logging.getLogger(__name__)
+
+PendingItem = Union[
+    CoprBuildTargetModel, TFTTestRunTargetModel, VMImageBuildTargetModel
+]
+
+
+def to_db_time(now: datetime) -> datetime:
+    """The time stored the same way as the other times in the DB (naive, UTC)."""
+    return now.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def get_next_check_delay(elapsed: float, expected: Optional[float]) -> float:
+    """
+    Number of seconds until the next check of a pending build/run.
+
+    Args:
+        elapsed: Number of seconds since the build/run was submitted.
+        expected: Expected duration (in seconds), `None` if not known.
+    """
+    if expected and elapsed < expected:
+        # halve the remaining time, so that the builds ending sooner
+        # than expected are noticed in time as well
+        delay = max((expected - elapsed) / 2, expected / 10)
+    else:
+        delay = elapsed * POLLING_BACKOFF_FACTOR
+    return min(max(delay, POLLING_MIN_INTERVAL), POLLING_MAX_INTERVAL)
+
+
+def _median(durations: list) -> Optional[float]:
+    return median(durations) if len(durations) >= POLLING_HISTORY_MIN_SIZE else None
+
+
+@shared_ttl_cache(POLLING_HISTORY_CACHE_TTL)
+def get_expected_copr_build_duration(
+    owner: str, project_name: str, target: str
+) -> Optional[float]:
+    """
+    Median duration of the recent builds in the chroot of the Copr project,
+    of all the projects of the owner if there are not enough of them.
+    """
+    durations = CoprBuildTargetModel.get_recent_durations(
+        owner=owner,
+        target=target,
+        project_name=project_name,
+        limit=POLLING_HISTORY_SIZE,
+    )
+    if len(durations) < POLLING_HISTORY_MIN_SIZE:
+        durations = CoprBuildTargetModel.get_recent_durations(
+            owner=owner, target=target, limit=POLLING_HISTORY_SIZE
+        )
+    return _median(durations)
+
+
+@shared_ttl_cache(POLLING_HISTORY_CACHE_TTL)
+def get_expected_vm_image_build_duration(
+    project_url: str, target: str
+) -> Optional[float]:
+    """Median duration of the recent image builds of the project for the target."""
+    return _median(
+        VMImageBuildTargetModel.get_recent_durations(
+            project_url=project_url, target=target, limit=POLLING_HISTORY_SIZE
+        )
+    )
+
+
+class PollingScheduler:
+    """
+    Deadlines of the checks of one kind of the pending builds/runs
+    (the deadline is stored in the DB along with the number of checks).
+    """
+
+    kind: str = ""
+
+    def get_submitted_time(self, item: PendingItem) -> Optional[datetime]:
+        raise NotImplementedError
+
+    def get_expected_duration(self, item: PendingItem) -> Optional[float]:
+        return None
+
+    def get_finished_time(self, item: PendingItem) -> Optional[datetime]:
+        """Time the build/run ended, if reported by the service."""
+        return None
+
+    def get_deadline(self, item: PendingItem) -> Optional[datetime]:
+        """Deadline of the next check, `None` if the item should be checked now."""
+        if item.next_check_time:
+            return item.next_check_time
+        submitted = self.get_submitted_time(item)
+        if not submitted:
+            return None
+        return submitted + timedelta(
+            seconds=get_next_check_delay(0, self.get_expected_duration(item))
+        )
+
+    def is_due(self, item: PendingItem, now: datetime) -> bool:
+        deadline = self.get_deadline(item)
+        return deadline is None or elapsed_seconds(begin=deadline, end=now) >= 0
+
+    def get_countdown(self, items: Iterable[PendingItem], now: datetime) -> float:
+        """Number of seconds until the nearest deadline of the given items."""
+        deadlines = [deadline for deadline in map(self.get_deadline, items) if deadline]
+        if not deadlines:
+            return POLLING_MIN_INTERVAL
+        return max(
+            min(elapsed_seconds(begin=now, end=deadline) for deadline in deadlines),
+            0,
+        )
+
+    def schedule(self, item: PendingItem, now: datetime) -> float:
+        """
+        Record the check of the still pending build/run and set the deadline
+        of the next one.
+
+        Returns:
+            Number of seconds until the next check.
+        """
+        submitted = self.get_submitted_time(item) or now
+        delay = get_next_check_delay(
+            elapsed_seconds(begin=submitted, end=now),
+            self.get_expected_duration(item),
+        )
+        item.set_next_check_time(to_db_time(now) + timedelta(seconds=delay))
+        logger.debug(f"Next check of {self.kind} {item.id} in {delay:.0f}s.")
+        return delay
+
+    def completed(self, item: PendingItem, now: datetime) -> None:
+        """
+        Record the metrics of the build/run found completed by the check.
+
+        The status is updated by the handler task dispatched by the check,
+        until then the item is still pending, so it's checked again only
+        if the task got lost.
+        """
+        babysit_checks_per_item.labels(kind=self.kind).observe(
+            (item.check_count or 0) + 1
+        )
+        finished = self.get_finished_time(item)
+        if finished:
+            babysit_detection_lag.labels(kind=self.kind).observe(
+                max(elapsed_seconds(begin=finished, end=now), 0)
+            )
+        item.set_next_check_time(
+            to_db_time(now) + timedelta(seconds=POLLING_MAX_INTERVAL)
+        )
+
+
+class CoprBuildPollingScheduler(PollingScheduler):
+    kind = "copr_build"
+
+    def get_submitted_time(self, build: CoprBuildTargetModel) -> Optional[datetime]:
+        return build.build_submitted_time
+
+    def get_expected_duration(self, build: CoprBuildTargetModel) -> Optional[float]:
+        return get_expected_copr_build_duration(
+            build.owner, build.project_name, build.target
+        )
+
+    def get_finished_time(self, build: CoprBuildTargetModel) -> Optional[datetime]:
+        # set from the end time reported by Copr
+        return build.build_finished_time
+
+
+class TFTTestRunPollingScheduler(PollingScheduler):
+    kind = "tft_test_run"
+
+    def get_submitted_time(self, run: TFTTestRunTargetModel) -> Optional[datetime]:
+        return run.submitted_time
+
+
+class VMImageBuildPollingScheduler(PollingScheduler):
+    kind = "vm_image_build"
+
+    def get_submitted_time(self, build: VMImageBuildTargetModel) -> Optional[datetime]:
+        return build.build_submitted_time
+
+    def get_expected_duration(self, build: VMImageBuildTargetModel) -> Optional[float]:
+        return get_expected_vm_image_build_duration(build.project_url, build.target)
+
+    def completed(self, build: VMImageBuildTargetModel, now: datetime) -> None:
+        super().completed(build, now)
+        # the image builder doesn't report the end time,
+        # the durations of the builds are estimated from the time of the check
+        if not build.build_finished_time:
+            build.set_end_time(to_db_time(now))
+
+
+copr_build_polling_scheduler = CoprBuildPollingScheduler()
+tft_test_run_polling_scheduler = TFTTestRunPollingScheduler()
+vm_image_build_polling_scheduler = VMImageBuildPollingScheduler()
@@ -0,0 +1,65 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Watching for upstream archives (e.g. on PyPI) which are not available
+yet at the time the release is synced, so that the sync-release task
+is dispatched again only once it can succeed.
+"""
+
+import logging
+import re
+from os import getenv
+from typing import Optional
+
+import requests
+
+from packit.exceptions import PackitDownloadFailedException
+
+from packit_service.constants import ARCHIVE_REQUEST_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# message of the PackitDownloadFailedException raised by packit
+FAILED_DOWNLOAD_URL_RE = re.compile(
+    r"Failed to download source from (https?://\S+?):?(?:\n|$)"
+)
+
+
+def get_failed_download_url(ex: PackitDownloadFailedException) -> Optional[str]:
+    """
+    Get the URL of the archive which could not be downloaded.
+
+    Returns:
+        URL or None if it is not an HTTP(S) URL or can't be found.
+    """
+    match = FAILED_DOWNLOAD_URL_RE.search(str(ex))
+    return match.group(1) if match else None
+
+
+def is_archive_available(url: str) -> bool:
+    """
+    Check whether the archive can be downloaded, without downloading it.
+
+    The servers not supporting HEAD requests are asked by a GET request
+    whose body is not read.
+    """
+    headers = {
+        "User-Agent": getenv("PACKIT_USER_AGENT")
+        or "packit-service (hello+cli@packit.dev)"
+    }
+    try:
+        response = requests.head(
+            url, headers=headers, allow_redirects=True, timeout=ARCHIVE_REQUEST_TIMEOUT
+        )
+        if response.status_code == requests.codes.method_not_allowed:
+            with requests.get(
+                url, headers=headers, stream=True, timeout=ARCHIVE_REQUEST_TIMEOUT
+            ) as response:
+                pass
+    except requests.exceptions.RequestException as ex:
+        logger.debug(f"Failed to check the availability of {url}: {ex!r}")
+        return False
+
+    logger.debug(f"Availability of {url}: {response.status_code}")
+    return response.ok
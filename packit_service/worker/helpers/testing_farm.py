@@ -32,6 +32,7 @@ from packit_service.models import (
 )
 from packit_service.sentry_integration import send_to_sentry
 from packit_service.service.urls import get_testing_farm_info_url
+from packit_service.tracing import record_submission
 from packit_service.utils import get_package_nvrs, get_packit_commands_from_comment
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.events import (
@@ -45,6 +46,10 @@ from packit_service.worker.events import (
     MergeRequestGitlabEvent,
 )
 from packit_service.worker.helpers.build import CoprBuildJobHelper
+from packit_service.worker.helpers.testing_farm_client import (
+    TestingFarmClient,
+    get_testing_farm_client,
+)
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.result import TaskResults
 
@@ -77,11 +82,7 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
             tests_targets_override=tests_targets_override,
         )
         self.celery_task = celery_task
-        self.session = requests.session()
-        adapter = requests.adapters.HTTPAdapter(max_retries=5)
         self.insecure = False
-        self.session.mount("https://", adapter)
-        self._tft_api_url: str = ""
         self._tft_token: str = ""
         self.__pr = None
         self._comment_command_parts: Optional[List[str]] = None
@@ -91,12 +92,8 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         self._test_check_names: Optional[List[str]] = None
 
     @property
-    def tft_api_url(self) -> str:
-        if not self._tft_api_url:
-            self._tft_api_url = self.service_config.testing_farm_api_url
-            if not self._tft_api_url.endswith("/"):
-                self._tft_api_url += "/"
-        return self._tft_api_url
+    def testing_farm_client(self) -> TestingFarmClient:
+        return get_testing_farm_client(self.service_config)
 
     @property
     def tft_token(self) -> str:
@@ -905,30 +902,29 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         self, endpoint: str, method: str = None, params: dict = None, data=None
     ) -> RequestResponse:
         method = method or "GET"
-        url = f"{self.tft_api_url}{endpoint}"
         try:
-            response = self.get_raw_request(
-                method=method, url=url, params=params, data=data
+            response = self.testing_farm_client.request(
+                endpoint=endpoint,
+                method=method,
+                params=params,
+                data=data,
+                verify=not self.insecure,
             )
         except requests.exceptions.ConnectionError as er:
             logger.error(er)
-            raise PackitException(f"Cannot connect to url: `{url}`") from er
-        return response
-
-    def get_raw_request(
-        self,
-        url,
-        method="GET",
-        params=None,
-        data=None,
-    ) -> RequestResponse:
-        response = self.session.request(
-            method=method,
-            url=url,
-            params=params,
-            json=data,
-            verify=not self.insecure,
-        )
+            raise PackitException(
+                f"Cannot connect to url: `{self.testing_farm_client.api_url}{endpoint}`"
+            ) from er
+        except requests.exceptions.RequestException as er:
+            # e.g. a timeout, handled the same way as a failed request
+            logger.error(f"Request to TF endpoint {endpoint} failed: {er!r}")
+            return RequestResponse(
+                # no response
+                status_code=0,
+                ok=False,
+                content=b"",
+                reason=str(er),
+            )
 
         try:
             json_output = response.json()
@@ -983,6 +979,7 @@ class TestingFarmJobHelper(CoprBuildJobHelper):
         pipeline_id = response.json()["id"]
         logger.info(f"Request {pipeline_id} submitted to testing farm.")
         test_run.set_pipeline_id(pipeline_id)
+        record_submission(f"tft:{pipeline_id}")
 
         if additional_build:
             test_run.add_copr_build(additional_build)
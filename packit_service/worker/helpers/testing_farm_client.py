@@ -0,0 +1,138 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Client of the Testing Farm API shared by all the tasks run by a worker process,
+so that the connections (and TLS sessions) are reused.
+"""
+
+import logging
+import os
+from time import monotonic
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import TESTING_FARM_API_URL
+from packit_service.worker.monitoring import (
+    testing_farm_request_duration,
+    testing_farm_request_errors,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TestingFarmClient:
+    __test__ = False
+
+    def __init__(
+        self,
+        api_url: str,
+        timeout: int = 60,
+        retries: int = 5,
+        backoff: float = 0.5,
+        pool_maxsize: int = 10,
+    ):
+        """
+        Args:
+            api_url: URL of the Testing Farm API.
+            timeout: Timeout of the requests in seconds.
+            retries: Number of retries of the failed connections, the requests
+                which reached the server are not retried (not to submit
+                the same test run twice).
+            backoff: Backoff factor of the retries.
+            pool_maxsize: Maximum number of kept-alive connections.
+        """
+        self.api_url = api_url if api_url.endswith("/") else f"{api_url}/"
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(total=retries, read=False, backoff_factor=backoff),
+            pool_maxsize=pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @staticmethod
+    def get_endpoint_label(endpoint: str) -> str:
+        """Endpoint as a metric label, without the IDs of the requests."""
+        parts = endpoint.strip("/").split("/")
+        if parts[0] == "requests" and len(parts) > 1:
+            return "requests/{id}"
+        return "/".join(parts)
+
+    def request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        params: Optional[dict] = None,
+        data=None,
+        verify: bool = True,
+    ) -> requests.Response:
+        """
+        Send request to the Testing Farm API.
+
+        Args:
+            endpoint: Endpoint relative to the API URL, e.g. `requests`.
+            method: HTTP method.
+            params: Query parameters.
+            data: Data sent as a JSON body.
+            verify: Whether to verify the TLS certificate of the server.
+
+        Raises:
+            requests.exceptions.RequestException: If the request failed
+                (e.g. could not connect or timed out).
+        """
+        labels = {"method": method, "endpoint": self.get_endpoint_label(endpoint)}
+        start = monotonic()
+        try:
+            response = self.session.request(
+                method=method,
+                url=f"{self.api_url}{endpoint}",
+                params=params,
+                json=data,
+                verify=verify,
+                timeout=self.timeout,
+            )
+        except requests.exceptions.RequestException as ex:
+            testing_farm_request_errors.labels(error=type(ex).__name__, **labels).inc()
+            raise
+        finally:
+            testing_farm_request_duration.labels(**labels).observe(monotonic() - start)
+
+        if not response.ok:
+            testing_farm_request_errors.labels(
+                error=str(response.status_code), **labels
+            ).inc()
+        return response
+
+
+_clients: Dict[Tuple[int, str], TestingFarmClient] = {}
+
+
+def get_testing_farm_client(
+    service_config: Optional[ServiceConfig] = None,
+) -> TestingFarmClient:
+    """
+    Testing Farm client of the current process for the configured API URL,
+    created on the first use.
+
+    The connections can't be shared with the forked processes (Celery
+    worker pool), each of them gets its own client.
+    """
+    service_config = service_config or ServiceConfig.get_service_config()
+    api_url = service_config.testing_farm_api_url or TESTING_FARM_API_URL
+    key = (os.getpid(), api_url)
+    if key not in _clients:
+        _clients[key] = TestingFarmClient(
+            api_url=api_url,
+            timeout=service_config.testing_farm_request_timeout,
+            retries=service_config.testing_farm_request_retries,
+            backoff=service_config.testing_farm_request_backoff,
+        )
+        logger.debug(f"Created Testing Farm client for {_clients[key].api_url}.")
+    return _clients[key]
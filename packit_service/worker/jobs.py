@@ -5,7 +5,7 @@
 We love you, Steve Jobs.
 """
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from functools import cached_property
 from typing import Optional, Union, Callable
 from typing import List, Set, Type, Tuple
@@ -16,6 +16,7 @@ import celery
 from ogr.exceptions import GithubAppNotInstalledError
 from packit.config import JobConfig, JobType, JobConfigTriggerType
 from packit.config.job_config import DEPRECATED_JOB_TYPES
+from packit_service import forge_cache
 from packit_service.config import PackageConfig, PackageConfigGetter, ServiceConfig
 from packit_service.constants import (
     DOCS_CONFIGURATION_URL,
@@ -23,12 +24,15 @@ from packit_service.constants import (
     COMMENT_REACTION,
     PACKIT_VERIFY_FAS_COMMAND,
 )
+from packit_service.models import EventStage, PullRequestHeadCommitModel
+from packit_service.tracing import record_stage, record_stages, traced
 from packit_service.utils import get_packit_commands_from_comment, elapsed_seconds
 from packit_service.worker.allowlist import Allowlist
 from packit_service.worker.events import (
     Event,
     EventData,
     PullRequestCommentPagureEvent,
+    PullRequestFlagPagureEvent,
     InstallationEvent,
     CheckRerunEvent,
     IssueCommentEvent,
@@ -126,12 +130,15 @@ class SteveJobs:
         return ServiceConfig.get_service_config()
 
     @classmethod
-    def process_message(cls, event: dict) -> List[TaskResults]:
+    def process_message(
+        cls, event: dict, trace: Optional[dict] = None
+    ) -> List[TaskResults]:
         """
         Entrypoint for message processing.
 
         Args:
             event: Dict with webhook/fed-msg payload.
+            trace: Trace of the event (see `packit_service.tracing`).
 
         Returns:
             List of results of the processing tasks.
@@ -148,7 +155,24 @@ class SteveJobs:
         if event_not_handled or pre_check_failed:
             return []
 
-        return cls(event_object).process()
+        if not trace:
+            return cls(event_object).process()
+
+        event_object.trace_id = trace["id"]
+        record_stages(
+            event_object.trace_id,
+            {
+                EventStage.received: datetime.fromtimestamp(
+                    trace["received"], timezone.utc
+                ),
+                EventStage.enqueued: datetime.fromtimestamp(
+                    trace["enqueued"], timezone.utc
+                ),
+                EventStage.dequeued: datetime.now(timezone.utc),
+            },
+        )
+        with traced(event_object.trace_id):
+            return cls(event_object).process()
 
     def process(self) -> List[TaskResults]:
         """
@@ -173,6 +197,8 @@ class SteveJobs:
             )
             return []
 
+        self.index_pull_request_head_commit()
+
         processing_results = None
 
         # installation is handled differently b/c app is installed to GitHub account
@@ -527,6 +553,25 @@ class SteveJobs:
 
         return True
 
+    def index_pull_request_head_commit(self) -> None:
+        """
+        Record the head commit of the Pagure pull request, so that the pull request
+        can be found by the commit once it's merged (see `GetPagurePullRequestMixin`).
+        """
+        if not isinstance(
+            self.event, (PullRequestCommentPagureEvent, PullRequestFlagPagureEvent)
+        ):
+            return
+        if not self.event.commit_sha:
+            return
+        PullRequestHeadCommitModel.add(
+            pr_id=self.event.pr_id,
+            namespace=self.event.project.namespace,
+            repo_name=self.event.project.repo,
+            project_url=self.event.project_url,
+            commit_sha=self.event.commit_sha,
+        )
+
     def is_project_public_or_enabled_private(self) -> bool:
         """
         Checks whether the project is public or if it is private, explicitly enabled
@@ -542,7 +587,7 @@ class SteveJobs:
                 "Cannot obtain project from this event! "
                 "Skipping private repository check!"
             )
-        elif self.event.project.is_private():
+        elif forge_cache.is_private(self.event.project):
             service_with_namespace = (
                 f"{self.event.project.service.hostname}/"
                 f"{self.event.project.namespace}"
@@ -798,6 +843,7 @@ class SteveJobs:
         # set the time when the accepted status was set so that we
         # can use it later for measurements
         self.event.task_accepted_time = statuses_check_feedback[0]
+        record_stage(EventStage.first_status, time=statuses_check_feedback[0])
 
         response_time = elapsed_seconds(
             begin=self.event.created_at, end=statuses_check_feedback[-1]
@@ -0,0 +1,152 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Memory diagnostics of the worker processes.
+
+The growth of the RSS of the worker process during each Celery task and
+the number of the objects left in the SQLAlchemy identity map when it finishes
+are exported per task name, so that the growth of long-lived workers can be
+attributed to the tasks causing it. (The tasks of the gevent/eventlet workers
+run concurrently, the growth is accounted to every task running meanwhile.)
+
+If `memory_profiler_snapshot_interval` is configured, the allocations are
+traced by `tracemalloc` and every N tasks a snapshot is compared
+to the previous one: the allocation sites which grew the most are logged
+along with the tasks run in between and the most common types of the objects.
+"""
+
+import gc
+import logging
+import os
+import resource
+import tracemalloc
+from collections import Counter
+from typing import Dict, Optional
+
+from packit_service.config import ServiceConfig
+from packit_service.constants import (
+    MEMORY_PROFILER_TOP,
+    MEMORY_PROFILER_TRACEBACK_FRAMES,
+)
+from packit_service.worker.monitoring import (
+    task_identity_map_size,
+    task_rss_growth,
+    worker_gc_objects,
+    worker_rss,
+    worker_traced_memory,
+)
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = resource.getpagesize()
+
+
+def get_rss() -> int:
+    """Current resident set size of the process in bytes."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        # not Linux, the peak RSS (in kilobytes on Linux) is the best we have
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MemoryProfiler:
+    """Memory diagnostics of the tasks run by the worker process."""
+
+    def __init__(self, snapshot_interval: int = 0):
+        """
+        Args:
+            snapshot_interval: Take a memory snapshot every N tasks,
+                0 not to trace the allocations at all.
+        """
+        self.snapshot_interval = snapshot_interval
+        self.tasks_finished = 0
+        # names of the tasks finished since the last snapshot
+        self.tasks_since_snapshot: Counter = Counter()
+        # RSS at the start of the running tasks, by task ID
+        self._rss: Dict[str, int] = {}
+        self._snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def task_started(self, task_id: str) -> None:
+        if self.snapshot_interval and not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY_PROFILER_TRACEBACK_FRAMES)
+        self._rss[task_id] = get_rss()
+
+    def task_finished(self, task_id: str, task_name: str, identity_map: int) -> None:
+        """
+        Args:
+            task_id: ID of the finished task.
+            task_name: Name of the finished task.
+            identity_map: Number of the objects in the identity map
+                of the session of the task.
+        """
+        rss = get_rss()
+        worker_rss.set(rss)
+        if (rss_before := self._rss.pop(task_id, None)) is not None:
+            task_rss_growth.labels(task=task_name).observe(max(0, rss - rss_before))
+        task_identity_map_size.labels(task=task_name).observe(identity_map)
+
+        self.tasks_finished += 1
+        self.tasks_since_snapshot[task_name] += 1
+        if self.snapshot_interval and self.tasks_finished % self.snapshot_interval == 0:
+            self.take_snapshot()
+
+    def take_snapshot(self) -> None:
+        """Log the growth of the allocations since the previous snapshot."""
+        if not tracemalloc.is_tracing():
+            return
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        traced, _ = tracemalloc.get_traced_memory()
+        worker_traced_memory.set(traced)
+
+        objects = gc.get_objects()
+        worker_gc_objects.set(len(objects))
+        object_types = Counter(type(obj).__qualname__ for obj in objects)
+        del objects
+
+        tasks = ", ".join(
+            f"{count}x {name}" for name, count in self.tasks_since_snapshot.items()
+        )
+        details = [
+            f"Memory snapshot after {self.tasks_finished} tasks: "
+            f"traced {traced / 1024**2:.1f}MiB, RSS {get_rss() / 1024**2:.1f}MiB, "
+            f"tasks since the previous snapshot: {tasks}."
+        ]
+        if self._snapshot:
+            # sorted by the absolute difference
+            growth = [
+                stat
+                for stat in snapshot.compare_to(self._snapshot, "lineno")
+                if stat.size_diff > 0
+            ]
+            details.append("Allocation sites which grew the most:")
+            details.extend(f"  {stat}" for stat in growth[:MEMORY_PROFILER_TOP])
+        details.append("Most common objects:")
+        details.extend(
+            f"  {count}x {name}"
+            for name, count in object_types.most_common(MEMORY_PROFILER_TOP)
+        )
+        logger.info("\n".join(details))
+
+        self._snapshot = snapshot
+        self.tasks_since_snapshot.clear()
+
+
+_profilers: Dict[int, MemoryProfiler] = {}
+
+
+def get_memory_profiler() -> MemoryProfiler:
+    """Memory profiler of the current (forked) worker process."""
+    pid = os.getpid()
+    if pid not in _profilers:
+        _profilers[pid] = MemoryProfiler(
+            snapshot_interval=(
+                ServiceConfig.get_service_config().memory_profiler_snapshot_interval
+            )
+        )
+    return _profilers[pid]
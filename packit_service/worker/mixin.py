@@ -6,9 +6,6 @@ import logging
 import re
 from typing import Optional, Protocol, Union, List
 
-from fasjson_client import Client
-from fasjson_client.errors import APIError
-
 from ogr.abstract import Issue
 
 from packit.api import PackitAPI
@@ -20,14 +17,12 @@ from packit.vm_image_build import ImageBuilder
 from ogr.abstract import GitProject, PullRequest, PRStatus
 
 from packit_service.config import ServiceConfig
+from packit_service.models import PullRequestHeadCommitModel
 from packit_service.worker.reporting import BaseCommitStatus
 from packit_service.worker.events import EventData
+from packit_service.worker.helpers.fas import FASJSON_ERRORS, get_fas_user_groups
 from packit_service.worker.helpers.job_helper import BaseJobHelper
 
-from packit_service.constants import (
-    FASJSON_URL,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -161,14 +156,12 @@ class PackitAPIWithDownstreamMixin(PackitAPIWithDownstreamProtocol):
         return self._packit_api
 
     def is_packager(self, user):
-        self.packit_api.init_kerberos_ticket()
-        client = Client(FASJSON_URL)
         try:
-            groups = client.list_user_groups(username=user)
-        except APIError:
-            logger.debug(f"Unable to get groups for user {user}.")
+            groups = get_fas_user_groups(username=user)
+        except FASJSON_ERRORS as ex:
+            logger.debug(f"Unable to get groups for user {user}: {ex}")
             return False
-        return "packager" in [group["groupname"] for group in groups.result]
+        return "packager" in (groups or [])
 
     def clean_api(self) -> None:
         """TODO: probably we should clean something even here
@@ -235,6 +228,18 @@ class GetPagurePullRequestMixin(GetPagurePullRequest):
                 f"Getting pull request with head commit {self.data.commit_sha}"
                 f"for repo {self.project.namespace}/{self.project.repo}"
             )
+            project_info = {
+                "namespace": self.project.namespace,
+                "repo_name": self.project.repo,
+                "project_url": self.data.project_url,
+            }
+            if pr_id := PullRequestHeadCommitModel.get_pr_id(
+                commit_sha=self.data.commit_sha, **project_info
+            ):
+                self._pull_request = self.project.get_pr(pr_id)
+                return self._pull_request
+
+            # not indexed (yet), e.g. no event was received for the pull request
             prs = [
                 pr
                 for pr in self.project.get_pr_list(status=PRStatus.all)
@@ -242,6 +247,11 @@ class GetPagurePullRequestMixin(GetPagurePullRequest):
             ]
             if prs:
                 self._pull_request = prs[0]
+                PullRequestHeadCommitModel.add(
+                    pr_id=self._pull_request.id,
+                    commit_sha=self.data.commit_sha,
+                    **project_info,
+                )
         return self._pull_request
 
     def get_pr_author(self):
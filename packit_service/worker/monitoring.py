@@ -4,10 +4,109 @@
 import logging
 import os
 
-from prometheus_client import CollectorRegistry, Counter, push_to_gateway, Histogram
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    push_to_gateway,
+    Histogram,
+)
+
+from packit_service.metrics import (
+    db_queries,
+    db_queries_duration,
+    forge_conditional_requests,
+    forge_rate_limit_saved,
+)
 
 logger = logging.getLogger(__name__)
 
+# Process-wide metrics, accumulated over all the tasks run by the worker
+# process and pushed along with the metrics of each task.
+testing_farm_request_duration = Histogram(
+    "testing_farm_request_duration_seconds",
+    "Duration of the requests to the Testing Farm API",
+    ["method", "endpoint"],
+    registry=None,
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, float("inf")),
+)
+testing_farm_request_errors = Counter(
+    "testing_farm_request_errors",
+    "Number of failed requests to the Testing Farm API",
+    ["method", "endpoint", "error"],
+    registry=None,
+)
+babysit_detection_lag = Histogram(
+    "babysit_detection_lag_seconds",
+    "Time from the end of a build/test run to noticing it by the babysit check",
+    ["kind"],
+    registry=None,
+    buckets=(30, 60, 120, 300, 600, 1800, 3600, float("inf")),
+)
+babysit_checks_per_item = Histogram(
+    "babysit_checks_per_item",
+    "Number of the babysit checks of a build/test run until it was found completed",
+    ["kind"],
+    registry=None,
+    buckets=(1, 2, 3, 5, 8, 13, 21, float("inf")),
+)
+
+fedmsg_prefilter_rejected = Counter(
+    "fedmsg_prefilter_rejected",
+    "Number of fedmsg messages about builds not submitted by us dropped by the parser",
+    ["topic"],
+    registry=None,
+)
+
+
+worker_rss = Gauge(
+    "worker_rss_bytes",
+    "Resident set size of the worker process after its last task",
+    registry=None,
+)
+task_rss_growth = Histogram(
+    "task_rss_growth_bytes",
+    "Growth of the resident set size of the worker process during a Celery task",
+    ["task"],
+    registry=None,
+    buckets=(
+        0,
+        64 * 1024,
+        256 * 1024,
+        1024**2,
+        4 * 1024**2,
+        16 * 1024**2,
+        64 * 1024**2,
+        256 * 1024**2,
+        float("inf"),
+    ),
+)
+task_identity_map_size = Histogram(
+    "task_identity_map_size",
+    "Number of the objects in the SQLAlchemy identity map when a Celery task finishes",
+    ["task"],
+    registry=None,
+    buckets=(0, 10, 50, 100, 500, 1000, 5000, 10000, float("inf")),
+)
+worker_traced_memory = Gauge(
+    "worker_traced_memory_bytes",
+    "Memory allocated by Python in the worker process (taken by the memory snapshots)",
+    registry=None,
+)
+worker_gc_objects = Gauge(
+    "worker_gc_objects",
+    "Number of the objects tracked by the garbage collector (taken by the memory snapshots)",
+    registry=None,
+)
+
+task_queue_latency = Histogram(
+    "task_queue_latency_seconds",
+    "Time a Celery task waited in the queue for a worker",
+    ["task", "queue"],
+    registry=None,
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600, float("inf")),
+)
+
 
 class Pushgateway:
     def __init__(self):
@@ -18,6 +117,21 @@ class Pushgateway:
         # the job name corresponds to worker name (e.g. packit-worker-0)
         self.worker_name = os.getenv("HOSTNAME")
         self.registry = CollectorRegistry()
+        self.registry.register(testing_farm_request_duration)
+        self.registry.register(testing_farm_request_errors)
+        self.registry.register(forge_conditional_requests)
+        self.registry.register(forge_rate_limit_saved)
+        self.registry.register(babysit_detection_lag)
+        self.registry.register(babysit_checks_per_item)
+        self.registry.register(fedmsg_prefilter_rejected)
+        self.registry.register(db_queries)
+        self.registry.register(db_queries_duration)
+        self.registry.register(worker_rss)
+        self.registry.register(task_rss_growth)
+        self.registry.register(task_identity_map_size)
+        self.registry.register(worker_traced_memory)
+        self.registry.register(worker_gc_objects)
+        self.registry.register(task_queue_latency)
 
         # metrics
         self.copr_builds_queued = Counter(
@@ -66,7 +66,12 @@ from packit_service.worker.events.new_hotness import NewHotnessUpdateEvent
 from packit_service.worker.events.pagure import PullRequestFlagPagureEvent
 from packit_service.worker.handlers.abstract import MAP_CHECK_PREFIX_TO_HANDLER
 from packit_service.worker.helpers.build import CoprBuildJobHelper, KojiBuildJobHelper
+from packit_service.worker.helpers.fedmsg_filter import (
+    submitted_copr_builds,
+    submitted_koji_builds,
+)
 from packit_service.worker.helpers.testing_farm import TestingFarmJobHelper
+from packit_service.worker.monitoring import fedmsg_prefilter_rejected
 
 logger = logging.getLogger(__name__)
 
@@ -1243,9 +1248,14 @@ class Parser:
             # Topic not supported.
             return None
 
+        build_id = event.get("build")
+        if not submitted_copr_builds.might_contain(build_id):
+            fedmsg_prefilter_rejected.labels(topic=topic).inc()
+            logger.debug(f"Copr build {build_id} not submitted by us.")
+            return None
+
         logger.info(f"Copr event; {event.get('what')}")
 
-        build_id = event.get("build")
         chroot = event.get("chroot")
         status = event.get("status")
         owner = event.get("owner")
@@ -1259,10 +1269,17 @@ class Parser:
 
     @staticmethod
     def parse_koji_task_event(event) -> Optional[KojiTaskEvent]:
-        if event.get("topic") != "org.fedoraproject.prod.buildsys.task.state.change":
+        if (
+            topic := event.get("topic")
+        ) != "org.fedoraproject.prod.buildsys.task.state.change":
             return None
 
         build_id = event.get("id")
+        if not submitted_koji_builds.might_contain(build_id):
+            fedmsg_prefilter_rejected.labels(topic=topic).inc()
+            logger.debug(f"Koji task {build_id} not submitted by us.")
+            return None
+
         logger.info(f"Koji event: build_id={build_id}")
 
         state = nested_get(event, "info", "state")
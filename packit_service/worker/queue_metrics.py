@@ -0,0 +1,159 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Metrics of the Celery queues for scaling the workers.
+
+The depth of the queues and the age of their oldest messages are sampled
+from the Redis broker by the periodic `export_queue_metrics` task, which pushes
+them to the Pushgateway. The task waits in the queue like any other one,
+so its samples are late when the workers are saturated; the sidecar exporter
+(`CELERY_COMMAND=queue-metrics run_worker.sh`) samples the queues on every
+scrape instead.
+
+The time the messages were published is set in their headers (see
+`packit_service.celerizer`). Messages published by other senders
+(e.g. packit-service-fedmsg) don't have it, their age is counted from
+the first time the exporter saw them at the head of the queue.
+
+The workers observe how long each task waited in the queue
+(`task_queue_latency_seconds` by the task name and the queue).
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from threading import Event
+from time import time
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+import click
+from celery import Task
+from kombu.exceptions import OperationalError
+from prometheus_client import CollectorRegistry, push_to_gateway, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+from redis.exceptions import RedisError
+
+from packit_service.celerizer import celery_app
+from packit_service.constants import CELERY_PUBLISHED_AT_HEADER, CELERY_QUEUES
+from packit_service.worker.monitoring import task_queue_latency
+
+logger = logging.getLogger(__name__)
+
+
+class QueueCollector:
+    """Samples the Celery queues in the Redis broker on every collection."""
+
+    def __init__(self, queues: Iterable[str] = CELERY_QUEUES):
+        self.queues = tuple(queues)
+        # when the oldest messages without the publish time were first seen,
+        # by task ID
+        self._first_seen: Dict[str, float] = {}
+
+    def sample(self) -> Dict[str, Tuple[int, float]]:
+        """Depth of the queues and the age of their oldest messages (in seconds)."""
+        now = time()
+        first_seen = {}
+        samples = {}
+        with celery_app.connection_for_read() as connection:
+            client = connection.default_channel.client
+            for queue in self.queues:
+                # kombu pushes the messages to the left, workers pop from the right
+                pipeline = client.pipeline()
+                pipeline.llen(queue)
+                pipeline.lindex(queue, -1)
+                depth, oldest = pipeline.execute()
+                age = 0.0
+                if oldest:
+                    headers = json.loads(oldest).get("headers") or {}
+                    if published_at := headers.get(CELERY_PUBLISHED_AT_HEADER):
+                        age = now - published_at
+                    elif task_id := headers.get("id"):
+                        first_seen[task_id] = self._first_seen.get(task_id, now)
+                        age = now - first_seen[task_id]
+                samples[queue] = depth, max(0.0, age)
+        self._first_seen = first_seen
+        return samples
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        depth = GaugeMetricFamily(
+            "celery_queue_depth",
+            "Number of the messages waiting in the Celery queue",
+            labels=["queue"],
+        )
+        age = GaugeMetricFamily(
+            "celery_queue_oldest_message_age_seconds",
+            "Age of the oldest message waiting in the Celery queue",
+            labels=["queue"],
+        )
+        try:
+            samples = self.sample()
+        except (OperationalError, RedisError, ValueError) as ex:
+            # no samples are better than zeros when the broker is unavailable
+            logger.warning(f"Failed to sample the Celery queues: {ex!r}")
+            return
+        for queue, (queue_depth, oldest_age) in samples.items():
+            depth.add_metric([queue], queue_depth)
+            age.add_metric([queue], oldest_age)
+        yield depth
+        yield age
+
+
+def observe_queue_latency(task: Task) -> None:
+    """Observe how long the task, which is about to run, waited in the queue."""
+    request = task.request
+    if not (published_at := request.get(CELERY_PUBLISHED_AT_HEADER)):
+        return
+    start = published_at
+    if request.eta:
+        # the countdown is not a latency
+        start = max(start, datetime.fromisoformat(request.eta).timestamp())
+    queue = (request.delivery_info or {}).get("routing_key") or "unknown"
+    task_queue_latency.labels(task=task.name, queue=queue).observe(
+        max(0.0, time() - start)
+    )
+
+
+_registry: Optional[CollectorRegistry] = None
+
+
+def push_queue_metrics() -> None:
+    """Push the metrics of the queues to the Pushgateway."""
+    global _registry
+    pushgateway_address = os.getenv("PUSHGATEWAY_ADDRESS", "http://pushgateway")
+    if not pushgateway_address:
+        logger.debug("Pushgateway address not defined.")
+        return
+
+    if _registry is None:
+        _registry = CollectorRegistry()
+        _registry.register(QueueCollector())
+    # the same job for all the workers, the queues are shared
+    push_to_gateway(pushgateway_address, job="packit-queues", registry=_registry)
+
+
+@click.command()
+@click.option(
+    "--port", default=8000, show_default=True, help="Port to serve the metrics on."
+)
+@click.option(
+    "--queue",
+    "queues",
+    multiple=True,
+    default=CELERY_QUEUES,
+    show_default=True,
+    help="Celery queue to sample, can be given multiple times.",
+)
+def main(port: int, queues: Tuple[str, ...]):
+    """Serve the metrics of the Celery queues, sampled on every scrape."""
+    logging.basicConfig(level=logging.INFO)
+    registry = CollectorRegistry()
+    registry.register(QueueCollector(queues))
+    start_http_server(port, registry=registry)
+    logger.info(f"Serving the metrics of the queues {', '.join(queues)} on {port}.")
+    Event().wait()
+
+
+if __name__ == "__main__":
+    main()
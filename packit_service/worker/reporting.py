@@ -7,7 +7,7 @@ from enum import Enum, auto
 from random import choice
 from typing import Optional, Union, Dict, Callable
 
-from ogr.abstract import CommitStatus, GitProject
+from ogr.abstract import CommitStatus, GitProject, Issue, IssueStatus
 from ogr.exceptions import GithubAPIException, GitlabAPIException
 from ogr.services.github import GithubProject
 from ogr.services.github.check_run import (
@@ -23,6 +23,7 @@ from packit_service.constants import (
     DOCS_URL,
     MSG_TABLE_HEADER_WITH_DETAILS,
 )
+from packit_service.models import PackitIssueModel
 
 logger = logging.getLogger(__name__)
 
@@ -533,6 +534,66 @@ class StatusReporterGithubChecks(StatusReporterGithubStatuses):
             super().set_status(state, description, check_name, url)
 
 
+def create_issue_if_needed(
+    project: GitProject,
+    title: str,
+    message: str,
+    comment_to_existing: Optional[str] = None,
+    add_packit_prefix: Optional[bool] = True,
+) -> Optional[Issue]:
+    """
+    Create an issue in the project unless there is an open one with the title,
+    `comment_to_existing` is added to such issue.
+
+    The issues opened by Packit are recorded in the database, the issues
+    of the project are listed only if there is no record for the title yet
+    (e.g. for the issues opened before they were recorded). The recorded
+    issue is checked to be still open, it could have been closed meanwhile.
+    """
+    # only ogr projects can be recorded, stubs are always listed
+    if not isinstance(project, GitProject):
+        return PackageConfigGetter.create_issue_if_needed(
+            project, title, message, comment_to_existing, add_packit_prefix
+        )
+
+    project_info = {
+        "namespace": project.namespace,
+        "repo_name": project.repo,
+        "project_url": f"https://{project.service.hostname}/"
+        f"{project.namespace}/{project.repo}",
+    }
+    packit_issue = PackitIssueModel.get_latest(title=title, **project_info)
+
+    existing_issue = None
+    if packit_issue and not packit_issue.closed:
+        logger.debug(f"Issue {packit_issue.issue_id} with the title is recorded.")
+        existing_issue = project.get_issue(packit_issue.issue_id)
+        if existing_issue.status != IssueStatus.open:
+            logger.debug(f"Issue {existing_issue.id} was closed meanwhile.")
+            packit_issue.set_closed()
+            existing_issue = None
+    elif not packit_issue:
+        for issue in project.get_issue_list():
+            if title in issue.title:
+                logger.debug(f"Title of issue {issue.id} matches.")
+                existing_issue = issue
+                PackitIssueModel.create(title=title, issue_id=issue.id, **project_info)
+                break
+
+    if existing_issue:
+        if comment_to_existing:
+            existing_issue.comment(body=comment_to_existing)
+            logger.debug(f"Issue #{existing_issue.id} updated: {existing_issue.url}")
+        return None
+
+    issue = project.create_issue(
+        title=f"[packit] {title}" if add_packit_prefix else title, body=message
+    )
+    logger.debug(f"Issue #{issue.id} created: {issue.url}")
+    PackitIssueModel.create(title=title, issue_id=issue.id, **project_info)
+    return issue
+
+
 def report_in_issue_repository(
     issue_repository: str,
     service_config: ServiceConfig,
@@ -558,7 +619,7 @@ def report_in_issue_repository(
         "or update the existing one."
     )
     issue_repo = service_config.get_project(url=issue_repository)
-    PackageConfigGetter.create_issue_if_needed(
+    create_issue_if_needed(
         project=issue_repo,
         title=title,
         message=message,
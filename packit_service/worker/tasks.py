@@ -3,11 +3,13 @@
 
 import logging
 import socket
+from contextvars import Token
+from datetime import datetime, timezone
 from os import getenv
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from celery import Task
-from celery.signals import after_setup_logger
+from celery import Task, signature
+from celery.signals import after_setup_logger, task_postrun, task_prerun
 from ogr import __version__ as ogr_version
 from sqlalchemy import __version__ as sqlal_version
 from syslog_rfc5424_formatter import RFC5424Formatter
@@ -16,18 +18,35 @@ from packit import __version__ as packit_version
 from packit.exceptions import PackitException
 from packit_service import __version__ as ps_version
 from packit_service.celerizer import celery_app
+from packit_service.config import ServiceConfig
 from packit_service.constants import (
+    ARCHIVE_WATCHER_MAX_RETRIES,
+    ARCHIVE_WATCHER_RETRY_BACKOFF,
+    ARCHIVE_WATCHER_RETRY_BACKOFF_MAX,
     DEFAULT_RETRY_LIMIT,
     DEFAULT_RETRY_BACKOFF,
     CELERY_DEFAULT_MAIN_TASK_NAME,
 )
-from packit_service.models import VMImageBuildTargetModel
+from packit_service.event_archive import record_event
+from packit_service.models import (
+    VMImageBuildTargetModel,
+    end_task_session,
+    identity_map_size,
+    start_task_session,
+)
+from packit_service.query_profiler import start_profiling, stop_profiling
 from packit_service.utils import (
     load_job_config,
     load_package_config,
     log_package_versions,
 )
-from packit_service.worker.database import discard_old_srpm_build_logs, backup
+from packit_service.worker.database import (
+    discard_old_event_stage_times,
+    discard_old_srpm_build_logs,
+    backup,
+    reconcile_packit_issues,
+    refresh_usage_statistics,
+)
 from packit_service.worker.handlers import (
     CoprBuildEndHandler,
     CoprBuildStartHandler,
@@ -59,10 +78,19 @@ from packit_service.worker.helpers.build.babysit import (
     check_copr_build,
     check_pending_copr_builds,
     check_pending_testing_farm_runs,
-    update_vm_image_build,
     check_pending_vm_image_builds,
+    get_copr_build_check_countdown,
+    poll_vm_image_build,
 )
+from packit_service.worker.helpers.polling import vm_image_build_polling_scheduler
+from packit_service.worker.helpers.sync_release.archive import is_archive_available
 from packit_service.worker.jobs import SteveJobs
+from packit_service.worker.memory_profiler import get_memory_profiler
+from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.queue_metrics import (
+    observe_queue_latency,
+    push_queue_metrics,
+)
 from packit_service.worker.result import TaskResults
 
 logger = logging.getLogger(__name__)
@@ -76,6 +104,10 @@ class PackitVMImageBuildTimeoutException(PackitException):
     """VM image build has timed out"""
 
 
+class PackitArchiveNotAvailableException(PackitException):
+    """Upstream archive is not available yet"""
+
+
 @after_setup_logger.connect
 def setup_loggers(logger, *args, **kwargs):
     # debug logs of these are super-duper verbose
@@ -113,6 +145,40 @@ def setup_loggers(logger, *args, **kwargs):
     log_package_versions(package_versions)
 
 
+# tokens of the query profiles of the running tasks, by task ID
+_query_profiling: Dict[str, Token] = {}
+
+
+@task_prerun.connect
+def start_query_profiling(task_id: str, task: Task, *args, **kwargs):
+    _query_profiling[task_id] = start_profiling("task", task.name)
+
+
+@task_postrun.connect
+def stop_query_profiling(task_id: str, *args, **kwargs):
+    if token := _query_profiling.pop(task_id, None):
+        stop_profiling(token)
+
+
+@task_prerun.connect
+def start_task_scope(task_id: str, *args, **kwargs):
+    start_task_session()
+    get_memory_profiler().task_started(task_id)
+
+
+@task_postrun.connect
+def end_task_scope(task_id: str, task: Task, *args, **kwargs):
+    get_memory_profiler().task_finished(
+        task_id, task.name, identity_map=identity_map_size()
+    )
+    end_task_session()
+
+
+@task_prerun.connect
+def observe_task_queue_latency(task_id: str, task: Task, *args, **kwargs):
+    observe_queue_latency(task)
+
+
 class HandlerTaskWithRetry(Task):
     autoretry_for = (Exception,)
     max_retries = int(getenv("CELERY_RETRY_LIMIT", DEFAULT_RETRY_LIMIT))
@@ -132,36 +198,75 @@ class BodhiHandlerTaskWithRetry(HandlerTaskWithRetry):
 @celery_app.task(
     name=getenv("CELERY_MAIN_TASK_NAME") or CELERY_DEFAULT_MAIN_TASK_NAME, bind=True
 )
-def process_message(self, event: dict) -> List[TaskResults]:
+def process_message(
+    self, event: dict, trace: Optional[dict] = None
+) -> List[TaskResults]:
     """
     Main celery task for processing messages.
 
     Args:
         event: event data
+        trace: trace of the event (see `packit_service.tracing`)
 
     Returns:
         task results
     """
-    return SteveJobs.process_message(event=event)
+    if "topic" in event:
+        # the fedmsg events don't go through the webhook endpoints
+        record_event("fedmsg", event)
+    return SteveJobs.process_message(event=event, trace=trace)
 
 
 @celery_app.task(
     bind=True,
     name="task.babysit_copr_build",
-    autoretry_for=(PackitCoprBuildTimeoutException,),
-    retry_backoff=30,  # retry again in 30s, 60s, 120s, 240s...
-    retry_backoff_max=3600,  # at most, wait for an hour between retries
-    max_retries=14,  # retry 14 times; with the backoff values above this is ~8 hours
-    retry_jitter=False,  # do not jitter, as it might considerably reduce the total wait time
+    # retry 14 times, the next check is scheduled when the build is expected to end
+    # (see polling.py), afterwards the build is checked by the periodic task
+    max_retries=14,
 )
 def babysit_copr_build(self, build_id: int):
     """check status of a copr build and update it in DB"""
     if not check_copr_build(build_id=build_id):
-        raise PackitCoprBuildTimeoutException(
-            f"No feedback for copr build id={build_id} yet"
+        raise self.retry(
+            countdown=get_copr_build_check_countdown(build_id),
+            exc=PackitCoprBuildTimeoutException(
+                f"No feedback for copr build id={build_id} yet"
+            ),
         )
 
 
+@celery_app.task(
+    bind=True,
+    name="task.wait_for_upstream_archive",
+    autoretry_for=(PackitArchiveNotAvailableException,),
+    retry_backoff=ARCHIVE_WATCHER_RETRY_BACKOFF,
+    retry_backoff_max=ARCHIVE_WATCHER_RETRY_BACKOFF_MAX,
+    max_retries=ARCHIVE_WATCHER_MAX_RETRIES,
+    retry_jitter=False,
+)
+def wait_for_upstream_archive(
+    self, url: str, task_name: str, task_kwargs: dict, task_retries: int
+):
+    """
+    Dispatch the sync-release task once the upstream archive is available.
+
+    When the archive doesn't become available in time, the task is dispatched
+    anyway so that the failure is handled (and reported) by the task itself.
+
+    Args:
+        url: URL of the archive.
+        task_name: Name of the sync-release task.
+        task_kwargs: Keyword arguments of the sync-release task.
+        task_retries: Number of retries of the sync-release task so far.
+    """
+    if not is_archive_available(url):
+        if self.request.retries < self.max_retries:
+            raise PackitArchiveNotAvailableException(f"{url} is not available yet")
+        logger.info(f"{url} is still not available, running {task_name} anyway.")
+
+    signature(task_name, kwargs=task_kwargs).apply_async(retries=task_retries)
+
+
 # tasks for running the handlers
 @celery_app.task(name=TaskName.copr_build_start, base=HandlerTaskWithRetry)
 def run_copr_build_start_handler(event: dict, package_config: dict, job_config: dict):
@@ -342,13 +447,18 @@ def run_sync_from_downstream_handler(
     queue="long-running",
 )
 def run_downstream_koji_build(
-    self, event: dict, package_config: dict, job_config: dict
+    self,
+    event: dict,
+    package_config: dict,
+    job_config: dict,
+    koji_build_branches: Optional[List[str]] = None,
 ):
     handler = DownstreamKojiBuildHandler(
         package_config=load_package_config(package_config),
         job_config=load_job_config(job_config),
         event=event,
         celery_task=self,
+        koji_build_branches=koji_build_branches,
     )
     return get_handlers_task_results(handler.run_job(), event)
 
@@ -360,13 +470,18 @@ def run_downstream_koji_build(
     queue="long-running",
 )
 def run_retrigger_downstream_koji_build(
-    self, event: dict, package_config: dict, job_config: dict
+    self,
+    event: dict,
+    package_config: dict,
+    job_config: dict,
+    koji_build_branches: Optional[List[str]] = None,
 ):
     handler = RetriggerDownstreamKojiBuildHandler(
         package_config=load_package_config(package_config),
         job_config=load_job_config(job_config),
         event=event,
         celery_task=self,
+        koji_build_branches=koji_build_branches,
     )
     return get_handlers_task_results(handler.run_job(), event)
 
@@ -451,7 +566,9 @@ def run_vm_image_build(self, event: dict, package_config: dict, job_config: dict
     return get_handlers_task_results(handler.run_job(), event)
 
 
-@celery_app.task(name=TaskName.vm_image_build_result, base=HandlerTaskWithRetry)
+@celery_app.task(
+    bind=True, name=TaskName.vm_image_build_result, base=HandlerTaskWithRetry
+)
 def run_vm_image_build_result(
     self, event: dict, package_config: dict, job_config: dict
 ):
@@ -466,18 +583,22 @@ def run_vm_image_build_result(
 @celery_app.task(
     bind=True,
     name="task.babysit_vm_image_build",
-    autoretry_for=(PackitVMImageBuildTimeoutException,),
-    retry_backoff=30,  # retry again in 30s, 60s, 120s, 240s...
-    retry_backoff_max=3600,  # at most, wait for an hour between retries
-    max_retries=14,  # retry 14 times; with the backoff values above this is ~8 hours
-    retry_jitter=False,  # do not jitter, as it might considerably reduce the total wait time
+    # retry 14 times, the next check is scheduled when the build is expected to end
+    # (see polling.py), afterwards the build is checked by the periodic task
+    max_retries=14,
 )
 def babysit_vm_image_build(self, build_id: int):
     """check status of a vm image build and update it in DB"""
     model = VMImageBuildTargetModel.get_by_build_id(build_id)
-    if not update_vm_image_build(build_id, model):
-        raise PackitVMImageBuildTimeoutException(
-            f"No feedback for vm image build id={build_id} yet"
+    current_time = datetime.now(timezone.utc)
+    if not poll_vm_image_build(build_id, model, current_time):
+        raise self.retry(
+            countdown=vm_image_build_polling_scheduler.get_countdown(
+                [model], datetime.now(timezone.utc)
+            ),
+            exc=PackitVMImageBuildTimeoutException(
+                f"No feedback for vm image build id={build_id} yet"
+            ),
         )
 
 
@@ -489,22 +610,88 @@ def get_handlers_task_results(results: dict, event: dict) -> dict:
 # Periodic tasks
 
 
+def dispatch_babysit_shards(task_name: str) -> bool:
+    """
+    Split the periodic check into shards run as separate tasks
+    so that they are processed in parallel by the workers.
+
+    Returns:
+        Whether the shards were dispatched, False if the check is not split.
+    """
+    shards = ServiceConfig.get_service_config().babysit_shards
+    if shards <= 1:
+        return False
+
+    logger.info(f"Dispatching {shards} shards of {task_name}.")
+    for shard in range(shards):
+        signature(task_name, kwargs={"shard": shard, "shards": shards}).apply_async(
+            queue="long-running"
+        )
+    return True
+
+
 @celery_app.task
 def babysit_pending_copr_builds() -> None:
-    check_pending_copr_builds()
+    if not dispatch_babysit_shards(
+        "packit_service.worker.tasks.babysit_pending_copr_builds_shard"
+    ):
+        check_pending_copr_builds()
+        Pushgateway().push()
+
+
+@celery_app.task
+def babysit_pending_copr_builds_shard(shard: int, shards: int) -> None:
+    check_pending_copr_builds(shard=shard, shards=shards)
+    Pushgateway().push()
 
 
 @celery_app.task
 def babysit_pending_tft_runs() -> None:
-    check_pending_testing_farm_runs()
+    if not dispatch_babysit_shards(
+        "packit_service.worker.tasks.babysit_pending_tft_runs_shard"
+    ):
+        check_pending_testing_farm_runs()
+        Pushgateway().push()
+
+
+@celery_app.task
+def babysit_pending_tft_runs_shard(shard: int, shards: int) -> None:
+    check_pending_testing_farm_runs(shard=shard, shards=shards)
+    Pushgateway().push()
 
 
 @celery_app.task
 def database_maintenance() -> None:
     discard_old_srpm_build_logs()
+    discard_old_event_stage_times()
     backup()
 
 
 @celery_app.task
 def babysit_pending_vm_image_builds() -> None:
-    check_pending_vm_image_builds()
+    if not dispatch_babysit_shards(
+        "packit_service.worker.tasks.babysit_pending_vm_image_builds_shard"
+    ):
+        check_pending_vm_image_builds()
+        Pushgateway().push()
+
+
+@celery_app.task
+def babysit_pending_vm_image_builds_shard(shard: int, shards: int) -> None:
+    check_pending_vm_image_builds(shard=shard, shards=shards)
+    Pushgateway().push()
+
+
+@celery_app.task
+def refresh_usage_statistics_cache() -> None:
+    refresh_usage_statistics()
+
+
+@celery_app.task
+def export_queue_metrics() -> None:
+    push_queue_metrics()
+
+
+@celery_app.task
+def reconcile_packit_issues_with_forges() -> None:
+    reconcile_packit_issues()
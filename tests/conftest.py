@@ -12,6 +12,7 @@ from flexmock import flexmock
 from ogr import GithubService, GitlabService, PagureService
 from packit.config import JobConfigTriggerType, JobConfig, PackageConfig
 from packit.config.common_package_config import Deployment
+from packit_service.cache import LocalCache, set_shared_cache
 from packit_service.config import ServiceConfig
 from packit_service.models import (
     JobTriggerModelType,
@@ -58,6 +59,15 @@ def global_service_config():
     ServiceConfig.service_config = service_config
 
 
+@pytest.fixture(autouse=True)
+def shared_cache():
+    """Fresh in-memory shared cache for each test instead of Redis."""
+    cache = LocalCache()
+    set_shared_cache(cache)
+    yield cache
+    set_shared_cache(None)
+
+
 @pytest.fixture()
 def dump_http_com():
     """
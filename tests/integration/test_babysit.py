@@ -5,6 +5,8 @@ import datetime
 
 import pytest
 import requests
+from celery import signature
+from celery.canvas import Signature
 from copr.v3 import Client, CoprNoResultException
 from flexmock import flexmock
 
@@ -26,16 +28,31 @@ from packit_service.models import (
 )
 from packit_service.worker.events import AbstractCoprBuildEvent, TestingFarmResultsEvent
 from packit_service.worker.helpers.build.babysit import (
+    HandlerTaskDispatcher,
     check_copr_build,
     update_copr_builds,
     check_pending_copr_builds,
     check_pending_testing_farm_runs,
 )
-from packit_service.worker.handlers import (
-    CoprBuildEndHandler,
-    CoprBuildStartHandler,
-    TestingFarmResultsHandler,
+from packit_service.worker.helpers.polling import (
+    copr_build_polling_scheduler,
+    tft_test_run_polling_scheduler,
+    vm_image_build_polling_scheduler,
 )
+from packit_service.worker.helpers.testing_farm_client import TestingFarmClient
+
+
+@pytest.fixture(autouse=True)
+def polling_scheduler():
+    """All the builds/runs are due, the deadlines are tested in test_polling.py."""
+    for scheduler in (
+        copr_build_polling_scheduler,
+        tft_test_run_polling_scheduler,
+        vm_image_build_polling_scheduler,
+    ):
+        flexmock(scheduler).should_receive("is_due").and_return(True)
+        flexmock(scheduler).should_receive("schedule").and_return(60)
+        flexmock(scheduler).should_receive("completed")
 
 
 def test_check_copr_build_no_build():
@@ -169,7 +186,7 @@ def test_check_copr_build_updated(build_status, build_ended_on):
             packages={"package": CommonPackageConfig()},
         )
     )
-    flexmock(CoprBuildEndHandler).should_receive("run_job").and_return().once()
+    flexmock(Signature).should_receive("apply_async").once()
     assert check_copr_build(build_id=1) is bool(build_ended_on)
 
 
@@ -253,7 +270,7 @@ def test_check_copr_build_waiting_started():
             packages={"package": CommonPackageConfig()},
         )
     )
-    flexmock(CoprBuildStartHandler).should_receive("run_job").and_return().once()
+    flexmock(Signature).should_receive("apply_async").once()
     assert not check_copr_build(build_id=1)
 
 
@@ -337,7 +354,7 @@ def test_check_copr_build_waiting_already_started():
             packages={"package": CommonPackageConfig()},
         )
     )
-    flexmock(CoprBuildStartHandler).should_receive("run_job").and_return().never()
+    flexmock(Signature).should_receive("apply_async").never()
     assert not check_copr_build(build_id=1)
 
 
@@ -356,7 +373,7 @@ def test_check_copr_build_not_exists():
         builds.append(flexmock(status=BuildStatus.pending, build_id=1))
         builds[i].should_receive("set_status").with_args(BuildStatus.error).once()
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending
+        BuildStatus.pending, due_before=datetime.datetime, shard=0, shards=1
     ).and_return(builds)
     check_pending_copr_builds()
 
@@ -393,14 +410,14 @@ def test_check_update_copr_builds_timeout():
     build.should_receive("set_status").with_args(BuildStatus.error).once()
 
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending
+        BuildStatus.pending, due_before=datetime.datetime, shard=0, shards=1
     ).and_return([build])
     update_copr_builds(1, [build])
 
 
 def test_check_pending_copr_builds_no_builds():
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending
+        BuildStatus.pending, due_before=datetime.datetime, shard=0, shards=1
     ).and_return([])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_copr_builds"
@@ -413,23 +430,83 @@ def test_check_pending_copr_builds():
     build2 = flexmock(status=BuildStatus.pending, build_id="2")
     build3 = flexmock(status=BuildStatus.pending, build_id="1")
     flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
-        BuildStatus.pending
+        BuildStatus.pending, due_before=datetime.datetime, shard=0, shards=1
     ).and_return([build1, build2, build3])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_copr_builds"
-    ).with_args(1, [build1, build3]).once()
+    ).with_args(1, [build1, build3], HandlerTaskDispatcher).once()
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_copr_builds"
-    ).with_args(2, [build2]).once()
+    ).with_args(2, [build2], HandlerTaskDispatcher).once()
     check_pending_copr_builds()
 
 
+def test_check_pending_copr_builds_shard():
+    build1 = flexmock(status=BuildStatus.pending, build_id="1")
+    build2 = flexmock(status=BuildStatus.pending, build_id="1")
+    # the builds of the shard are selected by the query
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").with_args(
+        BuildStatus.pending, due_before=datetime.datetime, shard=1, shards=2
+    ).and_return([build1, build2])
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds"
+    ).with_args(1, [build1, build2], HandlerTaskDispatcher).once()
+    check_pending_copr_builds(shard=1, shards=2)
+
+
+def test_check_pending_testing_farm_runs_shard():
+    run = flexmock(id=5, pipeline_id=5, submitted_time=None)
+    # the runs of the shard are selected by the query
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=2,
+        shards=3,
+    ).and_return([run])
+    run.should_receive("set_status").with_args(TestingFarmResult.error).once()
+    flexmock(TestingFarmClient).should_receive("request").and_return(
+        flexmock(ok=False, status_code=500, reason="Internal Server Error")
+    ).once()
+    check_pending_testing_farm_runs(shard=2, shards=3)
+
+
+def test_check_pending_testing_farm_runs_request_timeout():
+    runs = [flexmock(id=id, pipeline_id=id, submitted_time=None) for id in (1, 2)]
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=0,
+        shards=1,
+    ).and_return(runs)
+    # the state of the timed out pipeline is checked again by the next sweep
+    runs[0].should_receive("set_status").never()
+    runs[1].should_receive("set_status").with_args(TestingFarmResult.error).once()
+
+    def request(endpoint):
+        if endpoint == "requests/1":
+            raise requests.ReadTimeout("Read timed out.")
+        return flexmock(ok=False, status_code=500, reason="Internal Server Error")
+
+    # a slow pipeline doesn't abort the check of the others
+    flexmock(TestingFarmClient).should_receive("request").replace_with(request).twice()
+    check_pending_testing_farm_runs()
+
+
 def test_check_pending_testing_farm_runs_no_runs():
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
-        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=0,
+        shards=1,
     ).and_return([])
     # No request should be performed
-    flexmock(requests).should_receive("get").never()
+    flexmock(TestingFarmClient).should_receive("request").never()
     check_pending_testing_farm_runs()
 
 
@@ -470,13 +547,19 @@ def test_check_pending_testing_farm_runs(created):
         .mock()
     )
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
-        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=0,
+        shards=1,
     ).and_return([run]).once()
     flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").with_args(
         pipeline_id=pipeline_id
     ).and_return(run)
-    url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(TestingFarmClient).should_receive("request").with_args(
+        endpoint="requests/1"
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -498,7 +581,7 @@ def test_check_pending_testing_farm_runs(created):
             packages={"package": CommonPackageConfig()},
         )
     )
-    flexmock(TestingFarmResultsHandler).should_receive("run_job").and_return().once()
+    flexmock(Signature).should_receive("apply_async").once()
     check_pending_testing_farm_runs()
 
 
@@ -514,7 +597,12 @@ def test_check_pending_testing_farm_runs_timeout(status):
     )
     run.should_receive("set_status").with_args(TestingFarmResult.error).once()
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
-        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=0,
+        shards=1,
     ).and_return([run]).once()
     check_pending_testing_farm_runs()
 
@@ -552,13 +640,19 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
         .mock()
     )
     flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").with_args(
-        TestingFarmResult.new, TestingFarmResult.queued, TestingFarmResult.running
+        TestingFarmResult.new,
+        TestingFarmResult.queued,
+        TestingFarmResult.running,
+        due_before=datetime.datetime,
+        shard=0,
+        shards=1,
     ).and_return([run]).once()
     flexmock(TFTTestRunTargetModel).should_receive("get_by_pipeline_id").with_args(
         pipeline_id=pipeline_id
     ).and_return(run)
-    url = "https://api.dev.testing-farm.io/v0.1/requests/1"
-    flexmock(requests).should_receive("get").with_args(url).and_return(
+    flexmock(TestingFarmClient).should_receive("request").with_args(
+        endpoint="requests/1"
+    ).and_return(
         flexmock(
             json=lambda: {
                 "id": pipeline_id,
@@ -598,5 +692,90 @@ def test_check_pending_testing_farm_runs_identifiers(identifier):
             packages={"package": CommonPackageConfig()},
         )
     )
-    flexmock(TestingFarmResultsHandler).should_receive("run_job").and_return().once()
+    flexmock(Signature).should_receive("apply_async").once()
+    check_pending_testing_farm_runs()
+
+
+def test_check_pending_testing_farm_runs_no_config():
+    pipeline_id = 1
+    run = (
+        flexmock(
+            pipeline_id=pipeline_id,
+            submitted_time=datetime.datetime.utcnow(),
+            commit_sha="123456",
+            target="fedora-rawhide-x86_64",
+            data={},
+            job_trigger=flexmock(type=JobTriggerModelType.pull_request),
+            identifier=None,
+        )
+        .should_receive("get_trigger_object")
+        .and_return(
+            flexmock(
+                project=flexmock(
+                    repo_name="repo_name",
+                    namespace="the-namespace",
+                    project_url="https://github.com/the-namespace/repo_name",
+                ),
+                pr_id=5,
+                job_config_trigger_type=JobConfigTriggerType.pull_request,
+                job_trigger_model_type=JobTriggerModelType.pull_request,
+                id=123,
+            )
+        )
+        .mock()
+    )
+    flexmock(TFTTestRunTargetModel).should_receive("get_all_by_status").and_return(
+        [run]
+    )
+    flexmock(TestingFarmClient).should_receive("request").and_return(
+        flexmock(
+            json=lambda: {
+                "id": pipeline_id,
+                "state": TestingFarmResult.passed,
+                "created": "2021-11-01 17:22:36.061250",
+            },
+            ok=lambda: True,
+        )
+    ).once()
+    flexmock(TestingFarmResultsEvent).should_receive("get_packages_config").and_return(
+        None
+    )
+    # not to be checked again
+    run.should_receive("set_status").with_args(TestingFarmResult.passed).once()
+    flexmock(Signature).should_receive("apply_async").never()
     check_pending_testing_farm_runs()
+
+
+def test_check_pending_copr_builds_dispatched_on_error():
+    build1 = flexmock(status=BuildStatus.pending, build_id="1")
+    build2 = flexmock(status=BuildStatus.pending, build_id="2")
+    flexmock(CoprBuildTargetModel).should_receive("get_all_by_status").and_return(
+        [build1, build2]
+    )
+
+    def update_copr_builds(build_id, builds, dispatcher):
+        if build_id == 2:
+            raise CoprNoResultException("Copr API error")
+        dispatcher.add([signature("task.a")])
+        return True
+
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_copr_builds"
+    ).replace_with(update_copr_builds)
+    # the task for the ended build 1 is sent despite the failed check of build 2
+    flexmock(Signature).should_receive("apply_async").once()
+    with pytest.raises(CoprNoResultException):
+        check_pending_copr_builds()
+
+
+def test_handler_task_dispatcher_batches():
+    flexmock(Signature).should_receive("apply_async").times(3)
+
+    dispatcher = HandlerTaskDispatcher(batch_size=2)
+    dispatcher.add([signature("task.a")])
+    dispatcher.add([signature("task.b")])
+    assert not dispatcher.signatures
+    dispatcher.add([signature("task.c")])
+    dispatcher.flush()
+    dispatcher.flush()
+    assert not dispatcher.signatures
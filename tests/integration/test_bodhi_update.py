@@ -17,7 +17,12 @@ from packit.api import PackitAPI
 from packit.config import JobConfigTriggerType
 from packit.local_project import LocalProject
 from packit_service.constants import DEFAULT_RETRY_LIMIT
-from packit_service.models import GitBranchModel, KojiBuildTargetModel, PipelineModel
+from packit_service.models import (
+    GitBranchModel,
+    KojiBuildTargetModel,
+    PackitIssueModel,
+    PipelineModel,
+)
 from packit_service.utils import load_job_config, load_package_config
 from packit_service.worker.celery_task import CeleryTask
 from packit_service.worker.handlers.bodhi import CreateBodhiUpdateHandler
@@ -214,6 +219,8 @@ def test_bodhi_update_for_unknown_koji_build_failed_issue_created(
     issue_project_mock.should_receive("create_issue").and_return(
         flexmock(id=3, url="https://github.com/namespace/project/issues/3")
     ).once()
+    flexmock(PackitIssueModel).should_receive("get_latest").and_return(None)
+    flexmock(PackitIssueModel).should_receive("create").once()
 
     # Database structure
     run_model_flexmock = flexmock()
@@ -307,6 +314,8 @@ def test_bodhi_update_for_unknown_koji_build_failed_issue_comment(
         ]
     ).once()
     issue_project_mock.should_receive("create_issue").times(0)
+    flexmock(PackitIssueModel).should_receive("get_latest").and_return(None)
+    flexmock(PackitIssueModel).should_receive("create").once()
 
     # Database structure
     run_model_flexmock = flexmock()
@@ -1,13 +1,19 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from boto3.s3.transfer import S3Transfer
 from flexmock import flexmock
+from ogr.abstract import IssueStatus
 
-from packit_service.models import SRPMBuildModel
+from packit_service.config import ServiceConfig
+from packit_service.models import (
+    EventStageTimeModel,
+    PackitIssueModel,
+    SRPMBuildModel,
+)
 from packit_service.worker import database
 
 
@@ -21,6 +27,13 @@ def test_cleanup_old_srpm_build_logs():
     database.discard_old_srpm_build_logs()
 
 
+def test_discard_old_event_stage_times():
+    flexmock(EventStageTimeModel).should_receive("delete_older_than").with_args(
+        timedelta(days=30)
+    ).and_return(7).once()
+    database.discard_old_event_stage_times()
+
+
 def test_backup():
     flexmock(database).should_receive("is_aws_configured").once().and_return(True)
     flexmock(database).should_receive("dump_to").once()
@@ -28,3 +41,25 @@ def test_backup():
     flexmock(S3Transfer).should_receive("upload_file").once()
     flexmock(Path).should_receive("unlink").twice()
     database.backup()
+
+
+def test_reconcile_packit_issues():
+    project = flexmock(project_url="https://github.com/packit/notifications")
+    open_issue = flexmock(issue_id=1, project=project)
+    open_issue.should_receive("set_closed").never()
+    closed_issue = flexmock(issue_id=2, project=project)
+    closed_issue.should_receive("set_closed").once()
+    flexmock(PackitIssueModel).should_receive("get_all_open").and_return(
+        [open_issue, closed_issue]
+    )
+
+    issues = {1: IssueStatus.open, 2: IssueStatus.closed}
+    forge_project = flexmock()
+    forge_project.should_receive("get_issue").replace_with(
+        lambda issue_id: flexmock(status=issues[issue_id])
+    )
+    flexmock(ServiceConfig).should_receive("get_project").with_args(
+        url="https://github.com/packit/notifications"
+    ).and_return(forge_project)
+
+    database.reconcile_packit_issues()
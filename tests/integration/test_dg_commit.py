@@ -27,6 +27,8 @@ from packit_service.models import (
     GitBranchModel,
     GitProjectModel,
     JobTriggerModelType,
+    PackitIssueModel,
+    PullRequestHeadCommitModel,
 )
 from packit_service.utils import load_job_config, load_package_config
 from packit_service.worker.handlers.distgit import DownstreamKojiBuildHandler
@@ -318,6 +320,8 @@ def test_downstream_koji_build_failure_issue_created():
     issue_project_mock.should_receive("create_issue").and_return(
         flexmock(id=3, url="https://github.com/namespace/project/issues/3")
     ).once()
+    flexmock(PackitIssueModel).should_receive("get_latest").and_return(None)
+    flexmock(PackitIssueModel).should_receive("create").once()
 
     processing_results = SteveJobs().process_message(distgit_commit_event())
     event_dict, job, job_config, package_config = get_parameters_from_results(
@@ -391,6 +395,8 @@ def test_downstream_koji_build_failure_issue_comment():
         ]
     ).once()
     issue_project_mock.should_receive("create_issue").times(0)
+    flexmock(PackitIssueModel).should_receive("get_latest").and_return(None)
+    flexmock(PackitIssueModel).should_receive("create").once()
 
     processing_results = SteveJobs().process_message(distgit_commit_event())
     event_dict, job, job_config, package_config = get_parameters_from_results(
@@ -410,6 +416,78 @@ def test_downstream_koji_build_failure_issue_comment():
         ).run_job()
 
 
+def test_downstream_koji_build_failure_does_not_stop_other_branches():
+    packit_yaml = (
+        "{'specfile_path': 'buildah.spec',"
+        "'jobs': [{'trigger': 'commit', 'job': 'koji_build', 'allowed_committers': "
+        "['rhcontainerbot']}],"
+        "'downstream_package_name': 'buildah',"
+        "'issue_repository': 'https://github.com/namespace/project'}"
+    )
+    pagure_project_mock = flexmock(
+        PagureProject,
+        full_repo_name="rpms/buildah",
+        get_web_url=lambda: "https://src.fedoraproject.org/rpms/buildah",
+        default_branch="main",
+    )
+    pagure_project_mock.should_receive("get_files").with_args(
+        ref="abcd", filter_regex=r".+\.spec$"
+    ).and_return(["buildah.spec"])
+    pagure_project_mock.should_receive("get_file_content").with_args(
+        path=".packit.yaml", ref="abcd"
+    ).and_return(packit_yaml)
+    pagure_project_mock.should_receive("get_files").with_args(
+        ref="abcd", recursive=False
+    ).and_return(["buildah.spec", ".packit.yaml"])
+
+    flexmock(GitBranchModel).should_receive("get_or_create").with_args(
+        branch_name="main",
+        namespace="rpms",
+        repo_name="buildah",
+        project_url="https://src.fedoraproject.org/rpms/buildah",
+    ).and_return(flexmock(id=9, job_config_trigger_type=JobConfigTriggerType.commit))
+
+    flexmock(LocalProject, refresh_the_arguments=lambda: None)
+    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(DownstreamKojiBuildHandler).should_receive("get_branches").and_return(
+        ["f37", "main"]
+    )
+    flexmock(PackitAPI).should_receive("build").with_args(
+        dist_git_branch="f37",
+        scratch=False,
+        nowait=True,
+        from_upstream=False,
+    ).and_raise(PackitException, "Some error").once()
+    flexmock(PackitAPI).should_receive("build").with_args(
+        dist_git_branch="main",
+        scratch=False,
+        nowait=True,
+        from_upstream=False,
+    ).once()
+    reported_branches = []
+    flexmock(DownstreamKojiBuildHandler).should_receive(
+        "report_in_issue_repository"
+    ).replace_with(lambda errors: reported_branches.extend(errors)).once()
+
+    processing_results = SteveJobs().process_message(distgit_commit_event())
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+    assert json.dumps(event_dict)
+    with pytest.raises(PackitException):
+        DownstreamKojiBuildHandler(
+            package_config=load_package_config(package_config),
+            job_config=load_job_config(job_config),
+            event=event_dict,
+            # Needs to be the last try to inform user
+            celery_task=flexmock(
+                request=flexmock(retries=DEFAULT_RETRY_LIMIT),
+                max_retries=DEFAULT_RETRY_LIMIT,
+            ),
+        ).run_job()
+    assert reported_branches == ["f37"]
+
+
 def test_downstream_koji_build_no_config():
     pagure_project = flexmock(
         PagureProject,
@@ -728,14 +806,28 @@ def test_precheck_koji_build_push_pr(
             },
         ),
     ]
+    flexmock(PullRequestHeadCommitModel).should_receive("get_pr_id").with_args(
+        namespace="rpms",
+        repo_name="packit",
+        project_url="https://src.fedoraproject.org/rpms/packit",
+        commit_sha="ad0c308af91da45cf40b253cd82f07f63ea9cbbf",
+    ).and_return(None)
     flexmock(PagureProject).should_receive("get_pr_list").and_return(
         [
             flexmock(
+                id=5,
                 author=pr_author,
                 head_commit="ad0c308af91da45cf40b253cd82f07f63ea9cbbf",
             )
         ]
     )
+    flexmock(PullRequestHeadCommitModel).should_receive("add").with_args(
+        pr_id=5,
+        namespace="rpms",
+        repo_name="packit",
+        project_url="https://src.fedoraproject.org/rpms/packit",
+        commit_sha="ad0c308af91da45cf40b253cd82f07f63ea9cbbf",
+    ).once()
     package_config = (
         PackageConfig(
             jobs=jobs,
@@ -748,3 +840,38 @@ def test_precheck_koji_build_push_pr(
         DownstreamKojiBuildHandler.pre_check(package_config, job_config, event)
         == should_pass
     )
+
+
+def test_precheck_koji_build_push_pr_indexed(distgit_push_event):
+    distgit_push_event.committer = "pagure"
+
+    flexmock(GitBranchModel).should_receive("get_or_create").and_return(
+        flexmock(
+            id=13,
+            job_config_trigger_type=JobConfigTriggerType.commit,
+            job_trigger_model_type=JobTriggerModelType.branch_push,
+        )
+    )
+    jobs = [
+        JobConfig(
+            type=JobType.koji_build,
+            trigger=JobConfigTriggerType.commit,
+            packages={
+                "package": CommonPackageConfig(
+                    dist_git_branches=["f36"],
+                    allowed_pr_authors=["packit"],
+                )
+            },
+        ),
+    ]
+    flexmock(PullRequestHeadCommitModel).should_receive("get_pr_id").and_return(5)
+    flexmock(PagureProject).should_receive("get_pr").with_args(5).and_return(
+        flexmock(author="packit")
+    ).once()
+    flexmock(PagureProject).should_receive("get_pr_list").never()
+
+    assert DownstreamKojiBuildHandler.pre_check(
+        (PackageConfig(jobs=jobs, packages={"package": CommonPackageConfig()}),),
+        jobs[0],
+        distgit_push_event.get_dict(),
+    )
@@ -347,6 +347,60 @@ def test_copr_build_end(
     )
 
 
+def test_copr_build_end_copr_data_fetched_once(
+    copr_build_end, pc_build_pr, copr_build_pr
+):
+    pr = flexmock(source_project=flexmock(), get_comments=lambda *args, **kwargs: [])
+    pr.should_receive("comment")
+    flexmock(GithubProject).should_receive("is_private").and_return(False)
+    flexmock(GithubProject).should_receive("get_pr").and_return(pr)
+    flexmock(AbstractCoprBuildEvent).should_receive("get_packages_config").and_return(
+        pc_build_pr
+    )
+    flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").and_return(
+        copr_build_pr
+    )
+    copr_build_pr.built_packages = None
+    copr_build_pr.should_receive("set_end_time").once()
+    flexmock(copr_build_pr._srpm_build_for_mocking).should_receive("set_url").with_args(
+        "https://my.host/my.srpm"
+    ).once()
+    flexmock(StatusReporter).should_receive("report")
+    flexmock(Signature).should_receive("apply_async")
+    flexmock(Pushgateway).should_receive("push").and_return()
+
+    # each of the Copr API endpoints is requested once per handled event
+    build_proxy = flexmock()
+    build_proxy.should_receive("get").with_args(1044215).and_return(
+        flexmock(source_package={"url": "https://my.host/my.srpm"})
+    ).once()
+    build_chroot_proxy = flexmock()
+    build_chroot_proxy.should_receive("get").with_args(1, "some-target").and_return(
+        flexmock(ended_on=1666889710)
+    ).once()
+    build_chroot_proxy.should_receive("get_built_packages").with_args(
+        1, "some-target"
+    ).and_return(flexmock(packages=[{"name": "hello"}])).once()
+    flexmock(CoprHelper).should_receive("get_copr_client").and_return(
+        flexmock(
+            config={"username": "packit", "copr_url": "https://dummy.url"},
+            build_proxy=build_proxy,
+            build_chroot_proxy=build_chroot_proxy,
+        )
+    )
+
+    processing_results = SteveJobs().process_message(copr_build_end)
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+    results = run_copr_build_end_handler(
+        package_config=package_config,
+        event=event_dict,
+        job_config=job_config,
+    )
+    assert first_dict_value(results["job"])["success"]
+
+
 def test_copr_build_end_push(
     copr_build_end_push, pc_build_push, copr_build_branch_push
 ):
@@ -35,6 +35,7 @@ from packit_service.models import (
     JobTriggerModel,
     JobTriggerModelType,
     PipelineModel,
+    PullRequestHeadCommitModel,
     PullRequestModel,
     TFTTestRunTargetModel,
     TFTTestRunGroupModel,
@@ -2500,6 +2501,13 @@ def test_bodhi_update_retrigger_via_dist_git_pr_comment(pagure_pr_comment_added)
     flexmock(PullRequestModel).should_receive("get_by_id").with_args(123).and_return(
         trigger
     )
+    flexmock(PullRequestHeadCommitModel).should_receive("add").with_args(
+        pr_id=36,
+        namespace="rpms",
+        repo_name="jouduv-dort",
+        project_url="https://src.fedoraproject.org/rpms/jouduv-dort",
+        commit_sha="beaf90bcecc51968a46663f8d6f092bfdc92e682",
+    ).once()
 
     pagure_project = flexmock(
         PagureProject,
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: MIT
 import json
 import shutil
+from contextlib import nullcontext
 
 import pytest
 from celery.app.task import Context, Task
@@ -18,7 +19,7 @@ from packit.local_project import LocalProject
 from packit.pkgtool import PkgTool
 from packit_service import sentry_integration
 from packit_service.config import ServiceConfig
-from packit_service.constants import TASK_ACCEPTED
+from packit_service.constants import ARCHIVE_WATCHER_RETRY_BACKOFF, TASK_ACCEPTED
 from packit_service.models import (
     JobTriggerModelType,
     PipelineModel,
@@ -32,6 +33,7 @@ from packit_service.models import (
 from packit_service.service.db_triggers import AddReleaseDbTrigger
 from packit_service.service.urls import get_propose_downstream_info_url
 from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.handlers.distgit import ProposeDownstreamHandler
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
@@ -336,6 +338,133 @@ def test_dist_git_push_release_handle_multiple_branches(
     assert first_dict_value(results["job"])["success"]
 
 
+def test_dist_git_push_release_handle_multiple_branches_in_parallel(
+    github_release_webhook,
+    fedora_branches,
+    propose_downstream_model,
+    propose_downstream_target_models,
+    monkeypatch,
+):
+    packit_yaml = (
+        "{'specfile_path': 'hello-world.spec', 'synced_files': []"
+        ", jobs: [{trigger: release, job: propose_downstream, "
+        "metadata: {targets:[], dist-git-branch: fedora-all}}]}"
+    )
+    flexmock(Github, get_repo=lambda full_name_or_id: None)
+    project = flexmock(
+        get_file_content=lambda path, ref: packit_yaml,
+        full_repo_name="packit-service/hello-world",
+        repo="hello-world",
+        namespace="packit-service",
+        get_files=lambda ref, recursive: ["packit.yaml"],
+        get_sha_from_tag=lambda tag_name: "123456",
+        get_web_url=lambda: "https://github.com/packit/hello-world",
+        is_private=lambda: False,
+        default_branch="main",
+    )
+    flexmock(LocalProject, refresh_the_arguments=lambda: None)
+    flexmock(LocalProject).should_receive("git_repo").and_return(
+        flexmock(
+            git=flexmock(clear_cache=lambda: None)
+            .should_receive("checkout")
+            .with_args("--detach")
+            .once()
+            .mock(),
+        )
+    )
+
+    flexmock(Allowlist, check_and_report=True)
+    service_config = ServiceConfig().get_service_config()
+    service_config.get_project = lambda url: project
+    monkeypatch.setattr(service_config, "parallel_sync_release_branches", 3)
+
+    flexmock(ProposeDownstreamHandler).should_receive(
+        "_add_dist_git_fork_remote"
+    ).once()
+    for model in propose_downstream_target_models:
+        url = get_propose_downstream_info_url(model.id)
+        flexmock(model).should_receive("set_status").with_args(
+            status=SyncReleaseTargetStatus.running
+        ).once()
+        flexmock(model).should_receive("set_downstream_pr_url").with_args(
+            downstream_pr_url=f"{model.branch}_url"
+        ).once()
+        flexmock(model).should_receive("set_status").with_args(
+            status=SyncReleaseTargetStatus.submitted
+        ).once()
+        flexmock(model).should_receive("set_start_time").once()
+        flexmock(model).should_receive("set_finished_time").once()
+        flexmock(model).should_receive("set_logs").once()
+
+        # each branch is synced by its own API working in separate worktrees
+        packit_api = (
+            flexmock()
+            .should_receive("sync_release")
+            .with_args(
+                dist_git_branch=model.branch,
+                tag="0.3.0",
+                create_pr=True,
+                local_pr_branch_suffix="update-propose_downstream",
+                use_downstream_specfile=False,
+                sync_default_files=True,
+            )
+            .and_return(flexmock(url=f"{model.branch}_url"))
+            .once()
+            .mock()
+        )
+        flexmock(ProposeDownstreamHandler).should_receive(
+            "packit_api_in_worktrees"
+        ).with_args(model.branch).and_return(nullcontext(packit_api)).once()
+
+        flexmock(ProposeDownstreamJobHelper).should_receive(
+            "report_status_for_branch"
+        ).with_args(
+            branch=model.branch,
+            description="Starting propose downstream...",
+            state=BaseCommitStatus.running,
+            url=url,
+        ).once()
+
+        flexmock(ProposeDownstreamJobHelper).should_receive(
+            "report_status_for_branch"
+        ).with_args(
+            branch=model.branch,
+            description="Propose downstream finished successfully.",
+            state=BaseCommitStatus.success,
+            url=url,
+        ).once()
+
+    flexmock(PackitAPI).should_receive("sync_release").never()
+    flexmock(propose_downstream_model).should_receive("set_status").with_args(
+        status=SyncReleaseStatus.finished
+    ).once()
+
+    flexmock(PkgTool).should_receive("clone").and_return(None)
+
+    flexmock(AddReleaseDbTrigger).should_receive("db_trigger").and_return(
+        flexmock(
+            job_config_trigger_type=JobConfigTriggerType.release,
+            id=123,
+            job_trigger_model_type=JobTriggerModelType.release,
+        )
+    )
+    flexmock(Signature).should_receive("apply_async").once()
+    flexmock(Pushgateway).should_receive("push").times(3).and_return()
+
+    processing_results = SteveJobs().process_message(github_release_webhook)
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+    assert json.dumps(event_dict)
+
+    results = run_propose_downstream_handler(
+        package_config=package_config,
+        event=event_dict,
+        job_config=job_config,
+    )
+    assert first_dict_value(results["job"])["success"]
+
+
 def test_dist_git_push_release_handle_one_failed(
     github_release_webhook,
     fedora_branches,
@@ -700,6 +829,120 @@ def test_retry_propose_downstream_task(
     assert "Not able to download" in first_dict_value(results["job"])["details"]["msg"]
 
 
+def test_propose_downstream_task_waits_for_archive(
+    github_release_webhook, propose_downstream_model
+):
+    model = flexmock(status="queued", id=1234, branch="main")
+    flexmock(SyncReleaseTargetModel).should_receive("create").with_args(
+        status=SyncReleaseTargetStatus.queued, branch="main"
+    ).and_return(model)
+
+    packit_yaml = (
+        "{'specfile_path': 'hello-world.spec', 'synced_files': []"
+        ", jobs: [{trigger: release, job: propose_downstream, metadata: {targets:[]}}]}"
+    )
+    flexmock(Github, get_repo=lambda full_name_or_id: None)
+    project = flexmock(
+        get_file_content=lambda path, ref: packit_yaml,
+        full_repo_name="packit-service/hello-world",
+        repo="hello-world",
+        namespace="packit-service",
+        get_files=lambda ref, recursive: ["packit.yaml"],
+        get_sha_from_tag=lambda tag_name: "123456",
+        get_web_url=lambda: "https://github.com/packit/hello-world",
+        is_private=lambda: False,
+        default_branch="main",
+    )
+
+    lp = flexmock(LocalProject, refresh_the_arguments=lambda: None)
+    lp.git_project = project
+    lp.working_dir = ""
+    flexmock(DistGit).should_receive("local_project").and_return(lp)
+    # reset of the upstream repo
+    flexmock(LocalProject).should_receive("git_repo").and_return(
+        flexmock(
+            head=flexmock()
+            .should_receive("reset")
+            .with_args("HEAD", index=True, working_tree=True)
+            .once()
+            .mock(),
+            git=flexmock(clear_cache=lambda: None),
+        )
+    )
+
+    flexmock(Allowlist, check_and_report=True)
+    ServiceConfig().get_service_config().get_project = lambda url: project
+
+    flexmock(AddReleaseDbTrigger).should_receive("db_trigger").and_return(
+        flexmock(
+            job_config_trigger_type=JobConfigTriggerType.release,
+            id=123,
+            job_trigger_model_type=JobTriggerModelType.release,
+        )
+    )
+    flexmock(Signature).should_receive("apply_async").once()
+    # the task waiting for the archive
+    flexmock(Signature).should_receive("apply_async").with_args(
+        countdown=ARCHIVE_WATCHER_RETRY_BACKOFF
+    ).once()
+
+    flexmock(PackitAPI).should_receive("sync_release").with_args(
+        dist_git_branch="main",
+        tag="0.3.0",
+        create_pr=True,
+        local_pr_branch_suffix="update-propose_downstream",
+        use_downstream_specfile=False,
+        sync_default_files=True,
+    ).and_raise(
+        PackitDownloadFailedException,
+        "Failed to download source from https://example.com/hello-world-0.3.0.tar.gz:"
+        "\n404 Client Error: Not Found",
+    ).once()
+
+    flexmock(model).should_receive("set_status").with_args(
+        status=SyncReleaseTargetStatus.running
+    ).once()
+    flexmock(model).should_receive("set_status").with_args(
+        status=SyncReleaseTargetStatus.retry
+    ).once()
+    flexmock(model).should_receive("set_start_time").once()
+    flexmock(model).should_receive("set_finished_time").once()
+    flexmock(model).should_receive("set_logs").once()
+
+    flexmock(shutil).should_receive("rmtree").with_args("")
+    flexmock(Task).should_receive("retry").never()
+    flexmock(Pushgateway).should_receive("push").times(3).and_return()
+
+    url = get_propose_downstream_info_url(model.id)
+    flexmock(ProposeDownstreamJobHelper).should_receive(
+        "report_status_for_branch"
+    ).with_args(
+        branch="main",
+        description="Starting propose downstream...",
+        state=BaseCommitStatus.running,
+        url=url,
+    ).once()
+    flexmock(ProposeDownstreamJobHelper).should_receive(
+        "report_status_to_all"
+    ).with_args(
+        description="Propose downstream is being retried because "
+        "we were not able yet to download the archive. ",
+        state=BaseCommitStatus.pending,
+        url="",
+    ).once()
+
+    processing_results = SteveJobs().process_message(github_release_webhook)
+    event_dict, job, job_config, package_config = get_parameters_from_results(
+        processing_results
+    )
+    assert json.dumps(event_dict)
+
+    results = run_propose_downstream_handler(event_dict, package_config, job_config)
+
+    assert first_dict_value(results["job"])["success"]  # yes, success, see #1140
+    assert "Not able to download" in first_dict_value(results["job"])["details"]["msg"]
+
+
 def test_dont_retry_propose_downstream_task(
     github_release_webhook, propose_downstream_model
 ):
@@ -5,13 +5,11 @@ from typing import Tuple, Iterable
 
 import pytest
 from copr.v3 import Client
-from fasjson_client import Client as FasjsonClient
 from fasjson_client.errors import APIError
 from flexmock import flexmock
 from ogr.abstract import GitProject, GitService
 from ogr.services.github import GithubProject, GithubService
 
-from packit.api import PackitAPI
 from packit.config import CommonPackageConfig, JobType, JobConfig, JobConfigTriggerType
 from packit.copr_helper import CoprHelper
 from packit.local_project import LocalProject
@@ -29,6 +27,7 @@ from packit_service.models import (
     JobTriggerModelType,
 )
 from packit_service.worker.allowlist import Allowlist
+from packit_service.worker.helpers import fas
 from packit_service.worker.events import (
     EventData,
     IssueCommentEvent,
@@ -890,24 +889,17 @@ def test_strip_protocol_and_add_git(url: str, expected_url: str) -> None:
 def test_is_github_username_from_fas_account_matching(
     sender_login, fas_account_name, person_object, raises, result
 ):
-    flexmock(PackitAPI).should_receive("init_kerberos_ticket").and_return(True)
-
-    def init(*args):
-        pass
-
-    # so that the kerberos authentication is not required
-    FasjsonClient.__init__ = init
-    # the Client class doesn't have directly the get_user method
-    fas = (
-        flexmock(FasjsonClient)
-        .should_receive("__getattr__")
-        .with_args("get_user")
+    client = flexmock()
+    fas_call = (
+        client.should_receive("get_user")
+        .with_args(username=fas_account_name, _request_options=dict)
         .once()
     )
     if person_object is not None:
-        fas.and_return(flexmock(result=person_object))
+        fas_call.and_return(flexmock(result=person_object))
     if raises is not None:
-        fas.and_raise(*raises)
+        fas_call.and_raise(*raises)
+    flexmock(fas).should_receive("get_fasjson_client").and_return(client)
 
     assert (
         Allowlist(
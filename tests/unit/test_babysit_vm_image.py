@@ -1,41 +1,72 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+from datetime import datetime
+
 import pytest
 import packit_service
 
+from celery import signature
+from celery.canvas import Signature
 from requests import HTTPError
 from flexmock import flexmock
 from flexmock import Mock
 from packit.config.job_config import JobConfigTriggerType, JobType
-from packit_service.config import ServiceConfig
 from packit_service.models import (
     VMImageBuildTargetModel,
     VMImageBuildStatus,
     JobTriggerModelType,
 )
 from packit_service.worker.helpers.build.babysit import (
+    HandlerTaskDispatcher,
     check_pending_vm_image_builds,
     update_vm_image_build,
     UpdateImageBuildHelper,
 )
 from packit_service.worker.events import VMImageBuildResultEvent
 from packit_service.worker.handlers import VMImageBuildResultHandler
-from packit_service.worker.monitoring import Pushgateway
+from packit_service.worker.helpers.polling import (
+    copr_build_polling_scheduler,
+    tft_test_run_polling_scheduler,
+    vm_image_build_polling_scheduler,
+)
+
+
+@pytest.fixture(autouse=True)
+def polling_scheduler():
+    """All the builds/runs are due, the deadlines are tested in test_polling.py."""
+    for scheduler in (
+        copr_build_polling_scheduler,
+        tft_test_run_polling_scheduler,
+        vm_image_build_polling_scheduler,
+    ):
+        flexmock(scheduler).should_receive("is_due").and_return(True)
+        flexmock(scheduler).should_receive("schedule").and_return(60)
+        flexmock(scheduler).should_receive("completed")
 
 
 def test_check_pending_vm_image_builds():
     flexmock(VMImageBuildTargetModel).should_receive("get_all_by_status").with_args(
-        VMImageBuildStatus.pending
+        VMImageBuildStatus.pending, due_before=datetime, shard=0, shards=1
     ).and_return([flexmock(build_id=1)])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_vm_image_build"
-    ).with_args(1, Mock)
+    ).with_args(1, Mock, HandlerTaskDispatcher).once()
     check_pending_vm_image_builds()
 
 
+def test_check_pending_vm_image_builds_shard():
+    flexmock(VMImageBuildTargetModel).should_receive("get_all_by_status").with_args(
+        VMImageBuildStatus.pending, due_before=datetime, shard=0, shards=2
+    ).and_return([flexmock(id=2, build_id=12)])
+    flexmock(packit_service.worker.helpers.build.babysit).should_receive(
+        "update_vm_image_build"
+    ).with_args(12, Mock, HandlerTaskDispatcher).once()
+    check_pending_vm_image_builds(shard=0, shards=2)
+
+
 def test_check_no_pending_vm_image_builds():
     flexmock(VMImageBuildTargetModel).should_receive("get_all_by_status").with_args(
-        VMImageBuildStatus.pending
+        VMImageBuildStatus.pending, due_before=datetime, shard=0, shards=1
     ).and_return([])
     flexmock(packit_service.worker.helpers.build.babysit).should_receive(
         "update_vm_image_build"
@@ -142,10 +173,13 @@ def test_update_vm_image_build(stop_babysitting, build_status, vm_image_builder_
         ]
     )
 
-    flexmock(VMImageBuildResultHandler).should_receive("report_status")
-    flexmock(ServiceConfig).should_receive("get_project").and_return()
-    if stop_babysitting:
-        flexmock(Pushgateway).should_receive("push").once().and_return()
+    flexmock(VMImageBuildResultHandler).should_receive("get_signature").and_return(
+        signature(VMImageBuildResultHandler.task_name.value)
+    )
+    # the handler runs in a separate task
+    flexmock(Signature).should_receive("apply_async").times(
+        1 if stop_babysitting else 0
+    )
     assert (
         update_vm_image_build(
             1,
@@ -0,0 +1,89 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from flexmock import flexmock
+
+import packit_service.cache
+from packit_service.cache import (
+    LocalCache,
+    RedisCache,
+    get_cache_key,
+    refresh_shared_cache,
+    shared_ttl_cache,
+)
+
+
+def test_local_cache_expiration():
+    cache = LocalCache()
+    flexmock(packit_service.cache).should_receive("monotonic").and_return(
+        100, 105, 111
+    ).one_by_one()
+    cache.set("key", "value", ttl=10)
+    assert cache.get("key") == "value"
+    assert cache.get("key") is None
+
+
+def test_redis_cache_set_many_in_one_round_trip():
+    cache = RedisCache()
+    pipeline = flexmock()
+    flexmock(cache._redis).should_receive("pipeline").with_args(
+        transaction=False
+    ).and_return(pipeline).once()
+    pipeline.should_receive("set").with_args("a", "1", ex=10).once()
+    pipeline.should_receive("set").with_args("b", "2", ex=10).once()
+    pipeline.should_receive("execute").once()
+    flexmock(cache._redis).should_receive("set").never()
+
+    cache.set_many({"a": "1", "b": "2"}, ttl=10)
+
+
+def test_cache_key_same_for_positional_and_keyword_arguments():
+    def f(a, b=None, c=3):
+        pass
+
+    assert get_cache_key(f, (1, 2), {}) == get_cache_key(f, (), {"a": 1, "b": 2})
+    assert get_cache_key(f, (1,), {}) == get_cache_key(f, (1, None, 3), {})
+    assert get_cache_key(f, (1,), {}) != get_cache_key(f, (2,), {})
+
+
+def test_shared_ttl_cache():
+    calls = []
+
+    class Statistics:
+        @classmethod
+        @shared_ttl_cache(ttl=60)
+        def numbers(cls, top=None):
+            calls.append(top)
+            return {"https://github.com/packit/ogr": 42}
+
+    assert Statistics.numbers() == {"https://github.com/packit/ogr": 42}
+    assert Statistics.numbers(top=None) == {"https://github.com/packit/ogr": 42}
+    assert calls == [None]
+
+    Statistics.numbers(top=10)
+    assert calls == [None, 10]
+
+
+def test_refresh_shared_cache():
+    calls = []
+
+    @shared_ttl_cache(ttl=60)
+    def count():
+        calls.append(1)
+        return len(calls)
+
+    @shared_ttl_cache(ttl=60)
+    def doubled_count():
+        return 2 * count()
+
+    assert count() == 1
+    assert doubled_count() == 2
+
+    with refresh_shared_cache():
+        # computed again, but only once
+        assert count() == 2
+        assert doubled_count() == 4
+
+    assert count() == 2
+    assert doubled_count() == 4
+    assert len(calls) == 2
@@ -83,6 +83,17 @@ def test_parse_valid(service_config_valid):
         "github.com/other-private-namespace",
     }
     assert config.package_config_path_override is None
+    assert config.parallel_sync_release_branches == 1
+    assert config.parallel_koji_builds == 1
+    assert config.testing_farm_request_timeout == 60
+    assert config.testing_farm_request_retries == 5
+    assert config.testing_farm_request_backoff == 0.5
+    assert config.forge_conditional_requests
+    assert config.babysit_shards == 1
+    assert not config.event_archive_dir
+    assert config.event_archive_file_size == 64
+    assert config.event_archive_max_files == 100
+    assert config.memory_profiler_snapshot_interval == 0
 
 
 def test_parse_optional_values(service_config_valid):
@@ -92,10 +103,32 @@ def test_parse_optional_values(service_config_valid):
             **service_config_valid,
             "testing_farm_api_url": "https://other.url",
             "package_config_path_override": ".distro/source-git.yaml",
+            "parallel_sync_release_branches": 4,
+            "parallel_koji_builds": 8,
+            "testing_farm_request_timeout": 10,
+            "testing_farm_request_retries": 0,
+            "testing_farm_request_backoff": 2,
+            "forge_conditional_requests": False,
+            "babysit_shards": 4,
+            "event_archive_dir": "/var/lib/packit/events",
+            "event_archive_file_size": 16,
+            "event_archive_max_files": 10,
+            "memory_profiler_snapshot_interval": 500,
         }
     )
     assert config.testing_farm_api_url == "https://other.url"
     assert config.package_config_path_override == ".distro/source-git.yaml"
+    assert config.parallel_sync_release_branches == 4
+    assert config.parallel_koji_builds == 8
+    assert config.testing_farm_request_timeout == 10
+    assert config.testing_farm_request_retries == 0
+    assert config.testing_farm_request_backoff == 2
+    assert not config.forge_conditional_requests
+    assert config.babysit_shards == 4
+    assert config.event_archive_dir == "/var/lib/packit/events"
+    assert config.event_archive_file_size == 16
+    assert config.event_archive_max_files == 10
+    assert config.memory_profiler_snapshot_interval == 500
 
 
 @pytest.fixture(scope="module")
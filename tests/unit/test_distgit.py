@@ -1,14 +1,18 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 import json
+from contextlib import contextmanager, nullcontext
+from threading import Lock
+
 import pytest
 
 from flexmock import flexmock
-from fasjson_client import Client
 
 from ogr.services.github import GithubService
-from packit.api import PackitAPI
+from packit.exceptions import PackitDownloadFailedException, PackitException
+from packit_service.worker.helpers import fas
 from packit_service.worker.handlers.distgit import (
+    AbortSyncRelease,
     ProposeDownstreamHandler,
     DownstreamKojiBuildHandler,
     AbstractSyncReleaseHandler,
@@ -83,10 +87,9 @@ PAGURE_PULL_REQUEST_COMMENT_PROCESSED = '{"created_at": 1658228337, "project_url
 )
 def test_retrigger_downstream_koji_build_pre_check(user_groups, data, check_passed):
     data_dict = json.loads(data)
-    flexmock(PackitAPI).should_receive("init_kerberos_ticket").and_return(None)
-    flexmock(Client).should_receive("__getattr__").with_args(
-        "list_user_groups"
-    ).and_return(lambda username: user_groups)
+    flexmock(fas).should_receive("get_fasjson_client").and_return(
+        flexmock(list_user_groups=lambda **_: user_groups)
+    )
 
     flexmock(DownstreamKojiBuildHandler).should_receive("service_config").and_return(
         flexmock()
@@ -127,3 +130,111 @@ def test_pull_from_upstream_auth_method():
     flexmock(AbstractSyncReleaseHandler).should_receive("run").once()
     flexmock(GithubService).should_receive("reset_auth_method").once()
     handler.run()
+
+
+def test_sync_release_in_parallel_download_failed():
+    handler = ProposeDownstreamHandler(None, None, {}, flexmock())
+    handler._service_config = flexmock(parallel_sync_release_branches=2)
+    git = flexmock()
+    git.should_receive("checkout").with_args("--detach").once()
+    handler._packit_api = flexmock(
+        dg=flexmock(local_project=flexmock(git_repo=flexmock(git=git)))
+    )
+    flexmock(handler).should_receive("_add_dist_git_fork_remote")
+    flexmock(handler).should_receive("_start_target").and_return(True)
+    flexmock(handler).should_receive("packit_api_in_worktrees").replace_with(
+        lambda branch: nullcontext(flexmock())
+    )
+
+    pull_request = flexmock(url="https://src.fedoraproject.org/pr/1")
+
+    def sync_release(packit_api, branch):
+        if branch == "f38":
+            raise PackitDownloadFailedException("Failed to download source")
+        return pull_request
+
+    flexmock(handler).should_receive("_sync_release").replace_with(sync_release)
+    models = [flexmock(branch=branch) for branch in ("f38", "f39")]
+    for model in models:
+        model.should_receive("set_finished_time").once()
+        model.should_receive("set_logs").once()
+    # the pull request created meanwhile is recorded before the task is retried
+    flexmock(handler).should_receive("_report_target_success").with_args(
+        models[1], pull_request
+    ).once()
+    flexmock(handler).should_receive("_report_target_failure").never()
+    flexmock(handler).should_receive("_retry_when_archive_is_available").and_raise(
+        AbortSyncRelease
+    ).once()
+
+    with pytest.raises(AbortSyncRelease):
+        handler.run_for_targets_in_parallel(flexmock(), models)
+
+
+def test_sync_release_in_thread_worktrees_under_lock():
+    handler = ProposeDownstreamHandler(None, None, {}, flexmock())
+    worktrees_lock = Lock()
+
+    @contextmanager
+    def packit_api_in_worktrees(branch):
+        # set up and removed under the lock, the sync-release runs without it
+        assert worktrees_lock.locked()
+        yield flexmock()
+        assert worktrees_lock.locked()
+
+    flexmock(handler).should_receive("packit_api_in_worktrees").replace_with(
+        packit_api_in_worktrees
+    )
+    pull_request = flexmock(url="https://src.fedoraproject.org/pr/1")
+    flexmock(handler).should_receive("_sync_release").replace_with(
+        lambda packit_api, branch: None if worktrees_lock.locked() else pull_request
+    )
+
+    downstream_pr, error, _ = handler._sync_release_in_thread("f39", worktrees_lock)
+    assert downstream_pr is pull_request
+    assert error is None
+    assert not worktrees_lock.locked()
+
+
+def test_downstream_koji_build_retried_for_failed_branches():
+    celery_task = flexmock(
+        request=flexmock(retries=0, kwargs={"event": {}}), max_retries=2
+    )
+    handler = DownstreamKojiBuildHandler(None, None, {}, celery_task)
+    handler._service_config = flexmock(parallel_koji_builds=1)
+    handler._packit_api = flexmock()
+    flexmock(handler).should_receive("get_branches").and_return(["f38", "f39"])
+    flexmock(handler).should_receive("submit_build").replace_with(
+        lambda packit_api, branch: PackitException("failed")
+        if branch == "f39"
+        else None
+    )
+    # only the failed branch is built again
+    celery_task.should_receive("retry").with_args(
+        exc=PackitException,
+        countdown=60,
+        throw=False,
+        args=(),
+        kwargs={"event": {}, "koji_build_branches": ["f39"]},
+        max_retries=None,
+    ).once()
+
+    assert handler.run()["success"]
+
+
+def test_downstream_koji_build_retry_of_failed_branches():
+    handler = DownstreamKojiBuildHandler(
+        None,
+        None,
+        {},
+        flexmock(request=flexmock(retries=1), max_retries=2),
+        koji_build_branches=["f39"],
+    )
+    handler._service_config = flexmock(parallel_koji_builds=1)
+    handler._packit_api = flexmock()
+    flexmock(handler).should_receive("get_branches").never()
+    flexmock(handler).should_receive("submit_build").with_args(
+        handler._packit_api, "f39"
+    ).and_return(None).once()
+
+    assert handler.run()["success"]
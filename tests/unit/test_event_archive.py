@@ -0,0 +1,96 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import gzip
+import json
+
+from flexmock import flexmock
+
+from packit_service import event_archive
+from packit_service.config import ServiceConfig
+from packit_service.event_archive import (
+    REDACTED,
+    EventArchiveWriter,
+    read_event_archive,
+    record_event,
+    sanitize,
+)
+
+
+def test_sanitize():
+    event = {
+        "source": "testing-farm",
+        "token": "secret-token",
+        "pusher": {"name": "packit", "email": "packit@example.com"},
+        "commits": [{"author": {"email": "user@example.com"}, "message": "Fix"}],
+        "webhook_secret": None,
+    }
+
+    assert sanitize(event) == {
+        "source": "testing-farm",
+        "token": REDACTED,
+        "pusher": {"name": "packit", "email": REDACTED},
+        "commits": [{"author": {"email": REDACTED}, "message": "Fix"}],
+        "webhook_secret": None,
+    }
+    assert event["token"] == "secret-token"
+
+
+def test_write_and_read(tmp_path):
+    writer = EventArchiveWriter(tmp_path, file_size=1024 * 1024, max_files=10)
+    writer.write("github", {"action": "opened", "number": 1})
+    writer.write("fedmsg", {"topic": "org.fedoraproject.prod.copr.build.end"})
+
+    # readable before the file is closed
+    records = list(read_event_archive(tmp_path))
+    assert [(record["source"], record["event"]) for record in records] == [
+        ("github", {"action": "opened", "number": 1}),
+        ("fedmsg", {"topic": "org.fedoraproject.prod.copr.build.end"}),
+    ]
+    assert records[0]["time"] <= records[1]["time"]
+
+    writer.close()
+    (path,) = tmp_path.iterdir()
+    assert len(list(read_event_archive(path))) == 2
+
+
+def test_rotation(tmp_path):
+    writer = EventArchiveWriter(tmp_path, file_size=1, max_files=2)
+    for number in range(3):
+        writer.write("github", {"number": number})
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert [record["event"]["number"] for record in read_event_archive(tmp_path)] == [
+        1,
+        2,
+    ]
+
+
+def test_incomplete_record_skipped(tmp_path):
+    path = tmp_path / "events-1.jsonl.gz"
+    with gzip.open(path, "wt") as file:
+        file.write(json.dumps({"time": 1, "source": "github", "event": {}}) + "\n")
+        file.write('{"time": 2, "sou')
+
+    assert [record["time"] for record in read_event_archive(tmp_path)] == [1]
+
+
+def test_record_event_not_configured(tmp_path):
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig()
+    )
+    flexmock(EventArchiveWriter).should_receive("write").never()
+
+    record_event("github", {"action": "opened"})
+
+
+def test_record_event_failure_ignored(tmp_path):
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        ServiceConfig(event_archive_dir=str(tmp_path))
+    )
+    flexmock(event_archive, _writers={})
+    flexmock(EventArchiveWriter).should_receive("write").and_raise(
+        OSError("No space left on device")
+    ).once()
+
+    record_event("github", {"action": "opened"})
@@ -0,0 +1,152 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import pytest
+from fasjson_client.errors import APIError
+from flexmock import flexmock
+
+from packit.api import PackitAPI
+from packit.exceptions import PackitCommandFailedError
+from packit_service.worker.helpers import fas
+from packit_service.worker.helpers.fas import (
+    KerberosTicketManager,
+    get_fas_user,
+    get_fas_user_groups,
+)
+
+FASJSON_SPEC = {
+    "swagger": "2.0",
+    "basePath": "/v1",
+    "info": {"title": "FAS-JSON", "version": "1.0"},
+    "consumes": ["application/json"],
+    "produces": ["application/json"],
+    "paths": {
+        path: {
+            "parameters": [
+                {"in": "path", "name": "username", "required": True, "type": "string"}
+            ],
+            "get": {
+                "operationId": operation,
+                "tags": ["users"],
+                "responses": {
+                    "200": {"description": "Success", "schema": {"type": "object"}},
+                    "404": {"description": "User not found"},
+                },
+            },
+        }
+        for path, operation in (
+            ("/users/{username}/", "get_user"),
+            ("/users/{username}/groups/", "list_user_groups"),
+        )
+    },
+}
+
+
+@pytest.fixture
+def fasjson():
+    """Local fake fasjson with a single user."""
+    fasjson = {"requests": []}
+    responses = {
+        "/specs/v1.json": FASJSON_SPEC,
+        "/v1/users/packager/": {
+            "result": {"username": "packager", "github_username": "packager-gh"}
+        },
+        "/v1/users/packager/groups/": {
+            "result": [{"groupname": "fedora-contributor"}, {"groupname": "packager"}]
+        },
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            fasjson["requests"].append(self.path)
+            response = responses.get(self.path, {"message": "User not found"})
+            self.send_response(200 if self.path in responses else 404)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(json.dumps(response).encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    flexmock(fas, FASJSON_URL=f"http://127.0.0.1:{server.server_port}")
+    flexmock(fas).should_receive("get_kerberos_ticket_manager").and_return(
+        flexmock(ensure_ticket=lambda: True)
+    )
+    yield fasjson
+    server.shutdown()
+    server.server_close()
+
+
+def test_fas_lookups_cached(fasjson):
+    for _ in range(2):
+        assert get_fas_user("packager")["github_username"] == "packager-gh"
+        assert get_fas_user_groups("packager") == ["fedora-contributor", "packager"]
+        assert get_fas_user("unknown") is None
+        assert get_fas_user_groups("unknown") is None
+
+    assert fasjson["requests"].count("/specs/v1.json") == 1
+    assert sorted(path for path in fasjson["requests"] if path.startswith("/v1/")) == [
+        "/v1/users/packager/",
+        "/v1/users/packager/groups/",
+        "/v1/users/unknown/",
+        "/v1/users/unknown/groups/",
+    ]
+
+
+def test_fas_lookup_failure_not_cached():
+    calls = []
+
+    def get_user(username, _request_options):
+        calls.append(username)
+        if len(calls) == 1:
+            raise APIError("Server error", 500)
+        return flexmock(result={"username": username})
+
+    client = flexmock()
+    client.should_receive("get_user").replace_with(get_user)
+    flexmock(fas).should_receive("get_fasjson_client").and_return(client)
+
+    with pytest.raises(APIError):
+        get_fas_user("packager")
+    assert get_fas_user("packager") == {"username": "packager"}
+    assert get_fas_user("packager") == {"username": "packager"}
+    # the failure is not cached, the successful lookup is
+    assert calls == ["packager", "packager"]
+
+
+def test_kerberos_ticket_renewed():
+    kinit_calls = []
+
+    def init_kerberos_ticket():
+        kinit_calls.append(None)
+        if len(kinit_calls) == 1:
+            raise PackitCommandFailedError(
+                "kinit failed", stdout_output="", stderr_output=""
+            )
+
+    flexmock(PackitAPI).should_receive("init_kerberos_ticket").replace_with(
+        init_kerberos_ticket
+    )
+    # the renewal loop is run by the test itself
+    renewal = flexmock(is_alive=lambda: True)
+    renewal.should_receive("start").once()
+    flexmock(fas).should_receive("Thread").and_return(renewal).once()
+
+    manager = KerberosTicketManager(service_config=flexmock(), renew_interval=60)
+    assert not manager.ensure_ticket()
+    assert manager.ensure_ticket()
+    assert manager.ensure_ticket()
+
+    # renewed once the interval passes, until stopped
+    flexmock(manager._stopped).should_receive("wait").with_args(60).and_return(
+        False
+    ).and_return(True).one_by_one().twice()
+    manager._renew_periodically()
+    assert len(kinit_calls) == 3
@@ -0,0 +1,100 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.cache import LocalCache, set_shared_cache
+from packit_service.constants import DEFAULT_JOB_TIMEOUT
+from packit_service.models import CoprBuildTargetModel, KojiBuildTargetModel
+from packit_service.worker.helpers.fedmsg_filter import (
+    SUBMITTED_BUILDS_KEY_PREFIX,
+    SubmittedBuilds,
+)
+from packit_service.worker.monitoring import fedmsg_prefilter_rejected
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR
+
+
+class SharedLocalCache(LocalCache):
+    """In-memory cache pretending to be shared by all the processes."""
+
+    shared = True
+
+
+@pytest.fixture
+def redis_cache():
+    cache = SharedLocalCache()
+    set_shared_cache(cache)
+    yield cache
+    set_shared_cache(None)
+
+
+@pytest.fixture
+def copr_build_end():
+    with open(DATA_DIR / "fedmsg" / "copr_build_end.json") as outfile:
+        return json.load(outfile)
+
+
+def test_not_filtered_without_shared_cache():
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_ids_submitted_after"
+    ).never()
+
+    assert SubmittedBuilds("copr", CoprBuildTargetModel).might_contain(1)
+
+
+def test_submitted_builds(redis_cache):
+    flexmock(KojiBuildTargetModel).should_receive(
+        "get_build_ids_submitted_after"
+    ).and_return({"10", "11"}).once()
+    submitted = SubmittedBuilds("koji", KojiBuildTargetModel)
+
+    assert submitted.might_contain(10)
+    assert submitted.might_contain("11")
+    assert not submitted.might_contain(12)
+    submitted.add(12)
+    assert submitted.might_contain(12)
+    assert submitted.might_contain(None)
+
+
+def test_submitted_builds_loaded_at_once(redis_cache):
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_ids_submitted_after"
+    ).and_return({"1", "2"}).once()
+    flexmock(redis_cache).should_call("set_many").with_args(
+        {
+            f"{SUBMITTED_BUILDS_KEY_PREFIX}:copr:1": "1",
+            f"{SUBMITTED_BUILDS_KEY_PREFIX}:copr:2": "1",
+            f"{SUBMITTED_BUILDS_KEY_PREFIX}:copr-loaded": "1",
+        },
+        DEFAULT_JOB_TIMEOUT,
+    ).once()
+
+    assert SubmittedBuilds("copr", CoprBuildTargetModel).might_contain(1)
+
+
+def test_not_filtered_if_not_loaded(redis_cache):
+    flexmock(redis_cache).should_receive("set_many")
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_ids_submitted_after"
+    ).and_return({"1"}).once()
+    submitted = SubmittedBuilds("copr", CoprBuildTargetModel)
+
+    # the cache doesn't work, the IDs are not loaded again right away
+    assert submitted.might_contain(2)
+    assert submitted.might_contain(3)
+
+
+def test_parser_drops_foreign_copr_build(redis_cache, copr_build_end):
+    flexmock(CoprBuildTargetModel).should_receive(
+        "get_build_ids_submitted_after"
+    ).and_return(set())
+    flexmock(CoprBuildTargetModel).should_receive("get_by_build_id").never()
+    rejected = fedmsg_prefilter_rejected.labels(topic=copr_build_end["topic"])
+    count = rejected._value.get()
+
+    assert Parser.parse_event(copr_build_end) is None
+    assert rejected._value.get() == count + 1
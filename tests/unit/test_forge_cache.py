@@ -0,0 +1,120 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+from flexmock import flexmock
+from ogr.abstract import GitProject, GitService
+from ogr.services.github import GithubProject, GithubService
+from ogr.services.gitlab import GitlabProject, GitlabService
+
+from packit_service import forge_cache
+from packit_service.cache import LocalCache
+from packit_service.constants import FORGE_CACHE_NOT_INVALIDATED_TTL, FORGE_CACHE_TTL
+
+
+@pytest.fixture
+def project():
+    return GithubProject(repo="ogr", namespace="packit", service=GithubService())
+
+
+def test_permissions_cached(project):
+    flexmock(project).should_receive("is_private").and_return(False).once()
+    flexmock(project).should_receive("can_merge_pr").with_args("lbarcziova").and_return(
+        True
+    ).once()
+    flexmock(project).should_receive("can_merge_pr").with_args("someone").and_return(
+        False
+    ).once()
+    flexmock(project).should_receive("has_write_access").with_args(
+        user="lbarcziova"
+    ).and_return(True).once()
+
+    for _ in range(2):
+        assert not forge_cache.is_private(project)
+        assert forge_cache.can_merge_pr(project, "lbarcziova")
+        assert not forge_cache.can_merge_pr(project, "someone")
+        assert forge_cache.has_write_access(project, "lbarcziova")
+
+
+def test_project_stub_not_cached():
+    project = flexmock(is_private=lambda: True)
+    project.should_call("is_private").twice()
+    assert forge_cache.is_private(project)
+    assert forge_cache.is_private(project)
+
+
+def test_project_without_hostname_not_cached():
+    project = GitProject("", GitService(), "")
+    flexmock(project).should_receive("can_merge_pr").and_return(True).twice()
+    assert forge_cache.can_merge_pr(project, "lbarcziova")
+    assert forge_cache.can_merge_pr(project, "lbarcziova")
+
+
+@pytest.mark.parametrize(
+    "project,ttl",
+    [
+        pytest.param(
+            GithubProject(repo="ogr", namespace="packit", service=GithubService()),
+            FORGE_CACHE_TTL,
+            id="github",
+        ),
+        pytest.param(
+            GitlabProject(
+                repo="ogr",
+                namespace="packit",
+                service=GitlabService(instance_url="https://gitlab.com"),
+            ),
+            FORGE_CACHE_NOT_INVALIDATED_TTL,
+            id="gitlab-not-invalidated",
+        ),
+    ],
+)
+def test_cache_ttl(project, ttl):
+    flexmock(project).should_receive("is_private").and_return(False)
+    flexmock(LocalCache).should_call("set").with_args(str, "false", ttl).once()
+    assert not forge_cache.is_private(project)
+
+
+@pytest.mark.parametrize(
+    "event_type,event,invalidated",
+    [
+        pytest.param(
+            "member",
+            {"action": "removed", "repository": {"owner": {"login": "packit"}}},
+            True,
+            id="collaborator-removed",
+        ),
+        pytest.param(
+            "organization",
+            {"action": "member_removed", "organization": {"login": "packit"}},
+            True,
+            id="organization-member-removed",
+        ),
+        pytest.param(
+            "installation",
+            {"action": "deleted", "installation": {"account": {"login": "packit"}}},
+            True,
+            id="installation-deleted",
+        ),
+        pytest.param(
+            "repository",
+            {"action": "privatized", "repository": {"owner": {"login": "other"}}},
+            False,
+            id="other-namespace",
+        ),
+        pytest.param(
+            "issue_comment",
+            {"action": "created", "repository": {"owner": {"login": "packit"}}},
+            False,
+            id="not-changing-permissions",
+        ),
+    ],
+)
+def test_invalidate_on_github_event(project, event_type, event, invalidated):
+    flexmock(project).should_receive("can_merge_pr").and_return(True).and_return(
+        False
+    ).one_by_one()
+
+    assert forge_cache.can_merge_pr(project, "lbarcziova")
+    forge_cache.invalidate_on_github_event(event_type, event)
+    assert forge_cache.can_merge_pr(project, "lbarcziova") is not invalidated
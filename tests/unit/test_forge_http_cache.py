@@ -0,0 +1,201 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import gitlab
+import pytest
+import requests
+from flexmock import flexmock
+from github import Github
+from github.Requester import Requester
+from ogr.services.github import GithubService
+from ogr.services.gitlab import GitlabService
+from ogr.services.pagure import PagureService
+
+from packit_service.constants import (
+    FORGE_HTTP_CACHE_GITHUB_TOKEN_TTL,
+    FORGE_HTTP_CACHE_TTL,
+)
+from packit_service.forge_http_cache import (
+    ConditionalHTTPSRequestsConnection,
+    ConditionalRequestsAdapter,
+    get_cache_ttl,
+    pygithub_internals_available,
+    use_conditional_requests,
+)
+from packit_service.metrics import forge_conditional_requests, forge_rate_limit_saved
+
+
+@pytest.fixture
+def forge():
+    """Local fake forge with a single repository, its ETag changes with the data."""
+    forge = {"repo": {"name": "ogr", "private": False}, "requests": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            forge["requests"].append(dict(self.headers))
+            body = json.dumps(forge["repo"]).encode()
+            etag = f'"{hash(body)}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("X-GitHub-Request-Id", "1")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    forge["url"] = f"http://127.0.0.1:{server.server_port}/repos/packit/ogr"
+    yield forge
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def pygithub():
+    """Restore the connection classes of PyGithub replaced by the tests."""
+    pygithub_internals_available.cache_clear()
+    yield
+    Requester.resetConnectionClasses()
+    pygithub_internals_available.cache_clear()
+
+
+@pytest.fixture
+def session():
+    session = requests.Session()
+    session.mount("http://", ConditionalRequestsAdapter())
+    return session
+
+
+def get_metric(metric, **labels) -> float:
+    return metric.labels(**labels)._value.get()
+
+
+def test_revalidated(forge, session):
+    hits = get_metric(forge_conditional_requests, host="127.0.0.1", result="hit")
+    saved = get_metric(forge_rate_limit_saved, host="127.0.0.1")
+
+    assert session.get(forge["url"]).json() == {"name": "ogr", "private": False}
+    response = session.get(forge["url"])
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "ogr", "private": False}
+    assert "If-None-Match" not in forge["requests"][0]
+    assert forge["requests"][1]["If-None-Match"] == response.headers["ETag"]
+    assert get_metric(forge_conditional_requests, host="127.0.0.1", result="hit") == (
+        hits + 1
+    )
+    assert get_metric(forge_rate_limit_saved, host="127.0.0.1") == saved + 1
+
+
+def test_changed(forge, session):
+    session.get(forge["url"])
+    forge["repo"]["private"] = True
+
+    assert session.get(forge["url"]).json() == {"name": "ogr", "private": True}
+    assert session.get(forge["url"]).json() == {"name": "ogr", "private": True}
+
+
+def test_not_shared_between_tokens(forge, session):
+    session.get(forge["url"], headers={"Authorization": "token a"})
+    session.get(forge["url"], headers={"Authorization": "token b"})
+
+    assert all("If-None-Match" not in headers for headers in forge["requests"])
+
+
+@pytest.mark.parametrize(
+    "request_headers,response_headers,ttl",
+    [
+        pytest.param(
+            {"Authorization": "token ghs_a"},
+            {"X-GitHub-Request-Id": "1"},
+            FORGE_HTTP_CACHE_GITHUB_TOKEN_TTL,
+            id="github-token",
+        ),
+        pytest.param(
+            {}, {"X-GitHub-Request-Id": "1"}, FORGE_HTTP_CACHE_TTL, id="github"
+        ),
+        pytest.param({"PRIVATE-TOKEN": "a"}, {}, FORGE_HTTP_CACHE_TTL, id="gitlab"),
+    ],
+)
+def test_cache_ttl(request_headers, response_headers, ttl):
+    request = requests.Request(
+        "GET", "https://api.github.com/repos/packit/ogr", headers=request_headers
+    ).prepare()
+    response = requests.Response()
+    response.headers.update(response_headers)
+    assert get_cache_ttl(request, response) == ttl
+
+
+def test_use_conditional_requests_gitlab():
+    service = GitlabService(token="token", instance_url="https://gitlab.com")
+    # getting a project doesn't authenticate to GitLab
+    flexmock(gitlab.Gitlab).should_receive("auth").never()
+    use_conditional_requests(service)
+    assert not service._gitlab_instance
+
+    # once ogr created the client, the adapter is mounted to its session
+    service._gitlab_instance = gitlab.Gitlab(
+        url=service.instance_url, private_token=service.token
+    )
+    use_conditional_requests(service)
+    assert isinstance(
+        service._gitlab_instance.session.get_adapter("https://gitlab.com"),
+        ConditionalRequestsAdapter,
+    )
+
+
+def test_use_conditional_requests_pagure():
+    service = PagureService(instance_url="https://src.fedoraproject.org")
+    use_conditional_requests(service)
+    use_conditional_requests(service)
+
+    adapter = service.session.get_adapter("https://src.fedoraproject.org")
+    assert isinstance(adapter, ConditionalRequestsAdapter)
+    assert adapter is service.session.get_adapter("http://src.fedoraproject.org")
+
+
+def test_use_conditional_requests_github(forge, pygithub):
+    hits = get_metric(forge_conditional_requests, host="127.0.0.1", result="hit")
+    service = GithubService(token="token")
+    use_conditional_requests(service)
+    # the fake forge instead of api.github.com
+    base_url = forge["url"].removesuffix("/repos/packit/ogr")
+    flexmock(service).should_receive("get_pygithub_instance").replace_with(
+        lambda namespace, repo: Github(base_url=base_url)
+    )
+
+    assert not service.get_project(namespace="packit", repo="ogr").is_private()
+    # another client (e.g. of the next task) revalidates the response
+    assert not service.get_project(namespace="packit", repo="ogr").is_private()
+    forge["repo"]["private"] = True
+    assert service.get_project(namespace="packit", repo="ogr").is_private()
+
+    assert "If-None-Match" not in forge["requests"][0]
+    assert forge["requests"][1]["If-None-Match"]
+    assert get_metric(forge_conditional_requests, host="127.0.0.1", result="hit") == (
+        hits + 1
+    )
+
+
+def test_use_conditional_requests_github_internals_missing(monkeypatch, pygithub):
+    monkeypatch.delattr(Requester, "_Requester__persist")
+    # the requests are sent as usual
+    use_conditional_requests(GithubService(token="token"))
+    assert (
+        Requester._Requester__httpsConnectionClass
+        is not ConditionalHTTPSRequestsConnection
+    )
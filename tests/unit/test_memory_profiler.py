@@ -0,0 +1,89 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import logging
+import tracemalloc
+
+import pytest
+from flexmock import flexmock
+from sqlalchemy.orm import Session
+
+from packit_service import models
+from packit_service.worker import memory_profiler
+from packit_service.worker.memory_profiler import MemoryProfiler
+from packit_service.worker.monitoring import (
+    task_identity_map_size,
+    task_rss_growth,
+    worker_rss,
+)
+
+
+@pytest.fixture
+def no_tracing():
+    yield
+    tracemalloc.stop()
+
+
+def test_task_metrics():
+    flexmock(memory_profiler).should_receive("get_rss").and_return(
+        100 * 1024**2
+    ).and_return(101 * 1024**2)
+    growth = task_rss_growth.labels(task="task.test")._sum.get()
+    identity_map = task_identity_map_size.labels(task="task.test")._sum.get()
+
+    profiler = MemoryProfiler()
+    profiler.task_started("1")
+    profiler.task_finished("1", "task.test", identity_map=42)
+
+    assert not tracemalloc.is_tracing()
+    assert worker_rss._value.get() == 101 * 1024**2
+    assert task_rss_growth.labels(task="task.test")._sum.get() == growth + 1024**2
+    assert (
+        task_identity_map_size.labels(task="task.test")._sum.get() == identity_map + 42
+    )
+
+
+def test_snapshots(no_tracing, caplog):
+    profiler = MemoryProfiler(snapshot_interval=2)
+    leaked = []
+
+    with caplog.at_level(logging.INFO, logger=memory_profiler.__name__):
+        for task_id in range(4):
+            profiler.task_started(str(task_id))
+            leaked.append(bytearray(1024**2))
+            profiler.task_finished(str(task_id), "task.leaking", identity_map=0)
+
+    assert tracemalloc.is_tracing()
+    first, second = [
+        record.getMessage()
+        for record in caplog.records
+        if record.name == memory_profiler.__name__
+    ]
+    assert first.startswith("Memory snapshot after 2 tasks")
+    assert "2x task.leaking" in first
+    assert "Allocation sites which grew the most" not in first
+    assert second.startswith("Memory snapshot after 4 tasks")
+    assert "test_memory_profiler.py" in second.split("grew the most:")[1]
+    assert not profiler.tasks_since_snapshot
+
+
+def test_end_task_session_scoped():
+    flexmock(models, singleton_session=None)
+    flexmock(models.Session).should_receive("remove").once()
+
+    models.start_task_session()
+    models.end_task_session()
+
+
+def test_end_task_session_singleton():
+    session = flexmock(Session())
+    flexmock(models, singleton_session=session, _tasks_in_singleton_session=0)
+
+    models.start_task_session()
+    models.start_task_session()
+    session.should_receive("expunge_all").never()
+    models.end_task_session()
+
+    # the objects are not used by any other task
+    session.should_receive("expunge_all").once()
+    models.end_task_session()
@@ -0,0 +1,105 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from flexmock import flexmock
+
+from packit_service.models import CoprBuildTargetModel
+from packit_service.worker.helpers import polling
+from packit_service.worker.helpers.polling import (
+    copr_build_polling_scheduler,
+    get_expected_copr_build_duration,
+    get_next_check_delay,
+    tft_test_run_polling_scheduler,
+    vm_image_build_polling_scheduler,
+)
+from packit_service.worker.monitoring import (
+    babysit_checks_per_item,
+    babysit_detection_lag,
+)
+
+NOW = datetime(2023, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "elapsed,expected,delay",
+    [
+        pytest.param(0, None, 60, id="unknown-duration-min-interval"),
+        pytest.param(2 * 3600, None, 1800, id="unknown-duration-backoff"),
+        pytest.param(20 * 3600, None, 3600, id="unknown-duration-max-interval"),
+        pytest.param(0, 1200, 600, id="half-of-the-expected-duration"),
+        pytest.param(1100, 1200, 120, id="close-to-the-expected-end"),
+        pytest.param(1200, 600, 300, id="longer-than-expected"),
+    ],
+)
+def test_get_next_check_delay(elapsed, expected, delay):
+    assert get_next_check_delay(elapsed, expected) == delay
+
+
+def test_get_expected_copr_build_duration():
+    flexmock(CoprBuildTargetModel).should_receive("get_recent_durations").with_args(
+        owner="packit", target="fedora-rawhide-x86_64", project_name="ogr", limit=20
+    ).and_return([300]).once()
+    flexmock(CoprBuildTargetModel).should_receive("get_recent_durations").with_args(
+        owner="packit", target="fedora-rawhide-x86_64", limit=20
+    ).and_return([300, 1200, 600, 900]).once()
+
+    for _ in range(2):
+        assert (
+            get_expected_copr_build_duration("packit", "ogr", "fedora-rawhide-x86_64")
+            == 750
+        )
+
+
+def test_first_check_at_half_of_the_expected_duration():
+    flexmock(polling).should_receive("get_expected_copr_build_duration").and_return(
+        1200
+    )
+    build = flexmock(
+        next_check_time=None,
+        build_submitted_time=datetime(2023, 5, 1, 11, 51),
+        owner="packit",
+        project_name="ogr",
+        target="fedora-rawhide-x86_64",
+    )
+
+    assert not copr_build_polling_scheduler.is_due(build, NOW)
+    assert copr_build_polling_scheduler.is_due(build, NOW + timedelta(minutes=1))
+
+
+def test_schedule():
+    run = flexmock(
+        id=1, next_check_time=None, submitted_time=datetime(2023, 5, 1, 10, 0)
+    )
+    run.should_receive("set_next_check_time").with_args(
+        datetime(2023, 5, 1, 12, 30)
+    ).replace_with(lambda time: setattr(run, "next_check_time", time)).once()
+
+    assert tft_test_run_polling_scheduler.schedule(run, NOW) == 1800
+    assert not tft_test_run_polling_scheduler.is_due(run, NOW)
+    assert tft_test_run_polling_scheduler.get_countdown([run], NOW) == 1800
+    assert tft_test_run_polling_scheduler.is_due(run, NOW + timedelta(minutes=30))
+
+
+def test_completed_metrics():
+    checks = babysit_checks_per_item.labels(kind="copr_build")._sum.get()
+    lag = babysit_detection_lag.labels(kind="copr_build")._sum.get()
+    build = flexmock(check_count=3, build_finished_time=datetime(2023, 5, 1, 11, 58))
+    # checked again if the handler task doesn't update the build
+    build.should_receive("set_next_check_time").with_args(
+        datetime(2023, 5, 1, 13, 0)
+    ).once()
+
+    copr_build_polling_scheduler.completed(build, NOW)
+
+    assert babysit_checks_per_item.labels(kind="copr_build")._sum.get() == checks + 4
+    assert babysit_detection_lag.labels(kind="copr_build")._sum.get() == lag + 120
+
+
+def test_vm_image_build_end_time_recorded():
+    build = flexmock(check_count=None, build_finished_time=None)
+    build.should_receive("set_end_time").with_args(datetime(2023, 5, 1, 12, 0)).once()
+    build.should_receive("set_next_check_time")
+    vm_image_build_polling_scheduler.completed(build, NOW)
@@ -1,12 +1,20 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
 import pytest
 from flexmock import flexmock
 
 from packit.config import CommonPackageConfig, PackageConfig, JobConfig, JobType
 from packit.config.job_config import JobConfigTriggerType
+from packit.exceptions import PackitDownloadFailedException
 from packit_service.config import ServiceConfig
+from packit_service.worker.helpers.sync_release.archive import (
+    get_failed_download_url,
+    is_archive_available,
+)
 from packit_service.worker.helpers.sync_release.propose_downstream import (
     ProposeDownstreamJobHelper,
 )
@@ -94,3 +102,60 @@ def test_branches(jobs, job_config_trigger_type, branches_override, branches):
         branches_override=branches_override,
     )
     assert propose_downstream_helper.branches == branches
+
+
+@pytest.fixture
+def archive_server():
+    """Local HTTP server serving only /hello-0.1.tar.gz."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_HEAD(self):
+            self.send_response(200 if self.path == "/hello-0.1.tar.gz" else 404)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "path,available",
+    [
+        pytest.param("/hello-0.1.tar.gz", True, id="uploaded"),
+        pytest.param("/hello-0.2.tar.gz", False, id="not-uploaded-yet"),
+    ],
+)
+def test_is_archive_available(archive_server, path, available):
+    assert is_archive_available(f"{archive_server}{path}") is available
+
+
+def test_is_archive_available_connection_error():
+    assert not is_archive_available("http://127.0.0.1:1/hello-0.1.tar.gz")
+
+
+@pytest.mark.parametrize(
+    "message,url",
+    [
+        pytest.param(
+            "Failed to download source from "
+            "https://files.pythonhosted.org/packages/source/p/packitos/packitos-0.1.tar.gz:"
+            "\n404 Client Error: Not Found",
+            "https://files.pythonhosted.org/packages/source/p/packitos/packitos-0.1.tar.gz",
+            id="pypi",
+        ),
+        pytest.param(
+            "Failed to download source from https://example.com/hello-0.1.tar.gz",
+            "https://example.com/hello-0.1.tar.gz",
+            id="no-details",
+        ),
+        pytest.param("Failed to download source from example.com", None, id="no-url"),
+    ],
+)
+def test_get_failed_download_url(message, url):
+    assert get_failed_download_url(PackitDownloadFailedException(message)) == url
@@ -0,0 +1,78 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from packit_service import query_profiler
+from packit_service.query_profiler import profile_queries
+from packit_service.metrics import db_queries, db_queries_duration
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    query_profiler.install(engine)
+    with engine.connect() as connection:
+        connection.execute(text("CREATE TABLE builds (id INTEGER)"))
+    return engine
+
+
+def test_profile_queries(engine):
+    observed = db_queries.labels(scope="task", name="task.test")._sum.get()
+
+    with profile_queries("task", "task.test") as profile:
+        with engine.connect() as connection:
+            connection.execute(text("INSERT INTO builds VALUES (1)"))
+            connection.execute(text("SELECT id FROM builds"))
+
+    assert profile.count == 2
+    assert profile.duration == pytest.approx(sum(d for d, _ in profile.slowest))
+    assert {statement for _, statement in profile.slowest} == {
+        "INSERT INTO builds VALUES (1)",
+        "SELECT id FROM builds",
+    }
+    durations = [duration for duration, _ in profile.slowest]
+    assert durations == sorted(durations, reverse=True)
+    assert db_queries.labels(scope="task", name="task.test")._sum.get() == (
+        observed + 2
+    )
+    assert db_queries_duration.labels(scope="task", name="task.test")._sum.get() > 0
+
+
+def test_queries_outside_of_profile_not_recorded(engine):
+    with profile_queries("request", "api.test") as profile:
+        pass
+    with engine.connect() as connection:
+        connection.execute(text("SELECT id FROM builds"))
+
+    assert profile.count == 0
+
+
+def test_failed_query(engine):
+    with profile_queries("task", "task.test") as profile:
+        with engine.connect() as connection:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT id FROM no_such_table"))
+            connection.execute(text("SELECT id FROM builds"))
+            assert not connection.info.get("query_start_time")
+
+    assert profile.count == 1
+
+
+def test_repeated_queries_logged(engine, caplog, monkeypatch):
+    monkeypatch.setattr(query_profiler, "DB_PROFILER_REPEATED_QUERIES", 3)
+
+    with caplog.at_level(logging.WARNING, logger="packit_service.query_profiler"):
+        with profile_queries("task", "task.test") as profile:
+            with engine.connect() as connection:
+                for build_id in range(3):
+                    connection.execute(
+                        text("SELECT id FROM builds WHERE id = :id"), {"id": build_id}
+                    )
+
+    assert profile.repeated == {"SELECT id FROM builds WHERE id = ?": 3}
+    assert "possible N+1 queries" in caplog.text
@@ -0,0 +1,136 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+from contextlib import contextmanager
+
+from celery.app.task import Context
+from flexmock import flexmock
+from redis.exceptions import ConnectionError
+
+from packit_service import celerizer
+from packit_service.celerizer import set_published_at
+from packit_service.constants import CELERY_PUBLISHED_AT_HEADER
+from packit_service.worker import queue_metrics
+from packit_service.worker.monitoring import task_queue_latency
+from packit_service.worker.queue_metrics import QueueCollector, observe_queue_latency
+
+
+class FakePipeline:
+    def __init__(self, queues):
+        self.queues = queues
+        self.results = []
+
+    def llen(self, queue):
+        self.results.append(len(self.queues.get(queue, [])))
+
+    def lindex(self, queue, index):
+        messages = self.queues.get(queue, [])
+        self.results.append(messages[index] if messages else None)
+
+    def execute(self):
+        return self.results
+
+
+class FakeCeleryApp:
+    def __init__(self, queues):
+        self.client = flexmock(pipeline=lambda: FakePipeline(queues))
+
+    @contextmanager
+    def connection_for_read(self):
+        yield flexmock(default_channel=flexmock(client=self.client))
+
+
+def message(task_id, published_at=None):
+    headers = {"id": task_id, "task": "task.steve_jobs.process_message"}
+    if published_at:
+        headers[CELERY_PUBLISHED_AT_HEADER] = published_at
+    return json.dumps({"body": "", "headers": headers}).encode()
+
+
+def test_published_at_set():
+    flexmock(celerizer).should_receive("time").and_return(1000.0)
+    headers = {"id": "1"}
+    set_published_at(headers=headers, body=None)
+    assert headers == {"id": "1", CELERY_PUBLISHED_AT_HEADER: 1000.0}
+
+
+def test_sample(monkeypatch):
+    # the oldest messages are on the right
+    queues = {
+        "short-running": [message("2", 990.0), message("1", 900.0)],
+        "long-running": [message("3")],
+    }
+    monkeypatch.setattr(queue_metrics, "celery_app", FakeCeleryApp(queues))
+    flexmock(queue_metrics).should_receive("time").and_return(1000.0).and_return(
+        1030.0
+    ).one_by_one()
+    collector = QueueCollector()
+
+    assert collector.sample() == {
+        "short-running": (2, 100.0),
+        # without the publish time, counted from the first sample
+        "long-running": (1, 0.0),
+    }
+    assert collector.sample() == {
+        "short-running": (2, 130.0),
+        "long-running": (1, 30.0),
+    }
+
+
+def test_sample_empty(monkeypatch):
+    monkeypatch.setattr(queue_metrics, "celery_app", FakeCeleryApp({}))
+    collector = QueueCollector(["short-running"])
+    assert collector.sample() == {"short-running": (0, 0.0)}
+
+    families = {family.name: family for family in collector.collect()}
+    assert families["celery_queue_depth"].samples[0].labels == {
+        "queue": "short-running"
+    }
+    assert families["celery_queue_depth"].samples[0].value == 0
+
+
+def test_collect_broker_unavailable():
+    collector = QueueCollector()
+    flexmock(collector).should_receive("sample").and_raise(ConnectionError)
+    assert not list(collector.collect())
+
+
+def test_observe_queue_latency():
+    flexmock(queue_metrics).should_receive("time").and_return(1000.0)
+    observed = task_queue_latency.labels(task="task.test", queue="long-running")
+
+    sum_before = observed._sum.get()
+    observe_queue_latency(
+        flexmock(
+            name="task.test",
+            request=Context(
+                {
+                    CELERY_PUBLISHED_AT_HEADER: 990.0,
+                    "delivery_info": {"routing_key": "long-running"},
+                }
+            ),
+        )
+    )
+    assert observed._sum.get() == sum_before + 10.0
+
+    # the countdown is not counted
+    sum_before = observed._sum.get()
+    observe_queue_latency(
+        flexmock(
+            name="task.test",
+            request=Context(
+                {
+                    CELERY_PUBLISHED_AT_HEADER: 900.0,
+                    "eta": "1970-01-01T00:16:35+00:00",
+                    "delivery_info": {"routing_key": "long-running"},
+                }
+            ),
+        )
+    )
+    assert observed._sum.get() == sum_before + 5.0
+
+
+def test_observe_queue_latency_not_published_by_us():
+    flexmock(task_queue_latency).should_receive("labels").never()
+    observe_queue_latency(flexmock(name="task.test", request=Context({})))
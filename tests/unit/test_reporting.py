@@ -4,9 +4,9 @@ import gitlab
 import pytest
 from flexmock import flexmock
 from ogr import PagureService
-from ogr.abstract import CommitStatus
+from ogr.abstract import CommitStatus, IssueStatus
 from ogr.exceptions import GithubAPIException, GitlabAPIException
-from ogr.services.github import GithubProject
+from ogr.services.github import GithubProject, GithubService
 from ogr.services.github.check_run import (
     create_github_check_run_output,
     GithubCheckRunStatus,
@@ -14,6 +14,7 @@ from ogr.services.github.check_run import (
 )
 from ogr.services.gitlab import GitlabProject
 from ogr.services.pagure import PagureProject
+from packit_service.models import PackitIssueModel
 from packit_service.worker import reporting
 
 from packit_service.worker.reporting import (
@@ -634,3 +635,85 @@ def test_comment(pr_id, commit_sha, duplicate_check, existing_comments, should_c
             act_upon.should_receive("commit_comment").never()
 
     reporter.comment(body="foo", duplicate_check=duplicate_check)
+
+
+@pytest.fixture
+def github_project():
+    return GithubProject(
+        repo="notifications", namespace="packit", service=GithubService()
+    )
+
+
+@pytest.mark.parametrize(
+    "packit_issue, status, comment, create_new",
+    [
+        pytest.param(
+            flexmock(issue_id=3, closed=False), IssueStatus.open, "comment", False
+        ),
+        pytest.param(flexmock(issue_id=3, closed=False), IssueStatus.open, None, False),
+        pytest.param(
+            flexmock(issue_id=3, closed=False), IssueStatus.closed, "comment", True
+        ),
+        pytest.param(
+            flexmock(issue_id=3, closed=False), IssueStatus.closed, None, True
+        ),
+        pytest.param(flexmock(issue_id=3, closed=True), None, "comment", True),
+    ],
+)
+def test_create_issue_if_needed_recorded(
+    github_project, packit_issue, status, comment, create_new
+):
+    project_info = {
+        "namespace": "packit",
+        "repo_name": "notifications",
+        "project_url": "https://github.com/packit/notifications",
+    }
+    flexmock(PackitIssueModel).should_receive("get_latest").with_args(
+        title="Koji build failed", **project_info
+    ).and_return(packit_issue)
+    flexmock(github_project).should_receive("get_issue_list").never()
+
+    if status:
+        existing_issue = flexmock(id=3, url="url", status=status)
+        flexmock(github_project).should_receive("get_issue").with_args(3).and_return(
+            existing_issue
+        ).once()
+        existing_issue.should_receive("comment").times(
+            0 if create_new or not comment else 1
+        )
+    if status == IssueStatus.closed:
+        packit_issue.should_receive("set_closed").once()
+
+    if create_new:
+        flexmock(github_project).should_receive("create_issue").with_args(
+            title="[packit] Koji build failed", body="message"
+        ).and_return(flexmock(id=4, url="url")).once()
+        flexmock(PackitIssueModel).should_receive("create").with_args(
+            title="Koji build failed", issue_id=4, **project_info
+        ).once()
+
+    issue = reporting.create_issue_if_needed(
+        github_project, "Koji build failed", "message", comment
+    )
+    assert bool(issue) is create_new
+
+
+def test_create_issue_if_needed_not_recorded_yet(github_project):
+    flexmock(PackitIssueModel).should_receive("get_latest").and_return(None)
+    existing_issue = flexmock(id=3, url="url", title="[packit] Koji build failed")
+    existing_issue.should_receive("comment").with_args(body="comment").once()
+    flexmock(github_project).should_receive("get_issue_list").and_return(
+        [existing_issue]
+    ).once()
+    flexmock(github_project).should_receive("create_issue").never()
+    flexmock(PackitIssueModel).should_receive("create").with_args(
+        title="Koji build failed",
+        issue_id=3,
+        namespace="packit",
+        repo_name="notifications",
+        project_url="https://github.com/packit/notifications",
+    ).once()
+
+    assert not reporting.create_issue_if_needed(
+        github_project, "Koji build failed", "message", "comment"
+    )
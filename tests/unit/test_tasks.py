@@ -4,11 +4,20 @@
 import prometheus_client
 import pytest
 from celery.app.task import Task
+from celery.canvas import Signature
 from copr.v3 import CoprRequestException
 from flexmock import flexmock
 
-from packit_service.worker.tasks import run_copr_build_handler
+from packit_service.config import ServiceConfig
+from packit_service.worker import tasks
+from packit_service.worker.tasks import (
+    PackitArchiveNotAvailableException,
+    babysit_pending_tft_runs,
+    run_copr_build_handler,
+    wait_for_upstream_archive,
+)
 from packit_service.worker.handlers import CoprBuildHandler
+from packit_service.worker.handlers.abstract import TaskName
 
 
 def test_autoretry():
@@ -21,3 +30,53 @@ def test_autoretry():
     flexmock(Task).should_receive("retry").and_raise(CoprRequestException).once()
     with pytest.raises(CoprRequestException):
         run_copr_build_handler({}, {}, {})
+
+
+@pytest.mark.parametrize("available", [True, False])
+def test_wait_for_upstream_archive(available):
+    url = "https://example.com/hello-0.1.tar.gz"
+    flexmock(tasks).should_receive("is_archive_available").with_args(url).and_return(
+        available
+    ).once()
+
+    if available:
+        flexmock(Signature).should_receive("apply_async").with_args(retries=1).once()
+        flexmock(Task).should_receive("retry").never()
+    else:
+        flexmock(Signature).should_receive("apply_async").never()
+        # verify that the availability is checked again later
+        flexmock(Task).should_receive("retry").and_raise(
+            PackitArchiveNotAvailableException
+        ).once()
+
+    kwargs = dict(
+        url=url,
+        task_name=TaskName.propose_downstream.value,
+        task_kwargs={"sync_release_run_id": 123},
+        task_retries=1,
+    )
+    if available:
+        wait_for_upstream_archive(**kwargs)
+    else:
+        with pytest.raises(PackitArchiveNotAvailableException):
+            wait_for_upstream_archive(**kwargs)
+
+
+@pytest.mark.parametrize("shards", [1, 3])
+def test_babysit_shards(shards):
+    flexmock(ServiceConfig).should_receive("get_service_config").and_return(
+        flexmock(babysit_shards=shards)
+    )
+    if shards == 1:
+        flexmock(Signature).should_receive("apply_async").never()
+        flexmock(tasks).should_receive(
+            "check_pending_testing_farm_runs"
+        ).with_args().once()
+        flexmock(prometheus_client).should_receive("push_to_gateway")
+    else:
+        flexmock(Signature).should_receive("apply_async").with_args(
+            queue="long-running"
+        ).times(shards)
+        flexmock(tasks).should_receive("check_pending_testing_farm_runs").never()
+
+    babysit_pending_tft_runs()
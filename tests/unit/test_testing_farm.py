@@ -1,8 +1,11 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
 from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
 
 import pytest
+import requests
 from celery.canvas import Signature
 from flexmock import flexmock
 
@@ -40,6 +43,14 @@ from packit_service.worker.handlers import TestingFarmResultsHandler as TFResult
 from packit_service.worker.helpers.testing_farm import (
     TestingFarmJobHelper as TFJobHelper,
 )
+from packit_service.worker.helpers.testing_farm_client import (
+    TestingFarmClient as TFClient,
+    get_testing_farm_client,
+)
+from packit_service.worker.monitoring import (
+    testing_farm_request_duration,
+    testing_farm_request_errors,
+)
 from packit_service.worker.reporting import StatusReporter, BaseCommitStatus
 from packit_service.worker.result import TaskResults
 
@@ -1707,3 +1718,124 @@ def test_is_supported_architecture(target, use_internal_tf, supported):
         flexmock(TFJobHelper).should_receive("report_status_to_tests_for_test_target")
 
     assert job_helper._is_supported_architecture(target) == supported
+
+
+@pytest.mark.parametrize(
+    "endpoint,label",
+    [
+        ("requests", "requests"),
+        ("requests/123abc", "requests/{id}"),
+        ("composes/public", "composes/public"),
+    ],
+)
+def test_testing_farm_client_endpoint_label(endpoint, label):
+    assert TFClient.get_endpoint_label(endpoint) == label
+
+
+def test_get_testing_farm_client_is_shared():
+    service_config = ServiceConfig(testing_farm_api_url="https://tf.example.com")
+    client = get_testing_farm_client(service_config)
+    assert client.api_url == "https://tf.example.com/"
+    assert get_testing_farm_client(service_config) is client
+    assert (
+        TFJobHelper(
+            service_config=service_config,
+            package_config=None,
+            project=None,
+            metadata=None,
+            db_trigger=None,
+            job_config=None,
+        ).testing_farm_client
+        is client
+    )
+
+
+@pytest.fixture
+def testing_farm_api():
+    """Local HTTP server knowing only the request 123abc."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b'{"id": "123abc"}'
+            self.send_response(200 if self.path == "/requests/123abc" else 404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_testing_farm_client_metrics(testing_farm_api):
+    def sample(metric, name, **labels):
+        for m in metric.collect():
+            for s in m.samples:
+                if s.name == name and all(
+                    s.labels.get(k) == v for k, v in labels.items()
+                ):
+                    return s.value
+        return 0
+
+    labels = {"method": "GET", "endpoint": "requests/{id}"}
+    duration_count = sample(
+        testing_farm_request_duration,
+        "testing_farm_request_duration_seconds_count",
+        **labels,
+    )
+    errors = sample(
+        testing_farm_request_errors,
+        "testing_farm_request_errors_total",
+        error="404",
+        **labels,
+    )
+
+    client = TFClient(api_url=testing_farm_api, retries=0)
+    assert client.request("requests/123abc").json() == {"id": "123abc"}
+    assert client.request("requests/unknown").status_code == 404
+
+    assert (
+        sample(
+            testing_farm_request_duration,
+            "testing_farm_request_duration_seconds_count",
+            **labels,
+        )
+        == duration_count + 2
+    )
+    assert (
+        sample(
+            testing_farm_request_errors,
+            "testing_farm_request_errors_total",
+            error="404",
+            **labels,
+        )
+        == errors + 1
+    )
+
+
+def test_send_testing_farm_request_timeout():
+    job_helper = TFJobHelper(
+        service_config=ServiceConfig(testing_farm_api_url="https://tf.example.com"),
+        package_config=None,
+        project=None,
+        metadata=None,
+        db_trigger=None,
+        job_config=None,
+    )
+    flexmock(job_helper.testing_farm_client).should_receive("request").and_raise(
+        requests.ReadTimeout("Read timed out.")
+    )
+
+    response = job_helper.send_testing_farm_request(endpoint="requests/123abc")
+
+    assert not response.ok
+    assert response.status_code != 200
+    assert response.reason == "Read timed out."
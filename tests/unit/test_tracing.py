@@ -0,0 +1,64 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from datetime import datetime, timedelta, timezone
+
+from flexmock import flexmock
+from sqlalchemy.exc import OperationalError
+
+from packit_service.models import EventStage, EventStageTimeModel
+from packit_service.tracing import (
+    get_trace_id,
+    record_referenced_stage,
+    record_stage,
+    record_submission,
+    traced,
+)
+
+
+def test_not_traced():
+    flexmock(EventStageTimeModel).should_receive("add").never()
+
+    record_stage(EventStage.first_status)
+    record_submission("copr-build:1")
+    record_referenced_stage("copr-build:1", EventStage.finished)
+
+
+def test_traced():
+    time = datetime(2022, 1, 1, 12, tzinfo=timezone(timedelta(hours=2)))
+    flexmock(EventStageTimeModel).should_receive("add").with_args(
+        "trace", {EventStage.first_status: datetime(2022, 1, 1, 10)}
+    ).once()
+
+    with traced("trace"):
+        assert get_trace_id() == "trace"
+        record_stage(EventStage.first_status, time=time)
+    assert get_trace_id() is None
+
+
+def test_referenced_stage():
+    recorded = []
+    flexmock(EventStageTimeModel).should_receive("add").replace_with(
+        lambda trace_id, times: recorded.append((trace_id, times))
+    )
+
+    with traced("trace"):
+        record_submission("tft:1")
+    record_referenced_stage(
+        "tft:1", EventStage.finished, time=datetime(2022, 1, 1, tzinfo=timezone.utc)
+    )
+    record_referenced_stage("tft:2", EventStage.finished)
+
+    assert [(trace_id, list(times)) for trace_id, times in recorded] == [
+        ("trace", [EventStage.submitted]),
+        ("trace", [EventStage.finished]),
+    ]
+    assert recorded[1][1][EventStage.finished] == datetime(2022, 1, 1)
+
+
+def test_recording_failure_ignored():
+    flexmock(EventStageTimeModel).should_receive("add").and_raise(
+        OperationalError("INSERT", {}, Exception())
+    ).once()
+
+    record_stage(EventStage.reported, trace_id="trace")
@@ -0,0 +1,270 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmarks of the hot path of the processing of the events.
+
+They run against the database as the other tests in `tests_openshift`,
+the forges, Copr and Testing Farm are stubbed. They are skipped unless
+`BENCHMARK` is set (see `make check-benchmarks`).
+
+The results are compared to the baseline stored in `baseline.json`:
+a benchmark fails if it issues more SQL queries than in the baseline
+or if its median is more than `BENCHMARK_MAX_SLOWDOWN` times slower.
+Set `BENCHMARK_SAVE_BASELINE` to store the results as the new baseline.
+
+The committed baseline holds only the numbers of the queries, which
+do not depend on the machine, the timings are compared only against
+a baseline saved locally.
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from os import getenv
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+import pytest
+from celery import Celery
+from celery.canvas import Signature
+from copr.v3 import Client
+from flexmock import flexmock
+from github import Github
+from ogr.services.github import GithubProject
+from ogr.services.gitlab import GitlabProject
+from ogr.services.pagure import PagureProject
+from packit.copr_helper import CoprHelper
+from packit.local_project import LocalProject
+
+from packit_service.models import AllowlistModel, AllowlistStatus
+from packit_service.query_profiler import profile_queries
+from packit_service.worker.helpers.testing_farm_client import TestingFarmClient
+from tests.spellbook import DATA_DIR
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+ROUNDS = int(getenv("BENCHMARK_ROUNDS", "100"))
+WARMUP_ROUNDS = int(getenv("BENCHMARK_WARMUP_ROUNDS", "5"))
+MAX_SLOWDOWN = float(getenv("BENCHMARK_MAX_SLOWDOWN", "1.5"))
+
+TARGETS = ["fedora-rawhide-x86_64", "fedora-stable"]
+PACKIT_YAML = {
+    "specfile_path": "packit.spec",
+    "jobs": [
+        {"trigger": "pull_request", "job": "copr_build", "targets": TARGETS},
+        {"trigger": "pull_request", "job": "tests", "targets": TARGETS},
+        {
+            "trigger": "commit",
+            "job": "copr_build",
+            "branch": "build-branch",
+            "targets": TARGETS,
+        },
+        {"trigger": "release", "job": "propose_downstream"},
+    ],
+}
+
+
+@dataclass
+class BenchmarkResult:
+    queries: int
+    rounds: Optional[int] = None
+    # all the durations are in seconds
+    total: Optional[float] = None
+    median: Optional[float] = None
+    p90: Optional[float] = None
+    p99: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        """Calls per second."""
+        return self.rounds / self.total
+
+
+def percentile(durations: List[float], p: float) -> float:
+    """Percentile of the sorted durations (nearest rank)."""
+    return durations[min(len(durations) - 1, int(p * len(durations)))]
+
+
+def load_baseline() -> Dict[str, BenchmarkResult]:
+    if not BASELINE_PATH.exists():
+        return {}
+    return {
+        name: BenchmarkResult(**result)
+        for name, result in json.loads(BASELINE_PATH.read_text()).items()
+    }
+
+
+baseline = load_baseline()
+results: Dict[str, BenchmarkResult] = {}
+# additional lines of the summary, e.g. from the replay
+summary: List[str] = []
+
+
+class Benchmark:
+    """Calls a function repeatedly and compares its timings to the baseline."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.result: Optional[BenchmarkResult] = None
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        for _ in range(WARMUP_ROUNDS):
+            func(*args, **kwargs)
+
+        # the queries are counted in a separate call not to skew the timings
+        with profile_queries("benchmark", self.name) as profile:
+            value = func(*args, **kwargs)
+
+        durations = []
+        for _ in range(ROUNDS):
+            start = perf_counter()
+            func(*args, **kwargs)
+            durations.append(perf_counter() - start)
+
+        self.record(durations, queries=profile.count)
+        return value
+
+    def record(self, durations: List[float], queries: int) -> BenchmarkResult:
+        """Store the result of the timed calls and compare it to the baseline."""
+        durations = sorted(durations)
+        self.result = results[self.name] = BenchmarkResult(
+            rounds=len(durations),
+            total=sum(durations),
+            median=percentile(durations, 0.5),
+            p90=percentile(durations, 0.9),
+            p99=percentile(durations, 0.99),
+            queries=queries,
+        )
+        self.compare_to_baseline()
+        return self.result
+
+    def compare_to_baseline(self):
+        if not (expected := baseline.get(self.name)):
+            return
+        if self.result.queries > expected.queries:
+            pytest.fail(
+                f"{self.name} issued {self.result.queries} SQL queries, "
+                f"{expected.queries} in the baseline."
+            )
+        if expected.median and self.result.median > expected.median * MAX_SLOWDOWN:
+            pytest.fail(
+                f"{self.name} took {self.result.median * 1000:.3f}ms (median), "
+                f"{expected.median * 1000:.3f}ms in the baseline."
+            )
+
+
+@pytest.fixture(autouse=True)
+def benchmarks_enabled():
+    if not getenv("BENCHMARK"):
+        pytest.skip("Benchmarks are run only if BENCHMARK is set.")
+
+
+@pytest.fixture
+def benchmark(request):
+    return Benchmark(request.node.name)
+
+
+def load_payload(*path: str) -> dict:
+    return json.loads((DATA_DIR.joinpath(*path)).read_text())
+
+
+@pytest.fixture
+def stubbed_services():
+    """Stub the forges, Copr, Testing Farm and Celery, no request leaves the test."""
+    pr = flexmock(
+        head_commit="528b803be6f93e19ca4130bf4976f2800a3004c4",
+        target_branch="main",
+        author="lbarcziova",
+        comment=lambda *args, **kwargs: None,
+        get_comment=lambda comment_id: flexmock(add_reaction=lambda reaction: None),
+    )
+    flexmock(Github, get_repo=lambda full_name_or_id: None)
+    for project_kls in (GithubProject, GitlabProject, PagureProject):
+        flexmock(
+            project_kls,
+            get_file_content=lambda path, ref=None: json.dumps(PACKIT_YAML),
+            get_files=lambda ref=None, filter_regex=None, recursive=False: [
+                "packit.spec",
+                ".packit.yaml",
+            ],
+            get_web_url=lambda: "https://github.com/packit-service/packit",
+            is_private=lambda: False,
+            can_merge_pr=lambda username: True,
+            has_write_access=lambda user: True,
+            get_pr=lambda pr_id: pr,
+            get_sha_from_tag=lambda tag_name: "12345",
+            set_commit_status=lambda *args, **kwargs: None,
+        )
+    flexmock(GithubProject, create_check_run=lambda **kwargs: None)
+    flexmock(LocalProject, refresh_the_arguments=lambda: None)
+
+    flexmock(Client).should_receive("create_from_config_file").and_return(
+        Client(
+            config={
+                "username": "packit",
+                "copr_url": "https://copr.fedorainfracloud.org/",
+            }
+        )
+    )
+    flexmock(CoprHelper).should_receive("get_valid_build_targets").and_return(
+        set(TARGETS)
+    )
+
+    tf_result = load_payload("webhooks", "testing_farm", "results.json")
+    flexmock(TestingFarmClient).should_receive("request").and_return(
+        flexmock(
+            status_code=200,
+            ok=True,
+            content=json.dumps(tf_result).encode(),
+            reason="OK",
+            json=lambda: tf_result,
+        )
+    )
+
+    flexmock(Signature).should_receive("apply_async")
+    flexmock(Celery).should_receive("send_task")
+
+    for namespace in ("github.com/packit-service", "gitlab.com/testing"):
+        AllowlistModel.add_namespace(
+            namespace=namespace, status=AllowlistStatus.approved_manually.value
+        )
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<60} {'calls/s':>9} {'median':>9} {'p90':>9} {'p99':>9} "
+        f"{'queries':>7} {'baseline':>9}"
+    )
+    for name, result in sorted(results.items()):
+        expected = baseline.get(name)
+        change = (
+            f"{(result.median / expected.median - 1) * 100:+.0f}%"
+            if expected and expected.median
+            else "-"
+        )
+        terminalreporter.write_line(
+            f"{name:<60} {result.throughput:>9.1f} "
+            f"{result.median * 1000:>7.3f}ms {result.p90 * 1000:>7.3f}ms "
+            f"{result.p99 * 1000:>7.3f}ms {result.queries:>7} {change:>9}"
+        )
+
+    for line in summary:
+        terminalreporter.write_line(line)
+
+    if getenv("BENCHMARK_SAVE_BASELINE"):
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {
+                    name: asdict(result)
+                    for name, result in sorted({**baseline, **results}.items())
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        terminalreporter.write_line(f"Baseline saved to {BASELINE_PATH}.")
@@ -0,0 +1,51 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import pytest
+from packit.config import JobType
+
+from packit_service.utils import dump_package_config, load_package_config
+from packit_service.worker.handlers import CoprBuildHandler, TestingFarmHandler
+from packit_service.worker.jobs import SteveJobs
+from packit_service.worker.parser import Parser
+from tests_openshift.benchmarks.conftest import load_payload
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        ("webhooks", "github", "pr.json"),
+        ("webhooks", "github", "push_branch.json"),
+        ("webhooks", "github", "pr_comment_copr_build.json"),
+    ],
+    ids=lambda path: "/".join(path),
+)
+def test_process_message(clean_before_and_after, stubbed_services, benchmark, path):
+    event = load_payload(*path)
+
+    benchmark(SteveJobs.process_message, event)
+
+
+@pytest.fixture
+def pr_event(stubbed_services):
+    return Parser.parse_event(load_payload("webhooks", "github", "pr.json"))
+
+
+@pytest.mark.parametrize(
+    "handler_kls, job_type",
+    [(CoprBuildHandler, JobType.copr_build), (TestingFarmHandler, JobType.tests)],
+)
+def test_get_signature(
+    clean_before_and_after, benchmark, pr_event, handler_kls, job_type
+):
+    job = next(
+        job for job in pr_event.packages_config.get_job_views() if job.type == job_type
+    )
+
+    benchmark(handler_kls.get_signature, pr_event, job)
+
+
+def test_load_package_config(clean_before_and_after, benchmark, pr_event):
+    package_config = dump_package_config(pr_event.packages_config)
+
+    benchmark(load_package_config, package_config)
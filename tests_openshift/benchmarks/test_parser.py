@@ -0,0 +1,22 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+import json
+
+import pytest
+
+from packit_service.worker.parser import Parser
+from tests.spellbook import DATA_DIR
+
+PAYLOADS = sorted(
+    path.relative_to(DATA_DIR)
+    for directory in ("webhooks", "fedmsg")
+    for path in (DATA_DIR / directory).rglob("*.json")
+)
+
+
+@pytest.mark.parametrize("path", PAYLOADS, ids=str)
+def test_parse_event(clean_before_and_after, stubbed_services, benchmark, path):
+    event = json.loads((DATA_DIR / path).read_text())
+
+    benchmark(Parser.parse_event, event)
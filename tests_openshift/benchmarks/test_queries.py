@@ -0,0 +1,62 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+from packit_service.models import (
+    AllowlistModel,
+    CoprBuildTargetModel,
+    JobTriggerModel,
+    JobTriggerModelType,
+    PipelineModel,
+    PullRequestModel,
+    TFTTestRunTargetModel,
+)
+from packit_service.service.api.runs import process_runs
+from tests_openshift.conftest import SampleValues
+
+
+def test_copr_build_get_by_build_id(clean_before_and_after, full_database, benchmark):
+    benchmark(
+        CoprBuildTargetModel.get_by_build_id,
+        SampleValues.build_id,
+        SampleValues.target,
+    )
+
+
+def test_copr_build_get_all_by_build_id(
+    clean_before_and_after, full_database, benchmark
+):
+    benchmark(
+        lambda: list(CoprBuildTargetModel.get_all_by_build_id(SampleValues.build_id))
+    )
+
+
+def test_test_run_get_by_pipeline_id(clean_before_and_after, full_database, benchmark):
+    benchmark(TFTTestRunTargetModel.get_by_pipeline_id, SampleValues.pipeline_id)
+
+
+def test_pull_request_get_or_create(clean_before_and_after, full_database, benchmark):
+    benchmark(
+        PullRequestModel.get_or_create,
+        pr_id=SampleValues.pr_id,
+        namespace=SampleValues.repo_namespace,
+        repo_name=SampleValues.repo_name,
+        project_url=SampleValues.project_url,
+    )
+
+
+def test_job_trigger_get_or_create(
+    clean_before_and_after, full_database, pr_model, benchmark
+):
+    benchmark(
+        JobTriggerModel.get_or_create,
+        type=JobTriggerModelType.pull_request,
+        trigger_id=pr_model.id,
+    )
+
+
+def test_allowlist_get_namespace(clean_before_and_after, full_database, benchmark):
+    benchmark(AllowlistModel.get_namespace, SampleValues.account_name)
+
+
+def test_merged_runs(clean_before_and_after, full_database, benchmark):
+    benchmark(lambda: process_runs(PipelineModel.get_merged_chroots(0, 20)))
@@ -0,0 +1,114 @@
+# Copyright Contributors to the Packit project.
+# SPDX-License-Identifier: MIT
+
+"""
+Replay of the recorded production traffic (see `packit_service.event_archive`)
+through `SteveJobs`, to measure the cost of a new version on the real mix
+of the events before deploying it.
+
+The forges, Copr, Testing Farm and Celery are stubbed as in the other
+benchmarks (so every project gets the same package config), any other
+outgoing HTTP request fails the processing of the event.
+
+Set `REPLAY_ARCHIVE` to the archive file or directory (see `make check-replay`)
+and `REPLAY_SPEED` to replay the events at the recorded speed (1),
+N times faster (N) or as fast as possible (0, the default). The latency
+percentiles and the number of the SQL queries are compared to the baseline
+(recorded for the same archive), the CPU time and the memory are reported.
+Set `REPLAY_REPORT` to store the results in a JSON file as well.
+"""
+
+import json
+import resource
+import time
+from collections import Counter
+from os import getenv
+from pathlib import Path
+
+import pytest
+import requests
+from flexmock import flexmock
+from requests.adapters import HTTPAdapter
+
+from packit_service.event_archive import read_event_archive
+from packit_service.query_profiler import profile_queries
+from packit_service.worker.jobs import SteveJobs
+from tests_openshift.benchmarks.conftest import percentile, summary
+
+REPLAY_ARCHIVE = getenv("REPLAY_ARCHIVE")
+REPLAY_SPEED = float(getenv("REPLAY_SPEED", "0"))
+REPLAY_REPORT = getenv("REPLAY_REPORT")
+
+
+@pytest.fixture
+def no_outgoing_requests():
+    def send(*args, **kwargs):
+        raise requests.ConnectionError(
+            "Outgoing requests are not allowed in the replay."
+        )
+
+    flexmock(HTTPAdapter).should_receive("send").replace_with(send)
+
+
+@pytest.mark.skipif(not REPLAY_ARCHIVE, reason="REPLAY_ARCHIVE not set.")
+def test_replay(
+    clean_before_and_after, stubbed_services, no_outgoing_requests, benchmark
+):
+    records = list(read_event_archive(REPLAY_ARCHIVE))
+    if not records:
+        pytest.skip(f"No events recorded in {REPLAY_ARCHIVE}.")
+
+    events, failures = Counter(), Counter()
+    durations = []
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_start = time.process_time()
+    start = time.time()
+    with profile_queries("benchmark", benchmark.name) as profile:
+        for record in records:
+            if REPLAY_SPEED:
+                # keep the recorded intervals between the events
+                offset = (record["time"] - records[0]["time"]) / REPLAY_SPEED
+                time.sleep(max(0.0, start + offset - time.time()))
+
+            events[record["source"]] += 1
+            event_start = time.perf_counter()
+            try:
+                SteveJobs.process_message(record["event"])
+            except Exception as ex:
+                failures[f"{record['source']}: {type(ex).__name__}"] += 1
+            durations.append(time.perf_counter() - event_start)
+    cpu_time = time.process_time() - cpu_start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    durations.sort()
+
+    report = {
+        "archive": REPLAY_ARCHIVE,
+        "speed": REPLAY_SPEED,
+        "events": dict(events),
+        "failures": dict(failures),
+        "cpu_time": cpu_time,
+        # kilobytes on Linux
+        "max_rss": rss_after,
+        "max_rss_growth": rss_after - rss_before,
+        "queries_per_event": profile.count / len(records),
+        "median": percentile(durations, 0.5),
+        "p90": percentile(durations, 0.9),
+        "p99": percentile(durations, 0.99),
+    }
+    summary.extend(
+        [
+            f"replay of {REPLAY_ARCHIVE}: "
+            + ", ".join(f"{count} {source}" for source, count in events.items())
+            + " events",
+            f"  failures: {dict(failures) or 'none'}",
+            f"  CPU time: {cpu_time:.2f}s ({cpu_time / len(records) * 1000:.3f}ms "
+            f"per event), max RSS: {rss_after / 1024:.0f}MiB "
+            f"(+{report['max_rss_growth'] / 1024:.0f}MiB), "
+            f"SQL queries per event: {report['queries_per_event']:.1f}",
+        ]
+    )
+    if REPLAY_REPORT:
+        Path(REPLAY_REPORT).write_text(json.dumps(report, indent=2) + "\n")
+
+    benchmark.record(durations, queries=profile.count)
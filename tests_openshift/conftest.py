@@ -13,14 +13,20 @@ $ alembic upgrade head
 ```
 """
 import datetime
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, List
 
 import pytest
+from sqlalchemy import event
 
 from ogr import GithubService, GitlabService, PagureService
+from packit_service.cache import LocalCache, set_shared_cache
 from packit_service.config import ServiceConfig
 from packit_service.models import (
     CoprBuildTargetModel,
     CoprBuildGroupModel,
+    EventStageTimeModel,
     JobTriggerModel,
     sa_session_transaction,
     SRPMBuildModel,
@@ -38,6 +44,8 @@ from packit_service.models import (
     TFTTestRunGroupModel,
     TestingFarmResult,
     GithubInstallationModel,
+    PackitIssueModel,
+    PullRequestHeadCommitModel,
     ProjectAuthenticationIssueModel,
     SyncReleaseTargetModel,
     SyncReleaseTargetStatus,
@@ -46,6 +54,7 @@ from packit_service.models import (
     SourceGitPRDistGitPRModel,
     BuildStatus,
     SyncReleaseJobType,
+    engine,
 )
 from packit_service.worker.events import InstallationEvent
 
@@ -174,12 +183,51 @@ def clean_db():
 
         session.query(GitBranchModel).delete()
         session.query(ProjectReleaseModel).delete()
+        session.query(PullRequestHeadCommitModel).delete()
         session.query(PullRequestModel).delete()
         session.query(IssueModel).delete()
         session.query(ProjectAuthenticationIssueModel).delete()
+        session.query(PackitIssueModel).delete()
 
         session.query(GitProjectModel).delete()
 
+        session.query(EventStageTimeModel).delete()
+
+
+@pytest.fixture(autouse=True)
+def shared_cache():
+    """Fresh in-memory shared cache for each test instead of Redis."""
+    cache = LocalCache()
+    set_shared_cache(cache)
+    yield cache
+    set_shared_cache(None)
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[List[str]]:
+    """
+    Fail if the code within the context issues more than `max_queries` SQL queries.
+
+    The statements are recorded using the engine events, so that the queries
+    of the API requests, accounted to the profiles of the requests, count too.
+    """
+    statements: List[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert len(statements) <= max_queries, (
+        f"{len(statements)} SQL queries issued, the budget is {max_queries}:\n"
+        + "\n".join(
+            f"{count}x {statement}" for statement, count in Counter(statements).items()
+        )
+    )
+
 
 @pytest.fixture()
 def clean_before_and_after():
@@ -16,6 +16,7 @@ from packit_service.models import (
     TestingFarmResult,
     BuildStatus,
     filter_most_recent_target_names_by_status,
+    get_most_recent_targets_by_commit,
 )
 from packit_service.worker.events import (
     ReleaseEvent,
@@ -502,3 +503,69 @@ def test_filter_failed_models_targets_tf(
 
     most_recent_duplicate = max(test_list[1:3], key=attrgetter("submitted_time"))
     assert most_recent_duplicate.target in filtered_models
+
+
+def test_get_most_recent_targets_by_commit_copr(
+    clean_before_and_after, multiple_copr_builds
+):
+    builds_list = list(
+        CoprBuildTargetModel.get_all_by(
+            project_name=SampleValues.project,
+            commit_sha=SampleValues.ref,
+        )
+    )
+    for build in builds_list:
+        build.set_status(BuildStatus.failure)
+
+    most_recent = get_most_recent_targets_by_commit(
+        model_type=CoprBuildTargetModel,
+        commit_sha=SampleValues.ref,
+        statuses_to_filter_with=[BuildStatus.failure],
+    )
+    expected = filter_most_recent_target_names_by_status(
+        models=builds_list, statuses_to_filter_with=[BuildStatus.failure]
+    )
+    assert {build.target for build in most_recent} == expected
+    assert {build.id for build in most_recent} == {
+        build.id
+        for build in get_most_recent_targets_by_commit(
+            model_type=CoprBuildTargetModel, commit_sha=SampleValues.ref
+        )
+    }
+
+    most_recent_duplicate = max(builds_list[:2], key=attrgetter("build_submitted_time"))
+    most_recent_duplicate.set_status(BuildStatus.success)
+    assert {
+        build.target
+        for build in get_most_recent_targets_by_commit(
+            model_type=CoprBuildTargetModel,
+            commit_sha=SampleValues.ref,
+            statuses_to_filter_with=[BuildStatus.failure],
+        )
+    } == {builds_list[2].target}
+
+
+def test_get_most_recent_targets_by_commit_tf(
+    clean_before_and_after, multiple_new_test_runs
+):
+    test_list = list(
+        TFTTestRunTargetModel.get_all_by_commit_target(
+            commit_sha=SampleValues.commit_sha
+        )
+    )
+    test_list[0].set_status(TestingFarmResult.failed)
+    test_list[1].set_status(TestingFarmResult.error)
+    test_list[2].set_status(TestingFarmResult.failed)
+
+    statuses = [TestingFarmResult.failed, TestingFarmResult.error]
+    most_recent = get_most_recent_targets_by_commit(
+        model_type=TFTTestRunTargetModel,
+        commit_sha=SampleValues.commit_sha,
+        statuses_to_filter_with=statuses,
+    )
+    assert len(most_recent) == 2
+    assert {run.target for run in most_recent} == (
+        filter_most_recent_target_names_by_status(
+            models=test_list, statuses_to_filter_with=statuses
+        )
+    )
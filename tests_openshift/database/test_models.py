@@ -9,12 +9,16 @@ from sqlalchemy.exc import ProgrammingError, IntegrityError
 from packit_service.models import (
     CoprBuildTargetModel,
     CoprBuildGroupModel,
+    EventStage,
+    EventStageTimeModel,
     GitBranchModel,
     GitProjectModel,
     GithubInstallationModel,
     JobTriggerModelType,
     KojiBuildTargetModel,
     KojiBuildGroupModel,
+    PackitIssueModel,
+    PullRequestHeadCommitModel,
     ProjectAuthenticationIssueModel,
     ProjectReleaseModel,
     PullRequestModel,
@@ -33,7 +37,7 @@ from packit_service.models import (
     BuildStatus,
     SyncReleaseJobType,
 )
-from tests_openshift.conftest import SampleValues
+from tests_openshift.conftest import SampleValues, query_budget
 
 
 def test_create_pr_model(clean_before_and_after, pr_model):
@@ -170,6 +174,72 @@ def test_copr_build_set_build_logs_url(clean_before_and_after, a_copr_build_for_
     assert b.build_logs_url == url
 
 
+def test_copr_build_set_next_check_time(clean_before_and_after, a_copr_build_for_pr):
+    next_check_time = datetime.utcnow() + timedelta(minutes=5)
+    a_copr_build_for_pr.set_next_check_time(next_check_time)
+    a_copr_build_for_pr.set_next_check_time(next_check_time)
+    b = CoprBuildTargetModel.get_by_build_id(
+        a_copr_build_for_pr.build_id, SampleValues.target
+    )
+    assert b.next_check_time == next_check_time
+    assert b.check_count == 2
+
+
+def test_copr_build_get_all_by_status_due(clean_before_and_after, a_copr_build_for_pr):
+    now = datetime.utcnow()
+    # without any deadline yet
+    assert list(
+        CoprBuildTargetModel.get_all_by_status(BuildStatus.pending, due_before=now)
+    ) == [a_copr_build_for_pr]
+
+    a_copr_build_for_pr.set_next_check_time(now + timedelta(minutes=5))
+    assert not list(
+        CoprBuildTargetModel.get_all_by_status(BuildStatus.pending, due_before=now)
+    )
+    assert list(
+        CoprBuildTargetModel.get_all_by_status(
+            BuildStatus.pending, due_before=now + timedelta(minutes=10)
+        )
+    ) == [a_copr_build_for_pr]
+
+    # sharded by the Copr build ID (123456)
+    assert list(
+        CoprBuildTargetModel.get_all_by_status(BuildStatus.pending, shard=0, shards=2)
+    ) == [a_copr_build_for_pr]
+    assert not list(
+        CoprBuildTargetModel.get_all_by_status(BuildStatus.pending, shard=1, shards=2)
+    )
+
+
+def test_copr_build_get_recent_durations(clean_before_and_after, a_copr_build_for_pr):
+    submitted_time = a_copr_build_for_pr.build_submitted_time
+    a_copr_build_for_pr.set_end_time(submitted_time + timedelta(minutes=10))
+    assert not CoprBuildTargetModel.get_recent_durations(
+        owner=SampleValues.owner, target=SampleValues.target
+    )
+
+    a_copr_build_for_pr.set_status(BuildStatus.success)
+    assert CoprBuildTargetModel.get_recent_durations(
+        owner=SampleValues.owner,
+        target=SampleValues.target,
+        project_name=SampleValues.project,
+    ) == [600]
+    assert not CoprBuildTargetModel.get_recent_durations(
+        owner=SampleValues.owner, target=SampleValues.different_target
+    )
+
+
+def test_copr_build_get_build_ids_submitted_after(
+    clean_before_and_after, a_copr_build_for_pr
+):
+    submitted_time = a_copr_build_for_pr.build_submitted_time
+    with query_budget(1):
+        assert CoprBuildTargetModel.get_build_ids_submitted_after(
+            submitted_time - timedelta(hours=1)
+        ) == {a_copr_build_for_pr.build_id}
+    assert not CoprBuildTargetModel.get_build_ids_submitted_after(submitted_time)
+
+
 def test_create_koji_build(clean_before_and_after, a_koji_build_for_pr):
     assert a_koji_build_for_pr.build_id == "123456"
     assert a_koji_build_for_pr.commit_sha == "80201a74d96c"
@@ -659,6 +729,31 @@ def test_get_project(clean_before_and_after, a_copr_build_for_pr):
     assert project.project_url == "https://github.com/the-namespace/the-repo-name"
 
 
+def test_get_project_handled_counts(
+    clean_before_and_after,
+    pr_model,
+    different_pr_model,
+    release_model,
+    different_release_model,
+    branch_model,
+):
+    project = GitProjectModel.get_project(
+        "github.com", "the-namespace", "the-repo-name"
+    )
+    assert project.prs_handled == 2
+    assert project.releases_handled == 2
+    assert project.branches_handled == 1
+    assert project.issues_handled == 0
+
+    (project,) = GitProjectModel.get_range(0, 10)
+    assert (
+        project.prs_handled,
+        project.branches_handled,
+        project.releases_handled,
+        project.issues_handled,
+    ) == (2, 1, 2, 0)
+
+
 def test_get_by_forge(clean_before_and_after, multiple_forge_projects):
     projects = list(GitProjectModel.get_by_forge(0, 10, "github.com"))
     assert projects
@@ -800,6 +895,53 @@ def test_project_token_model(clean_before_and_after):
     assert actual.issue_created == expected.issue_created
 
 
+def test_packit_issue_model(clean_before_and_after):
+    project_info = {
+        "namespace": "the-namespace",
+        "repo_name": "repo-name",
+        "project_url": "https://github.com/the-namespace/repo-name",
+    }
+    assert not PackitIssueModel.get_latest(title="Koji build failed", **project_info)
+
+    PackitIssueModel.create(title="Koji build failed", issue_id=1, **project_info)
+    PackitIssueModel.get_latest(title="Koji build failed", **project_info).set_closed()
+    PackitIssueModel.create(title="Koji build failed", issue_id=2, **project_info)
+    PackitIssueModel.create(title="Bodhi update failed", issue_id=3, **project_info)
+
+    latest = PackitIssueModel.get_latest(title="Koji build failed", **project_info)
+    assert latest.issue_id == 2
+    assert not latest.closed
+    assert {issue.issue_id for issue in PackitIssueModel.get_all_open()} == {2, 3}
+
+
+def test_pull_request_head_commit_model(clean_before_and_after):
+    project_info = {
+        "namespace": "rpms",
+        "repo_name": "packit",
+        "project_url": "https://src.fedoraproject.org/rpms/packit",
+    }
+    assert not PullRequestHeadCommitModel.get_pr_id(commit_sha="abcdef", **project_info)
+
+    PullRequestHeadCommitModel.add(pr_id=1, commit_sha="abcdef", **project_info)
+    PullRequestHeadCommitModel.add(pr_id=1, commit_sha="abcdef", **project_info)
+    PullRequestHeadCommitModel.add(pr_id=2, commit_sha="123456", **project_info)
+    PullRequestHeadCommitModel.add(
+        pr_id=3,
+        commit_sha="abcdef",
+        namespace="rpms",
+        repo_name="ogr",
+        project_url="https://src.fedoraproject.org/rpms/ogr",
+    )
+
+    assert (
+        PullRequestHeadCommitModel.get_pr_id(commit_sha="abcdef", **project_info) == 1
+    )
+    assert (
+        PullRequestHeadCommitModel.get_pr_id(commit_sha="123456", **project_info) == 2
+    )
+    assert Session().query(PullRequestHeadCommitModel).count() == 3
+
+
 def test_merged_runs(clean_before_and_after, few_runs):
     for i, run_id in enumerate(few_runs, 1):
         merged_run = PipelineModel.get_merged_run(run_id)
@@ -1009,3 +1151,73 @@ def test_get_by_dist_git_id(
     assert SourceGitPRDistGitPRModel.get_by_dist_git_id(
         source_git_dist_git_pr_new_relationship.dist_git_pull_request_id
     )
+
+
+def test_event_stage_percentiles(clean_before_and_after):
+    received = datetime(2022, 1, 1)
+    for trace_id, seconds in (("a", 1), ("b", 2), ("c", 3)):
+        EventStageTimeModel.add(
+            trace_id,
+            {
+                EventStage.received: received,
+                EventStage.first_status: received + timedelta(seconds=seconds),
+            },
+        )
+    # the first one counts for a stage reached more times
+    EventStageTimeModel.add(
+        "c", {EventStage.first_status: received + timedelta(seconds=10)}
+    )
+
+    percentiles = EventStageTimeModel.get_percentiles(percentiles=(0.5, 1))
+
+    assert percentiles[EventStage.received] == {"count": 3, "p50": 0, "p100": 0}
+    assert percentiles[EventStage.first_status] == {
+        "count": 3,
+        "p50": 2,
+        "p100": 3,
+    }
+    assert not EventStageTimeModel.get_percentiles(
+        datetime_to=received - timedelta(days=1)
+    )
+
+
+def test_event_stage_percentiles_time_range(clean_before_and_after):
+    received = datetime(2022, 1, 1)
+    EventStageTimeModel.add(
+        "before",
+        {
+            EventStage.received: received - timedelta(days=1),
+            EventStage.finished: received + timedelta(seconds=5),
+        },
+    )
+    EventStageTimeModel.add(
+        "within",
+        {
+            EventStage.received: received,
+            EventStage.finished: received + timedelta(days=2),
+        },
+    )
+    # the stages of an event without the receipt recorded are not included
+    EventStageTimeModel.add(
+        "not-received", {EventStage.finished: received + timedelta(seconds=1)}
+    )
+
+    percentiles = EventStageTimeModel.get_percentiles(
+        percentiles=(1,),
+        datetime_from=received - timedelta(hours=1),
+        datetime_to=received + timedelta(days=1),
+    )
+
+    assert percentiles == {
+        EventStage.received: {"count": 1, "p100": 0},
+        EventStage.finished: {"count": 1, "p100": timedelta(days=2).total_seconds()},
+    }
+
+
+def test_event_stage_times_delete_older_than(clean_before_and_after):
+    now = datetime.utcnow()
+    EventStageTimeModel.add("old", {EventStage.received: now - timedelta(days=31)})
+    EventStageTimeModel.add("new", {EventStage.received: now - timedelta(days=1)})
+
+    assert EventStageTimeModel.delete_older_than(timedelta(days=30)) == 1
+    assert EventStageTimeModel.get_percentiles()[EventStage.received]["count"] == 1
@@ -1,17 +1,21 @@
 # Copyright Contributors to the Packit project.
 # SPDX-License-Identifier: MIT
+from datetime import datetime, timedelta
+
 import pytest
 from flask import url_for
 from packit.utils import nested_get
 
 from packit_service.models import (
+    EventStage,
+    EventStageTimeModel,
     TestingFarmResult,
     PipelineModel,
     SyncReleaseStatus,
     SyncReleaseTargetStatus,
 )
 from packit_service.service.api.runs import process_runs
-from tests_openshift.conftest import SampleValues
+from tests_openshift.conftest import SampleValues, query_budget
 
 
 # Check if the API is working
@@ -50,6 +54,17 @@ def test_copr_builds_list(client, clean_before_and_after, multiple_copr_builds):
     }
 
 
+def test_copr_builds_list_query_count(
+    client, clean_before_and_after, too_many_copr_builds
+):
+    # the whole page is obtained by a single query, no lookups per build
+    with query_budget(1):
+        response = client.get(
+            url_for("api.copr-builds_copr_builds_list") + "?page=1&per_page=30"
+        )
+    assert len(response.json) == 30
+
+
 #  Test Copr Builds with status waiting_for_srpm
 def test_copr_builds_list_waiting_for_srpm(
     client, clean_before_and_after, a_copr_build_waiting_for_srpm
@@ -671,6 +686,25 @@ def test_usage_info_datetime(client, clean_before_and_after, full_database):
     assert response_dict["active_projects"]["project_count"] == 0
 
 
+def test_latency(client, clean_before_and_after):
+    received = datetime(2022, 1, 1)
+    EventStageTimeModel.add(
+        "trace",
+        {
+            EventStage.received: received,
+            EventStage.reported: received + timedelta(minutes=5),
+        },
+    )
+
+    response = client.get(url_for("api.latency_latency") + "?from=2021-12-31")
+
+    assert response.json["reported"]["count"] == 1
+    assert response.json["reported"]["p50"] == 300
+
+    # only the recent events by default
+    assert not client.get(url_for("api.latency_latency")).json
+
+
 def test_usage_info_top(client, clean_before_and_after, full_database):
     response = client.get(url_for("api.usage_usage") + "?top=0")
     response_dict = response.json